@@ -31,20 +31,49 @@ class ApplicationController {
 
   async searchJobs(req, res) {
     try {
-      const { keywords, location, platforms } = req.body;
+      const { keywords, location, platforms, since } = req.body;
       
       if (!keywords || !location) {
         return res.status(400).json({ error: 'Keywords and location are required' });
       }
 
+      // Incremental clients send the time of their last run (epoch ms) so the
+      // boards only return postings from after it
+      const options = {};
+      if (since !== undefined && since !== null) {
+        const sinceMs = Number(since);
+        if (!Number.isFinite(sinceMs) || sinceMs <= 0) {
+          return res.status(400).json({ error: 'since must be a timestamp in milliseconds' });
+        }
+        options.since = sinceMs;
+      }
+
       const allJobs = [];
+      // Boards whose scraper failed. Clients treat a search as complete only
+      // when it reports no errors, so a failed board is searched again next run
+      const errors = {};
+      // NDJSON clients get each platform's jobs as soon as it has been scraped
+      const streaming = req.accepts(['application/json', 'application/x-ndjson']) === 'application/x-ndjson';
+      const collect = (jobs) => {
+        if (streaming) {
+          if (!res.headersSent) {
+            res.status(200).type('application/x-ndjson');
+          }
+          jobs.forEach((job) => res.write(JSON.stringify(job) + '\n'));
+        } else {
+          allJobs.push(...jobs);
+        }
+      };
       
       // Search LinkedIn
       if (!platforms || platforms.includes('linkedin')) {
         const linkedinScraper = new LinkedInScraper();
         await linkedinScraper.initialize();
-        const linkedinJobs = await linkedinScraper.searchJobs(keywords, location);
-        allJobs.push(...linkedinJobs);
+        const linkedinJobs = await linkedinScraper.searchJobs(keywords, location, options);
+        if (linkedinScraper.lastError) {
+          errors.linkedin = linkedinScraper.lastError;
+        }
+        collect(linkedinJobs);
         await linkedinScraper.close();
       }
       
@@ -52,18 +81,36 @@ class ApplicationController {
       if (!platforms || platforms.includes('indeed')) {
         const indeedScraper = new IndeedScraper();
         await indeedScraper.initialize();
-        const indeedJobs = await indeedScraper.searchJobs(keywords, location);
-        allJobs.push(...indeedJobs);
+        const indeedJobs = await indeedScraper.searchJobs(keywords, location, options);
+        if (indeedScraper.lastError) {
+          errors.indeed = indeedScraper.lastError;
+        }
+        collect(indeedJobs);
         await indeedScraper.close();
       }
       
+      if (streaming) {
+        if (!res.headersSent) {
+          res.status(200).type('application/x-ndjson');
+        }
+        // The last line tells the client the stream is complete
+        res.write(JSON.stringify({ _end: true, errors }) + '\n');
+        return res.end();
+      }
+      
       res.json({
         success: true,
         count: allJobs.length,
-        jobs: allJobs
+        jobs: allJobs,
+        errors
       });
     } catch (error) {
       console.error('Search error:', error);
+      if (res.headersSent) {
+        // Mid-stream: end with an error trailer rather than a clean-looking end
+        res.write(JSON.stringify({ _end: true, errors: { search: error.message } }) + '\n');
+        return res.end();
+      }
       res.status(500).json({ error: error.message });
     }
   }
@@ -94,17 +141,20 @@ class ApplicationController {
           continue;
         }
         
+        // The CLI prepares a tailored letter per job; the request-wide one is the fallback
+        const letter = job.coverLetter || coverLetter;
+        
         // Apply based on platform
         let result;
         if (job.platform === 'LinkedIn') {
           const scraper = new LinkedInScraper();
           await scraper.initialize();
-          result = await scraper.applyToJob(job.url, resumePath, coverLetter);
+          result = await scraper.applyToJob(job.url, resumePath, letter);
           await scraper.close();
         } else if (job.platform === 'Indeed') {
           const scraper = new IndeedScraper();
           await scraper.initialize();
-          result = await scraper.applyToJob(job.url, resumePath, coverLetter);
+          result = await scraper.applyToJob(job.url, resumePath, letter);
           await scraper.close();
         }
         
@@ -4,6 +4,8 @@ class IndeedScraper {
   constructor() {
     this.browser = null;
     this.page = null;
+    // Message of the last failed search; searchJobs itself returns [] on failure
+    this.lastError = null;
   }
 
   async initialize() {
@@ -28,9 +30,15 @@ class IndeedScraper {
     await this.page.setViewport({ width: 1920, height: 1080 });
   }
 
-  async searchJobs(keywords, location) {
+  async searchJobs(keywords, location, options = {}) {
+    this.lastError = null;
     try {
-      const searchUrl = `https://www.indeed.com/jobs?q=${encodeURIComponent(keywords)}&l=${encodeURIComponent(location)}`;
+      let searchUrl = `https://www.indeed.com/jobs?q=${encodeURIComponent(keywords)}&l=${encodeURIComponent(location)}`;
+      if (options.since) {
+        // fromage only takes whole days, so round up and let the client drop repeats
+        const days = Math.max(1, Math.ceil((Date.now() - options.since) / 86400000));
+        searchUrl += `&fromage=${days}`;
+      }
       await this.page.goto(searchUrl, { waitUntil: 'networkidle2', timeout: 30000 });
       
       await this.randomDelay(2000, 4000);
@@ -64,6 +72,7 @@ class IndeedScraper {
       return jobs;
     } catch (error) {
       console.error('Indeed scraping error:', error.message);
+      this.lastError = error.message;
       return [];
     }
   }
@@ -4,6 +4,8 @@ class LinkedInScraper {
   constructor() {
     this.browser = null;
     this.page = null;
+    // Message of the last failed search; searchJobs itself returns [] on failure
+    this.lastError = null;
   }
 
   async initialize() {
@@ -30,9 +32,15 @@ class LinkedInScraper {
     await this.page.setViewport({ width: 1920, height: 1080 });
   }
 
-  async searchJobs(keywords, location) {
+  async searchJobs(keywords, location, options = {}) {
+    this.lastError = null;
     try {
-      const searchUrl = `https://www.linkedin.com/jobs/search/?keywords=${encodeURIComponent(keywords)}&location=${encodeURIComponent(location)}`;
+      let searchUrl = `https://www.linkedin.com/jobs/search/?keywords=${encodeURIComponent(keywords)}&location=${encodeURIComponent(location)}`;
+      if (options.since) {
+        // f_TPR=r<seconds> limits results to postings from the last N seconds
+        const seconds = Math.max(60, Math.ceil((Date.now() - options.since) / 1000));
+        searchUrl += `&f_TPR=r${seconds}`;
+      }
       await this.page.goto(searchUrl, { waitUntil: 'networkidle2', timeout: 30000 });
       
       // Random delay to mimic human behavior
@@ -68,6 +76,7 @@ class LinkedInScraper {
       return jobs;
     } catch (error) {
       console.error('LinkedIn scraping error:', error.message);
+      this.lastError = error.message;
       return [];
     }
   }
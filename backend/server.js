@@ -42,6 +42,18 @@ app.get('/api/monitor/watch', (req, res) => {
   }
 });
 
+app.post('/api/monitor/watch/batch', (req, res) => {
+  try {
+    const { added, removed } = jobMonitor.syncWatchCriteria({
+      add: req.body.add || [],
+      remove: (req.body.remove || []).map(id => parseFloat(id))
+    });
+    res.json({ success: true, added, removed });
+  } catch (error) {
+    res.status(500).json({ error: error.message });
+  }
+});
+
 app.delete('/api/monitor/watch/:id', (req, res) => {
   try {
     jobMonitor.removeWatchCriteria(parseFloat(req.params.id));
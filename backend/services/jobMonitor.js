@@ -64,8 +64,8 @@ class JobMonitor {
     }
   }
 
-  addWatchCriteria(criteria) {
-    const watchItem = {
+  buildWatchItem(criteria) {
+    return {
       id: Date.now() + Math.random(),
       keywords: criteria.keywords,
       location: criteria.location,
@@ -80,6 +80,10 @@ class JobMonitor {
       createdAt: new Date().toISOString(),
       enabled: true
     };
+  }
+
+  addWatchCriteria(criteria) {
+    const watchItem = this.buildWatchItem(criteria);
 
     this.watchList.push(watchItem);
     this.saveWatchList();
@@ -88,6 +92,21 @@ class JobMonitor {
     return watchItem;
   }
 
+  // Apply many adds and removes with a single write of the watch list
+  syncWatchCriteria({ add = [], remove = [] }) {
+    const removeIds = new Set(remove);
+    const before = this.watchList.length;
+    this.watchList = this.watchList.filter(item => !removeIds.has(item.id));
+    const removed = before - this.watchList.length;
+
+    const added = add.map(criteria => this.buildWatchItem(criteria));
+    this.watchList.push(...added);
+    this.saveWatchList();
+
+    console.log(`Synced watch criteria: ${added.length} added, ${removed} removed`);
+    return { added, removed };
+  }
+
   removeWatchCriteria(id) {
     this.watchList = this.watchList.filter(item => item.id !== id);
     this.saveWatchList();
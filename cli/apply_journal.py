@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Apply Journal
+Append-only record of per-job apply state so interrupted runs can resume
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from state_file import FileLock
+from tracing import traced
+
+DEFAULT_JOURNAL_PATH = Path.home() / ".job-bot-apply-journal.jsonl"
+
+# States after which a job must never be sent again
+FINISHED_STATES = ("success", "skipped")
+
+# Result status of a job whose request may have been processed without an
+# answer (read timeout, dropped connection, 5xx); it stays in-flight
+UNKNOWN = "unknown"
+
+
+class ApplyJournal:
+    """Write-ahead log for one apply run, one JSON record per line.
+
+    A run starts with a header holding the request payload and a `queued`
+    record (with the full job) per job. Each chunk is marked `in-flight`
+    and fsync'd *before* it is sent; results are appended as `success`,
+    `skipped` or `failed` and fsync'd in batches of `sync_every` records.
+    A job left in-flight means the process died with its request
+    outstanding (or before its result was synced), or the request ended
+    without a definite answer; resume treats it as "maybe sent" and never
+    re-sends it.
+
+    A run holds the journal's lock from `lock()` until `close()`, so two
+    concurrent apply runs can never interleave or truncate each other.
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH, sync_every=50):
+        self.path = Path(path)
+        self.sync_every = sync_every
+        self._file = None
+        self._unsynced = 0
+        self._lock = FileLock(self.path)
+
+    def lock(self):
+        """Claim the journal; raises RuntimeError while another run holds it"""
+        try:
+            self._lock.acquire(blocking=False)
+        except BlockingIOError:
+            raise RuntimeError("Another apply run is in progress")
+
+    def start_run(self, jobs, payload):
+        """Begin a new run, replacing the previous journal"""
+        self._file = open(self.path, "w")
+        self._write({"run": time.time(), "payload": payload})
+        for job in jobs:
+            self._write({"id": job["id"], "state": "queued", "job": job})
+        self.sync()
+
+    def resume_run(self):
+        """Keep appending to the journal of an interrupted run"""
+        self._file = open(self.path, "a")
+
+    def record(self, job_ids, state, message=None, sync=False):
+        for jid in job_ids:
+            entry = {"id": jid, "state": state}
+            if message:
+                entry["message"] = message
+            self._write(entry)
+        if sync or self._unsynced >= self.sync_every:
+            self.sync()
+
+    def record_results(self, jobs, results):
+        """Record per-job outcomes; results come back in request order"""
+        for job, result in zip(jobs, results):
+            status = result.get("status", "failed")
+            if status != UNKNOWN:
+                self.record([job["id"]], status, result.get("message"))
+        missing = [job["id"] for job in jobs[len(results):]]
+        if missing:
+            self.record(missing, "failed", "No result returned")
+
+    @traced("journal.sync", "persist")
+    def sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        if self._file is not None and not self._file.closed:
+            self.sync()
+            self._file.close()
+        self._lock.release()
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry) + "\n")
+        self._unsynced += 1
+
+
+class JournalState:
+    """A journal replayed into the last known state of every job"""
+
+    def __init__(self):
+        self.payload = {}
+        self.jobs = {}
+        self.states = {}
+
+    def _jobs_in(self, predicate):
+        return [job for jid, job in self.jobs.items() if predicate(self.states.get(jid))]
+
+    def finished(self):
+        return self._jobs_in(lambda state: state in FINISHED_STATES)
+
+    def in_flight(self):
+        """Jobs that were sent but whose result was never recorded"""
+        return self._jobs_in(lambda state: state == "in-flight")
+
+    def pending(self):
+        """Jobs that were never sent, or whose send failed"""
+        return self._jobs_in(lambda state: state in ("queued", "failed"))
+
+
+def replay(path=DEFAULT_JOURNAL_PATH):
+    """Rebuild the state of the journaled run, or None if there is none"""
+    try:
+        with open(path) as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return None
+
+    state = JournalState()
+    for number, line in enumerate(lines, 1):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            if number == len(lines):
+                break  # torn final write from a crash
+            raise
+        if "run" in entry:
+            state.payload = entry.get("payload", {})
+        else:
+            if "job" in entry:
+                state.jobs[entry["id"]] = entry["job"]
+            state.states[entry["id"]] = entry["state"]
+    return state if state.jobs else None
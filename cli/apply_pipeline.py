@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Batched Apply Pipeline
+Splits a large apply into chunks and keeps a bounded number in flight
+"""
+
+import asyncio
+
+from apply_journal import UNKNOWN
+from http_client import SAFE_RETRY_STATUSES, request_not_sent
+from request_pool import RequestPool
+from tracing import decode
+
+
+def chunked(items, size):
+    """Split a list into consecutive chunks of at most `size` items"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def failed_results(jobs, message, maybe_sent=False):
+    """Build result rows for jobs whose chunk never got per-job results.
+
+    With `maybe_sent` they are `unknown` instead of `failed`: the backend
+    may have applied, so they must not be sent again automatically.
+    """
+    return [
+        {
+            "job": job.get("title", "N/A"),
+            "company": job.get("company", "N/A"),
+            "status": UNKNOWN if maybe_sent else "failed",
+            "message": message,
+        }
+        for job in jobs
+    ]
+
+
+def unanswered_results(jobs, response=None, error=None):
+    """Result rows for a request that failed with `response` or raised `error`"""
+    if error is not None:
+        return failed_results(jobs, str(error), maybe_sent=not request_not_sent(error))
+    status = response.status_code
+    # 4xx, 429 and 503 mean the backend refused the request as a whole;
+    # any other 5xx may come after some of its jobs were applied
+    refused = status in SAFE_RETRY_STATUSES or 400 <= status < 500
+    return failed_results(jobs, f"HTTP {status}", maybe_sent=not refused)
+
+
+async def apply_in_chunks(client, jobs, payload, chunk_size=10, concurrency=3,
+                          on_chunk=None, on_send=None):
+    """Post `jobs` to /api/jobs/apply in chunks, `concurrency` chunks at a time.
+
+    `on_send(index, chunk)` runs right before a chunk is posted, and
+    `on_chunk(index, chunk, results, ok)` as soon as it finishes, in
+    completion order. A failing chunk never aborts the run: its jobs are
+    reported as failed (or unknown, if they may have been applied) so
+    partial progress is kept.
+    """
+    async def run_chunk(pool, index, chunk):
+        async with pool.slot():
+            body = dict(payload, jobs=chunk)
+            if on_send:
+                on_send(index, chunk)
+            try:
+                response = await pool.run(client.post, "/api/jobs/apply", json=body)
+                if response.status_code == 200:
+                    results, ok = decode(response).get("results", []), True
+                else:
+                    results, ok = unanswered_results(chunk, response=response), False
+            except Exception as e:
+                results, ok = unanswered_results(chunk, error=e), False
+        if on_chunk:
+            on_chunk(index, chunk, results, ok)
+        return results
+
+    all_results = []
+    async with RequestPool(concurrency) as pool:
+        tasks = [run_chunk(pool, i, chunk) for i, chunk in enumerate(chunked(jobs, chunk_size))]
+        for finished in asyncio.as_completed(tasks):
+            all_results.extend(await finished)
+    return all_results
+
+
+def run_apply_pipeline(client, jobs, payload, chunk_size=10, concurrency=3,
+                       on_chunk=None, on_send=None):
+    """Blocking wrapper around apply_in_chunks for the synchronous CLI"""
+    return asyncio.run(
+        apply_in_chunks(client, jobs, payload, chunk_size, concurrency, on_chunk, on_send)
+    )
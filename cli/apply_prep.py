@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Apply Preparation
+Tailored cover letters for each job, built across CPU cores before apply
+"""
+
+import os
+import string
+from concurrent.futures import ProcessPoolExecutor
+
+from tracing import traced
+
+DEFAULT_COVER_LETTER = """Dear {company} hiring team,
+
+I am excited to apply for the {title} position ({location}). My background in
+{skills} matches what you are looking for, and I would welcome the chance to
+bring it to {company}.
+
+Thank you for your time and consideration."""
+
+# Job fields searched for the configured skills and keywords
+MATCH_FIELDS = ("title", "company", "location", "description", "snippet", "summary")
+
+# Template errors: bad syntax, or a placeholder the job's values cannot fill
+TEMPLATE_ERRORS = (ValueError, IndexError, KeyError, AttributeError, TypeError)
+
+# Below this many jobs, starting worker processes costs more than it saves
+PARALLEL_THRESHOLD = 1000
+
+
+class _Fields(dict):
+    """Template fields; unknown placeholders render empty instead of failing"""
+
+    def __missing__(self, key):
+        return ""
+
+
+def load_template(value):
+    """Cover letter template from the config: a file path, inline text, or the default"""
+    if not value:
+        return DEFAULT_COVER_LETTER
+    path = os.path.expanduser(value)
+    if os.path.isfile(path):
+        with open(path) as f:
+            return f.read()
+    return value
+
+
+def check_template(template):
+    """Raise ValueError unless every placeholder is a plain field name like {company}"""
+    try:
+        for _, name, spec, _ in string.Formatter().parse(template):
+            if name is not None and not name.isidentifier():
+                raise ValueError(f"{{{name}}} is not a job field name")
+            if spec and "{" in spec:
+                raise ValueError(f"nested placeholder in {{{name}:{spec}}}")
+        template.format_map(_Fields())
+    except TEMPLATE_ERRORS as e:
+        raise ValueError(f"Invalid cover letter template: {e}")
+
+
+def build_context(config):
+    """Everything a worker needs to prepare any job of the run, built once.
+
+    Raises ValueError if the cover letter template cannot be formatted.
+    """
+    template = load_template(config.get("cover_letter_template"))
+    check_template(template)
+
+    rules = config.get("filters") or {}
+    terms = list(config.get("skills") or [])
+    terms += rules.get("include") or []
+    terms += list(rules.get("boost") or {})
+    return {
+        "template": template,
+        "terms": terms,
+        "keywords": config.get("keywords", ""),
+    }
+
+
+def prepare_job(job, context, matcher):
+    """Request fields for one job: its cover letter, naming the skills it mentions.
+
+    Raises ValueError if a format spec in the template does not suit the
+    job's value, e.g. {salary:s} on a salary given as a number.
+    """
+    text = " | ".join(str(job.get(field) or "") for field in MATCH_FIELDS)
+    matched = sorted(matcher.find(text))
+    fields = _Fields(job)
+    fields["skills"] = ", ".join(matched) or context["keywords"]
+    try:
+        letter = context["template"].format_map(fields)
+    except TEMPLATE_ERRORS as e:
+        raise ValueError(f"Invalid cover letter template for {job.get('title')!r}: {e}")
+    return {"coverLetter": letter.strip()}
+
+
+# Per-process state, set once by the pool initializer instead of per task
+_context = None
+_matcher = None
+
+
+def _init_worker(context):
+    global _context, _matcher
+    from job_filter import KeywordMatcher
+
+    _context = context
+    _matcher = KeywordMatcher(context["terms"])
+
+
+def _prepare(job):
+    return prepare_job(job, _context, _matcher)
+
+
+@traced("apply.prepare", "cpu")
+def prepare_payloads(jobs, context, workers=0):
+    """Prepared fields for every job, in order.
+
+    `workers` processes share the work (0 means one per CPU core); short
+    lists are prepared in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < PARALLEL_THRESHOLD:
+        _init_worker(context)
+        return [_prepare(job) for job in jobs]
+
+    workers = min(workers, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(context,)) as pool:
+        # A few chunks per worker keeps them busy without a round trip per job
+        chunksize = max(1, len(jobs) // (workers * 4))
+        return list(pool.map(_prepare, jobs, chunksize=chunksize))
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Apply Scheduler
+Paces applications per platform and enforces the daily limit across runs
+"""
+
+import json
+import time
+from collections import deque
+from datetime import date
+
+from apply_journal import UNKNOWN
+from state_file import FileLock
+
+# Queue row states; a row is claimed as in-flight, in its own transaction,
+# before its job is sent
+QUEUED = "queued"
+IN_FLIGHT = "in-flight"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS apply_quota (
+    day TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS apply_queue (
+    job_id TEXT PRIMARY KEY,
+    platform TEXT,
+    data TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued'
+);
+CREATE INDEX IF NOT EXISTS idx_apply_queue_enqueued_at ON apply_queue(enqueued_at);
+
+CREATE TABLE IF NOT EXISTS apply_buckets (
+    platform TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+COUNT_APPLIED = """
+INSERT INTO apply_quota (day, count) VALUES (?, ?)
+ON CONFLICT(day) DO UPDATE SET count = count + excluded.count
+"""
+
+
+class TokenBucket:
+    """Allows `rate_per_minute` requests on average with bursts of `capacity`"""
+
+    def __init__(self, rate_per_minute, capacity=1, clock=time.time,
+                 tokens=None, updated=None):
+        if not rate_per_minute > 0:
+            raise ValueError(f"Apply rate must be above 0 per minute, not {rate_per_minute!r}")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity if tokens is None else tokens)
+        self.clock = clock
+        self.updated = clock() if updated is None else updated
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self):
+        """Seconds until a token is available"""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        self._refill()
+        self.tokens -= 1
+
+
+class ApplyScheduler:
+    """Persistent apply queue drained through per-platform token buckets.
+
+    A drain holds the lock on `lock_path` (JobBot uses the apply journal's,
+    so a drain never overlaps another drain or an apply run).
+    """
+
+    def __init__(self, conn, daily_limit, rate_per_minute=6, burst=3,
+                 platform_rates=None, sleep=time.sleep, lock_path=None):
+        self.conn = conn
+        self.daily_limit = daily_limit
+        self.rate_per_minute = rate_per_minute
+        self.burst = burst
+        self.platform_rates = {k.lower(): v for k, v in (platform_rates or {}).items()}
+        self.sleep = sleep
+        self.buckets = {}
+        self._lock = FileLock(lock_path) if lock_path else None
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(apply_queue)")}
+        if "state" not in columns:
+            # Queues from before jobs were claimed while being sent
+            with self.conn:
+                self.conn.execute(
+                    "ALTER TABLE apply_queue ADD COLUMN state TEXT NOT NULL DEFAULT 'queued'"
+                )
+
+    def bucket(self, platform):
+        """Token bucket for a platform, resumed from the previous run"""
+        platform = (platform or "").lower()
+        if platform not in self.buckets:
+            rate = self.platform_rates.get(platform, self.rate_per_minute)
+            row = self.conn.execute(
+                "SELECT tokens, updated FROM apply_buckets WHERE platform = ?", (platform,)
+            ).fetchone()
+            tokens, updated = row if row else (None, None)
+            self.buckets[platform] = TokenBucket(rate, self.burst, tokens=tokens, updated=updated)
+        return self.buckets[platform]
+
+    def save_bucket(self, platform):
+        bucket = self.bucket(platform)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO apply_buckets (platform, tokens, updated) VALUES (?, ?, ?)",
+                (platform, bucket.tokens, bucket.updated),
+            )
+
+    def used_today(self):
+        row = self.conn.execute(
+            "SELECT count FROM apply_quota WHERE day = ?", (date.today().isoformat(),)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def remaining_today(self):
+        return max(0, self.daily_limit - self.used_today())
+
+    def record_applied(self, count):
+        """Add submitted applications to today's counter"""
+        with self.conn:
+            self.conn.execute(COUNT_APPLIED, (date.today().isoformat(), count))
+
+    def enqueue(self, jobs, requeue=False):
+        """Queue jobs (which carry an `id`) for later; returns how many were new.
+
+        Jobs left in-flight by an earlier drain are only queued again with
+        `requeue`, i.e. when the user picked them explicitly.
+        """
+        now = time.time()
+        with self.conn:
+            before = self.pending_count()
+            if requeue:
+                self.conn.executemany(
+                    "UPDATE apply_queue SET state = ? WHERE job_id = ? AND state = ?",
+                    [(QUEUED, job["id"], IN_FLIGHT) for job in jobs],
+                )
+            self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO apply_queue (job_id, platform, data, enqueued_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(job["id"], job.get("platform"), json.dumps(job), now) for job in jobs],
+            )
+        return self.pending_count() - before
+
+    def pending_count(self):
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM apply_queue WHERE state = ?", (QUEUED,)
+        ).fetchone()[0]
+
+    def in_flight_ids(self):
+        """Jobs a drain sent without learning the outcome; they are never re-sent"""
+        return [row[0] for row in self.conn.execute(
+            "SELECT job_id FROM apply_queue WHERE state = ? ORDER BY enqueued_at, rowid",
+            (IN_FLIGHT,),
+        )]
+
+    def _set_state(self, job_id, state):
+        with self.conn:
+            self.conn.execute("UPDATE apply_queue SET state = ? WHERE job_id = ?", (state, job_id))
+
+    def drain(self, send, on_result=None, max_jobs=None):
+        """Apply queued jobs one at a time at the highest allowed pace.
+
+        `send(job)` returns None when the job should stay queued (backend
+        unreachable, throttling or failing), else `(result, applied)`, where
+        `applied` says whether the backend processed the application and it
+        counts toward today's quota. Stops at the first None or `unknown`
+        result, or when the queue is empty, today's quota is used up, or
+        `max_jobs` have been sent.
+
+        Each job is claimed as in-flight before `send` and only leaves the
+        queue with its result, so a job whose outcome is unknown, or that
+        was being sent when the process died, stays in-flight and is not
+        sent again. Raises RuntimeError while another drain or apply run
+        holds the lock.
+        """
+        if self._lock is not None:
+            try:
+                self._lock.acquire(blocking=False)
+            except BlockingIOError:
+                raise RuntimeError("Another apply run is in progress")
+        try:
+            return self._drain(send, on_result, max_jobs)
+        finally:
+            if self._lock is not None:
+                self._lock.release()
+
+    def _drain(self, send, on_result, max_jobs):
+        budget = self.remaining_today()
+        if max_jobs is not None:
+            budget = min(budget, max_jobs)
+        rows = self.conn.execute(
+            "SELECT data FROM apply_queue WHERE state = ? ORDER BY enqueued_at, rowid LIMIT ?",
+            (QUEUED, budget),
+        )
+        pending = {}
+        for row in rows:
+            job = json.loads(row[0])
+            pending.setdefault((job.get("platform") or "").lower(), deque()).append(job)
+
+        sent = 0
+        while pending:
+            # Serve whichever platform gets a token first
+            platform = min(pending, key=lambda p: self.bucket(p).wait_time())
+            wait = self.bucket(platform).wait_time()
+            if wait > 0:
+                self.sleep(wait)
+            self.bucket(platform).take()
+            self.save_bucket(platform)
+
+            job = pending[platform].popleft()
+            if not pending[platform]:
+                del pending[platform]
+
+            self._set_state(job["id"], IN_FLIGHT)
+            outcome = send(job)
+            if outcome is None:
+                # Nothing was sent: keep this job and the rest queued for the next run
+                self._set_state(job["id"], QUEUED)
+                break
+            result, applied = outcome
+            sent += 1
+            if result.get("status") == UNKNOWN:
+                # The job may have been applied, so it stays in-flight and is
+                # never re-sent; the backend stopped answering, so stop here
+                if on_result:
+                    on_result(job, result)
+                break
+            with self.conn:
+                self.conn.execute("DELETE FROM apply_queue WHERE job_id = ?", (job["id"],))
+                if applied:
+                    self.conn.execute(COUNT_APPLIED, (date.today().isoformat(), 1))
+            if on_result:
+                on_result(job, result)
+        return sent
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Apply Statistics
+Daily rollups of apply outcomes, kept up to date as results come in
+"""
+
+import re
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+from tracing import traced
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS apply_rollups (
+    dimension TEXT NOT NULL,
+    day TEXT NOT NULL,
+    value TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (dimension, day, value, status)
+) WITHOUT ROWID;
+"""
+
+# Ways a breakdown can be grouped; day and status come from the "total" rollup
+GROUPINGS = ("platform", "company", "day", "status")
+
+# Every outcome is counted once per rollup
+_ROLLUPS = ("total", "platform", "company")
+
+_since = re.compile(r"^(\d+)\s*([dw])$")
+
+
+def parse_since(value, today=None):
+    """First day covered by a `--since` value: 7d, 2w, today or YYYY-MM-DD"""
+    today = today or date.today()
+    value = (value or "").strip().lower()
+    if value == "today":
+        return today
+    match = _since.match(value)
+    if match:
+        days = int(match.group(1)) * (7 if match.group(2) == "w" else 1)
+        # "7d" means today and the six days before it
+        return today - timedelta(days=max(days - 1, 0))
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"Invalid --since '{value}'; use e.g. 7d, 2w, today or 2024-05-01")
+
+
+def _values(job):
+    return {
+        "total": "",
+        "platform": (job.get("platform") or "unknown").strip().lower(),
+        "company": (job.get("company") or "unknown").strip(),
+    }
+
+
+class ApplyStats:
+    """Apply outcome counts per day, rolled up by platform and company.
+
+    Each outcome bumps one counter per rollup (total, platform, company)
+    for its day and status, so a report reads only the buckets in its date
+    range - a few rows per day - however many applications were sent.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.conn.executescript(SCHEMA)
+
+    @traced("stats.record", "persist")
+    def record(self, outcomes, day=None):
+        """Count (job, status) outcomes for `day` (default today)"""
+        day = (day or date.today()).isoformat()
+        counts = Counter()
+        for job, status in outcomes:
+            for dimension, value in _values(job).items():
+                counts[(dimension, day, value, status or "failed")] += 1
+        with self.conn:
+            self._add(counts)
+
+    def _add(self, counts):
+        self.conn.executemany(
+            """
+            INSERT INTO apply_rollups (dimension, day, value, status, count)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(dimension, day, value, status)
+            DO UPDATE SET count = count + excluded.count
+            """,
+            ((*key, count) for key, count in counts.items()),
+        )
+
+    def rebuild(self, applications):
+        """Replace every rollup with counts from the backend's application log.
+
+        Returns the number of applications counted; records without a
+        readable timestamp are skipped.
+        """
+        counts = Counter()
+        counted = 0
+        for app in applications:
+            try:
+                stamp = datetime.fromisoformat(app["timestamp"].replace("Z", "+00:00"))
+            except (KeyError, AttributeError, ValueError):
+                continue
+            day = stamp.astimezone().date().isoformat() if stamp.tzinfo else stamp.date().isoformat()
+            status = app.get("status") or "failed"
+            for dimension, value in _values(app).items():
+                counts[(dimension, day, value, status)] += 1
+            counted += 1
+        with self.conn:
+            self.conn.execute("DELETE FROM apply_rollups")
+            self._add(counts)
+        return counted
+
+    def totals(self, since=None):
+        """{status: count} over the whole history or since a day"""
+        return {status: count for _, status, count in self.breakdown("status", since)}
+
+    @traced("stats.breakdown", "load")
+    def breakdown(self, by, since=None):
+        """(group, status, count) rows for one grouping, since a day if given"""
+        if by not in GROUPINGS:
+            raise ValueError(f"Cannot group stats by '{by}'")
+        dimension = by if by in _ROLLUPS else "total"
+        group = {"day": "day", "status": "status"}.get(by, "value")
+        return self.conn.execute(
+            f"""
+            SELECT {group}, status, SUM(count) FROM apply_rollups
+            WHERE dimension = ? AND day >= ?
+            GROUP BY {group}, status
+            """,
+            (dimension, since.isoformat() if since else ""),
+        ).fetchall()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Mock Backend
+Local stand-in for the backend API with configurable latency and payload size
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_jobs(keywords, location, count, url_length=80):
+    """Generate `count` fake search results with URLs of about `url_length` chars"""
+    padding = "x" * max(0, url_length - 40)
+    return [
+        {
+            "title": f"{keywords} {i}",
+            "company": f"Company {i % 50}",
+            "location": location,
+            "url": f"https://jobs.example.com/{i}?t={padding}",
+            "platform": "linkedin" if i % 2 else "indeed",
+        }
+        for i in range(count)
+    ]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle's
+    # algorithm plus delayed ACKs add ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+    jobs_per_search = 10
+    url_length = 80
+    latency = 0.0
+    watches = None
+    applications = None
+    lock = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, payload, status=200):
+        body = json.dumps(payload).encode("utf-8")
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        # Conditional GETs behave like Express: unchanged bodies get a 304
+        if self.command == "GET" and status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_ndjson(self, items):
+        body = "".join(json.dumps(item) + "\n" for item in items).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def simulate_latency(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def do_GET(self):
+        self.simulate_latency()
+        if self.path == "/api/stats":
+            self.send_json({"success": True, "stats": {"total": 0, "successful": 0, "pending": 0, "failed": 0}})
+        elif self.path == "/api/applications":
+            with self.lock:
+                applications = list(self.applications)
+            self.send_json({"success": True, "applications": applications})
+        elif self.path == "/api/monitor/watch":
+            with self.lock:
+                watch_list = list(self.watches.values())
+            self.send_json({"success": True, "watchList": watch_list})
+        elif self.path == "/api/monitor/status":
+            with self.lock:
+                count = len(self.watches)
+            self.send_json({"success": True, "status": {
+                "isMonitoring": False, "watchListCount": count, "seenJobsCount": 0,
+                "checkIntervalMinutes": 2, "dailyApplicationCount": 0, "dailyLimit": 50,
+            }})
+        else:
+            self.send_json({"error": "Not found"}, 404)
+
+    def do_POST(self):
+        body = self.read_json()
+        self.simulate_latency()
+        if self.path == "/api/jobs/search":
+            jobs = make_jobs(body.get("keywords", ""), body.get("location", ""),
+                             self.jobs_per_search, self.url_length)
+            if "application/x-ndjson" in self.headers.get("Accept", ""):
+                self.send_ndjson(jobs + [{"_end": True, "errors": {}}])
+            else:
+                self.send_json({"success": True, "count": len(jobs), "jobs": jobs, "errors": {}})
+        elif self.path == "/api/jobs/apply":
+            results = [
+                {"job": job.get("title"), "company": job.get("company"), "status": "success", "message": "Applied"}
+                for job in body.get("jobs", [])
+            ]
+            timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+            with self.lock:
+                self.applications.extend(
+                    dict(job, status="success", message="Applied", timestamp=timestamp)
+                    for job in body.get("jobs", [])
+                )
+            self.send_json({"success": True, "results": results})
+        elif self.path == "/api/monitor/watch":
+            with self.lock:
+                watch = dict(body, id=time.time(), enabled=True)
+                self.watches[watch["id"]] = watch
+            self.send_json({"success": True, "watchItem": watch})
+        elif self.path == "/api/monitor/watch/batch":
+            with self.lock:
+                removed = 0
+                for watch_id in body.get("remove", []):
+                    removed += self.watches.pop(float(watch_id), None) is not None
+                added = []
+                for criteria in body.get("add", []):
+                    watch = dict(criteria, id=time.time() + len(added) / 1e6, enabled=True)
+                    self.watches[watch["id"]] = watch
+                    added.append(watch)
+            self.send_json({"success": True, "added": added, "removed": removed})
+        elif self.path in ("/api/monitor/start", "/api/monitor/stop", "/api/monitor/interval"):
+            self.send_json({"success": True})
+        else:
+            self.send_json({"error": "Not found"}, 404)
+
+    def do_DELETE(self):
+        self.simulate_latency()
+        if self.path.startswith("/api/monitor/watch/"):
+            watch_id = float(self.path.rsplit("/", 1)[1])
+            with self.lock:
+                self.watches.pop(watch_id, None)
+            self.send_json({"success": True})
+        else:
+            self.send_json({"error": "Not found"}, 404)
+
+
+def start_mock_backend(port=0, jobs_per_search=10, latency_ms=0, url_length=80):
+    """Serve the mock API on a background thread; returns (server, base_url)"""
+    handler = type("ConfiguredMockHandler", (MockHandler,), {
+        "jobs_per_search": jobs_per_search,
+        "latency": latency_ms / 1000.0,
+        "url_length": url_length,
+        "watches": {},
+        "applications": [],
+        "lock": threading.Lock(),
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the mock backend API")
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--jobs', type=int, default=10, help='Jobs returned per search')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Delay added to every response')
+    parser.add_argument('--url-length', type=int, default=80, help='Approximate length of job URLs')
+    args = parser.parse_args()
+
+    server, url = start_mock_backend(args.port, args.jobs, args.latency_ms, args.url_length)
+    print(f"Mock backend running on {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
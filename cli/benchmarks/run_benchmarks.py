@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Benchmark Suite
+Runs JobBot and MonitorCLI operations against the mock backend and reports
+throughput, p50/p99 latency, peak RSS and startup time as JSON
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mock_backend import start_mock_backend
+from startup import measure_startup
+
+CLI_DIR = Path(__file__).resolve().parent.parent
+
+# name -> (setup, operation); both receive (bot, monitor)
+SCENARIOS = {
+    "search": (None, lambda bot, monitor: bot.search_jobs(refresh=True)),
+    "search-cached": (
+        lambda bot, monitor: bot.search_jobs(refresh=True),
+        lambda bot, monitor: bot.search_jobs(),
+    ),
+    "search-stream": (None, lambda bot, monitor: bot.stream_search()),
+    "apply": (
+        lambda bot, monitor: bot.search_jobs(refresh=True),
+        lambda bot, monitor: bot.apply_to_jobs([1]),
+    ),
+    "apply-batched": (
+        lambda bot, monitor: bot.search_jobs(refresh=True),
+        lambda bot, monitor: bot.apply_to_jobs(batch_size=10, concurrency=4),
+    ),
+    "stats": (None, lambda bot, monitor: bot.show_stats()),
+    "stats-sync": (
+        lambda bot, monitor: bot.search_jobs(refresh=True) and bot.apply_to_jobs(),
+        lambda bot, monitor: bot.show_stats(by="company", sync=True),
+    ),
+    "monitor-add": (None, lambda bot, monitor: monitor.add_watch("Python Developer", "Remote")),
+    "monitor-list": (
+        lambda bot, monitor: [monitor.add_watch(f"Keyword {i}", "Remote") for i in range(20)],
+        lambda bot, monitor: monitor.list_watches(),
+    ),
+    "monitor-status": (None, lambda bot, monitor: monitor.show_status()),
+}
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def run_scenario(name, iterations, api_url):
+    """Child mode: run one scenario in this process and print raw timings"""
+    sys.path.insert(0, str(CLI_DIR))
+    import job_bot
+    import job_bot_monitor
+    from rich.console import Console
+
+    # Still render everything, just not to the terminal
+    quiet = Console(file=open(os.devnull, "w"), width=120)
+    job_bot.console = job_bot_monitor.console = quiet
+
+    bot = job_bot.JobBot(api_url)
+    monitor = job_bot_monitor.MonitorCLI(api_url)
+    setup, operation = SCENARIOS[name]
+    if setup:
+        setup(bot, monitor)
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        op_started = time.perf_counter()
+        operation(bot, monitor)
+        latencies.append((time.perf_counter() - op_started) * 1000)
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps({"latencies_ms": latencies, "elapsed_s": elapsed, "peak_rss_mb": peak_rss_mb()}))
+
+
+def summarize(raw, iterations):
+    latencies = raw["latencies_ms"]
+    return {
+        "iterations": iterations,
+        "throughput_ops_s": round(iterations / raw["elapsed_s"], 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "peak_rss_mb": round(raw["peak_rss_mb"], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CLI against a local mock backend")
+    parser.add_argument('-n', '--iterations', type=int, default=50,
+                       help='Operations per scenario')
+    parser.add_argument('--scenarios', nargs='+', choices=sorted(SCENARIOS),
+                       help='Scenarios to run (default: all)')
+    parser.add_argument('--latency-ms', type=float, default=0,
+                       help='Latency the mock backend adds to every response')
+    parser.add_argument('--jobs', type=int, default=100,
+                       help='Jobs returned per search')
+    parser.add_argument('--url-length', type=int, default=300,
+                       help='Approximate length of job URLs (tracking links are long)')
+    parser.add_argument('--startup-runs', type=int, default=3,
+                       help='Runs per subcommand for startup time (0 to skip)')
+    parser.add_argument('-o', '--output',
+                       help='Write the JSON report to this file instead of stdout')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--api-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_scenario(args.child, args.iterations, args.api_url)
+        return
+
+    server, api_url = start_mock_backend(
+        jobs_per_search=args.jobs, latency_ms=args.latency_ms, url_length=args.url_length
+    )
+    report = {
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "parameters": {
+            "iterations": args.iterations,
+            "latency_ms": args.latency_ms,
+            "jobs_per_search": args.jobs,
+            "url_length": args.url_length,
+        },
+        "scenarios": {},
+    }
+
+    with tempfile.TemporaryDirectory() as home:
+        config = {
+            "keywords": "Software Engineer",
+            "location": "Remote",
+            "platforms": ["linkedin", "indeed"],
+            "resume_path": "",
+            "daily_limit": 10 ** 9,
+        }
+        Path(home, ".job-bot-config.json").write_text(json.dumps(config))
+        env = dict(os.environ, HOME=home)
+
+        # Each scenario gets its own process so peak RSS is per scenario
+        for name in args.scenarios or SCENARIOS:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--child", name,
+                 "--iterations", str(args.iterations), "--api-url", api_url],
+                cwd=Path(__file__).parent, env=env, stdout=subprocess.PIPE,
+                universal_newlines=True, check=True,
+            )
+            raw = json.loads(proc.stdout.strip().splitlines()[-1])
+            report["scenarios"][name] = summarize(raw, args.iterations)
+
+        if args.startup_runs:
+            report["startup"] = measure_startup(api_url, home, args.startup_runs)
+    server.shutdown()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
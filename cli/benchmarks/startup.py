@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Startup Benchmark
+Measures per-subcommand import time with `python -X importtime`
+and checks it against the budgets in startup_budget.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mock_backend import start_mock_backend
+
+CLI_DIR = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / "startup_budget.json"
+
+# Run in this order: `apply` needs the jobs saved by `search`
+COMMANDS = [
+    ("show-config", ["job_bot.py", "show-config"]),
+    ("search", ["job_bot.py", "search", "--refresh"]),
+    ("apply", ["job_bot.py", "apply", "-i", "1"]),
+    ("stats", ["job_bot.py", "stats"]),
+    ("monitor-list", ["job_bot_monitor.py", "list"]),
+    ("monitor-status", ["job_bot_monitor.py", "status"]),
+]
+
+
+def parse_importtime(stderr):
+    """Total import time in ms: the sum of cumulative times of top-level imports"""
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        # Nested imports are indented below the module that pulled them in
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+def run_command(argv, env):
+    """Run one CLI invocation; returns (import_ms, wall_ms)"""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime"] + argv,
+        cwd=CLI_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(argv)} exited with {proc.returncode}")
+    return parse_importtime(proc.stderr), wall_ms
+
+
+def measure_startup(api_url, home, runs=5):
+    """Median import/wall time per subcommand, checked against the budgets"""
+    budgets = json.loads(BUDGET_FILE.read_text())
+    env = dict(os.environ, HOME=home, JOB_BOT_API_URL=api_url)
+    results = {}
+    for name, argv in COMMANDS:
+        samples = [run_command(argv, env) for _ in range(runs)]
+        import_ms = statistics.median(s[0] for s in samples)
+        results[name] = {
+            "import_ms": round(import_ms, 1),
+            "wall_ms": round(statistics.median(s[1] for s in samples), 1),
+            "budget_import_ms": budgets.get(name),
+            "within_budget": name not in budgets or import_ms <= budgets[name],
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI startup cost per subcommand")
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                       help='Runs per subcommand (median is reported)')
+    parser.add_argument('--check', action='store_true',
+                       help='Exit non-zero when a subcommand exceeds its budget')
+    parser.add_argument('-o', '--output',
+                       help='Write the JSON report to this file instead of stdout')
+    args = parser.parse_args()
+
+    server, api_url = start_mock_backend()
+    report = {"python": sys.version.split()[0], "runs": args.runs}
+    with tempfile.TemporaryDirectory() as home:
+        report["commands"] = measure_startup(api_url, home, args.runs)
+    server.shutdown()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.check and not all(c["within_budget"] for c in report["commands"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Daemon Mode
+Serves CLI commands from one warm process over a local Unix socket
+"""
+
+import json
+import os
+import shutil
+import signal
+import socket
+import socketserver
+import sys
+from pathlib import Path
+
+DEFAULT_SOCKET_PATH = Path.home() / ".job-bot.sock"
+
+# Words and options that keep a command local (see main() in job_bot.py);
+# argparse also accepts any unambiguous prefix of an option
+LOCAL_WORDS = ("config", "daemon", "repl", "watch")
+LOCAL_OPTIONS = ("--trace", "--trace-format", "--profile", "--output", "--browse")
+
+
+def send_command(socket_path, argv, color=False, width=None):
+    """Run `argv` in the daemon; returns (output, exit_code).
+
+    Raises ConnectionError if the daemon goes away without answering.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        request = {"argv": argv, "color": color, "width": width}
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as reader:
+            line = reader.readline()
+    try:
+        response = json.loads(line)
+        return response["output"], response["exit"]
+    except (ValueError, TypeError, KeyError):
+        raise ConnectionError("the daemon closed the connection without a result")
+
+
+def early_socket(argv, environ=os.environ):
+    """The socket to forward `argv` to before the CLI builds its parser, or None.
+
+    Only the raw words are looked at, so this errs towards None: a command
+    that might have to run locally, or a --socket spelling it does not
+    know, is left to the full parse.
+    """
+    path = environ.get("JOB_BOT_SOCKET")
+    words = iter(argv)
+    for word in words:
+        name, _, value = word.partition("=")
+        if word in LOCAL_WORDS:
+            return None
+        if name == "--socket":
+            path = value or next(words, None)
+        elif name.startswith("--") and len(name) > 2:
+            if "--socket".startswith(name) or any(opt.startswith(name) for opt in LOCAL_OPTIONS):
+                return None
+    return path or None
+
+
+def forward(socket_path, argv):
+    """Run `argv` in a listening daemon and print its output.
+
+    Returns the exit code, or None when the command should run locally:
+    no daemon is listening, or it died before answering.
+    """
+    try:
+        output, code = send_command(socket_path, argv, color=sys.stdout.isatty(),
+                                    width=shutil.get_terminal_size().columns)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    except OSError as e:
+        sys.stderr.write(f"Daemon at {socket_path} gave no result ({e}); running locally\n")
+        return None
+    sys.stdout.write(output)
+    sys.stdout.flush()
+    return code
+
+
+def forward_early(argv):
+    """Exit with the daemon's result if it serves `argv`; see early_socket()"""
+    socket_path = early_socket(argv)
+    code = forward(socket_path, argv) if socket_path else None
+    if code is not None:
+        sys.exit(code)
+
+
+def daemon_running(socket_path):
+    """True when something is accepting connections on the socket"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+
+
+class CommandHandler(socketserver.StreamRequestHandler):
+    """One JSON request line in, one JSON response line out"""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line)
+        output, code = self.server.run_command(
+            request["argv"], request.get("color", False), request.get("width")
+        )
+        response = {"output": output, "exit": code}
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Runs commands one at a time so they can share non-thread-safe state.
+
+    Commands swap the module-wide consoles to capture their output, so they
+    cannot overlap: other clients wait in the listen backlog until the
+    current command, however long, has finished.
+    """
+
+    def __init__(self, socket_path, run_command):
+        self.run_command = run_command
+        super().__init__(str(socket_path), CommandHandler)
+
+
+def serve(socket_path, run_command):
+    """Serve `run_command(argv, color, width) -> (output, exit_code)` until interrupted"""
+    path = Path(socket_path)
+    if path.exists():
+        if daemon_running(path):
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        path.unlink()
+
+    # The socket runs commands as this user: create it owner-only, rather
+    # than chmod it after bind() and leave a window open to everyone
+    umask = os.umask(0o177)
+    try:
+        server = DaemonServer(path, run_command)
+    finally:
+        os.umask(umask)
+    # Let `kill` shut down cleanly so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if path.exists():
+            path.unlink()
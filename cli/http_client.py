@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Shared HTTP Client
+Pooled, retrying connection layer used by every CLI command
+"""
+
+import random
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from tracing import span
+
+DEFAULT_API_URL = "http://localhost:5000"
+
+# Read timeouts per endpoint prefix (seconds). The longest matching prefix wins.
+DEFAULT_TIMEOUTS = {
+    "/api/jobs/search": 60,
+    "/api/jobs/apply": 120,
+    "/api/stats": 10,
+    "/api/monitor": 10,
+}
+DEFAULT_TIMEOUT = 10
+CONNECT_TIMEOUT = 3.05
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Statuses that mean the request was never processed, so even a
+# non-idempotent POST such as /api/jobs/apply can be sent again safely.
+SAFE_RETRY_STATUSES = (429, 503)
+# Methods that may be re-sent after a read timeout or dropped connection.
+# Anything else (POST: apply, search, add watch) may already have been
+# processed, so it is only retried when it provably never got through.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class JitteredRetry(Retry):
+    """Retry policy using full-jitter exponential backoff.
+
+    Idempotent methods retry connect errors, read errors and every status
+    in `status_forcelist`; other methods only retry connect errors and
+    SAFE_RETRY_STATUSES.
+    """
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return random.uniform(0, backoff)
+
+    @staticmethod
+    def _idempotent(method):
+        return method is not None and method.upper() in IDEMPOTENT_METHODS
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if not self._idempotent(method) and status_code not in SAFE_RETRY_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None,
+                  _stacktrace=None):
+        if error is not None and self._is_read_error(error) and not self._idempotent(method):
+            # The backend may have acted on the request; surface the error as is
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def build_retry(total=3, backoff_factor=0.5, statuses=RETRY_STATUSES):
+    """Build the retry policy mounted on the pooled adapters"""
+    return JitteredRetry(
+        total=total,
+        connect=total,
+        read=total,
+        status=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=statuses,
+        allowed_methods=None,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+
+
+class ApiClient:
+    """Keep-alive session wrapper for the backend API"""
+
+    def __init__(self, api_url=DEFAULT_API_URL, timeouts=None, retries=3,
+                 backoff_factor=0.5, pool_size=10):
+        self.api_url = api_url.rstrip("/")
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=build_retry(retries, backoff_factor),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def timeout_for(self, path):
+        """Return the (connect, read) timeout for an endpoint"""
+        matches = [prefix for prefix in self.timeouts if path.startswith(prefix)]
+        read_timeout = self.timeouts[max(matches, key=len)] if matches else DEFAULT_TIMEOUT
+        return (CONNECT_TIMEOUT, read_timeout)
+
+    def request(self, method, path, **kwargs):
+        """Send a request to the backend over the pooled session"""
+        kwargs.setdefault("timeout", self.timeout_for(path))
+        # Streamed responses are timed up to the headers; reading the body is the caller's
+        with span(f"{method} {path}", "http", stream=bool(kwargs.get("stream"))) as timed:
+            response = self.session.request(method, f"{self.api_url}{path}", **kwargs)
+            timed.set("status", response.status_code)
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+def request_not_sent(error):
+    """True if a requests exception proves the request never reached the backend.
+
+    Connect errors and timeouts qualify; a read timeout or a connection
+    dropped after sending does not, since the backend may have acted on it.
+    """
+    from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
+
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    reason = error.args[0]
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, ConnectTimeoutError)
+
+
+_clients = {}
+
+
+def get_client(api_url=DEFAULT_API_URL, **kwargs):
+    """Return the process-wide client for an API URL, creating it on first use"""
+    key = api_url.rstrip("/")
+    if key not in _clients:
+        _clients[key] = ApiClient(api_url, **kwargs)
+    return _clients[key]
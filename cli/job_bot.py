@@ -9,53 +9,270 @@ import sys
 import json
 import time
 import argparse
+import itertools
 from datetime import datetime
 from pathlib import Path
 
+if __name__ == "__main__" and (os.environ.get("JOB_BOT_SOCKET")
+                               or any(arg.startswith("--socket") for arg in sys.argv)):
+    # A daemon serves the command without any of the imports below, so hand
+    # it over first; main() forwards whatever this quick look leaves out
+    from daemon import forward_early
+    forward_early(sys.argv[1:])
+
+# Only the console is needed by every command; everything heavier (requests,
+# rich tables, SQLite, asyncio) is imported by the command that uses it.
 try:
-    import requests
     from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.panel import Panel
-    from rich import print as rprint
 except ImportError:
-    print("Installing required packages...")
-    os.system(f"{sys.executable} -m pip install requests rich")
-    import requests
-    from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.panel import Panel
-    from rich import print as rprint
+    sys.exit(
+        "Missing dependencies. Install them with:\n"
+        f"  {sys.executable} -m pip install -r {Path(__file__).parent / 'requirements.txt'}"
+    )
+
+from state_file import FileLock, StateFile, atomic_write
+from tracing import decode, span, traced
 
 console = Console()
 
+# Format of ~/.job-bot-config.json; older files gain new settings when next saved
+CONFIG_VERSION = 1
+
 class JobBot:
     def __init__(self, api_url="http://localhost:5000"):
         self.api_url = api_url
         self.config_file = Path.home() / ".job-bot-config.json"
+        # Shared with concurrent runs: written atomically under a lock
+        self.config_state = StateFile(self.config_file, version=CONFIG_VERSION)
         self.config = self.load_config()
+        self._client = None
+        self._store = None
+        self._cache = None
+        self._scheduler = None
+        self._apply_stats = None
+        self._filter = None
+        self._filter_key = None
+        # None means "the configured filters"; commands may layer extra rules on top
+        self.filter_rules = None
+        # Record writer set while a command runs with --output
+        self.output = None
+    
+    @property
+    def client(self):
+        """Pooled backend client, created on first use"""
+        if self._client is None:
+            from http_client import get_client
+            self._client = get_client(self.api_url, timeouts=self.config.get("timeouts"))
+        return self._client
+    
+    @property
+    def store(self):
+        """Local job history, opened on first use"""
+        if self._store is None:
+            from job_store import JobStore
+            self._store = JobStore()
+        return self._store
+    
+    @property
+    def cache(self):
+        """On-disk search response cache, opened on first use"""
+        if self._cache is None:
+            from search_cache import SearchCache
+            self._cache = SearchCache(
+                ttl_minutes=self.config.get("cache_ttl_minutes", 60),
+                max_entries=self.config.get("cache_max_entries", 200)
+            )
+        return self._cache
+    
+    @property
+    def scheduler(self):
+        """Daily quota and apply queue, kept next to the job store"""
+        if self._scheduler is None:
+            from apply_journal import DEFAULT_JOURNAL_PATH
+            from apply_scheduler import ApplyScheduler
+            self._scheduler = ApplyScheduler(
+                self.store.conn,
+                daily_limit=self.config.get("daily_limit", 50),
+                rate_per_minute=self.config.get("apply_rate_per_minute", 6),
+                burst=self.config.get("apply_burst", 3),
+                platform_rates=self.config.get("platform_rate_per_minute"),
+                lock_path=DEFAULT_JOURNAL_PATH
+            )
+        return self._scheduler
+    
+    @property
+    def apply_stats(self):
+        """Rollups of apply outcomes, kept next to the job store"""
+        if self._apply_stats is None:
+            from apply_stats import ApplyStats
+            self._apply_stats = ApplyStats(self.store.conn)
+        return self._apply_stats
     
     def load_config(self):
-        """Load configuration from file"""
-        if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
-        return {
+        """Load configuration from file, filling in settings added since it was saved"""
+        config = {
             "keywords": "Software Engineer",
             "location": "Remote",
             "platforms": ["linkedin", "indeed"],
             "resume_path": "",
-            "daily_limit": 50
+            "daily_limit": 50,
+            "apply_batch_size": 0,
+            "apply_concurrency": 3,
+            "cache_ttl_minutes": 60,
+            "cache_max_entries": 200,
+            "stream_batch_size": 200,
+            "apply_rate_per_minute": 6,
+            "apply_burst": 3,
+            "platform_rate_per_minute": {},
+            "filters": {},
+            "incremental_search": False,
+            "page_size": 50,
+            "skills": [],
+            "cover_letter_template": "",
+            "prepare_workers": 0,
+            "profiles": {}
+        }
+        default_rate = config["apply_rate_per_minute"]
+        try:
+            config.update(self.config_state.read() or {})
+        except ValueError as e:
+            console.print(f"[yellow]Ignoring unreadable {self.config_file}: {str(e)}[/yellow]")
+        
+        # A rate of 0 or less would never refill the apply token buckets
+        def positive(value):
+            return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+        
+        if not positive(config["apply_rate_per_minute"]):
+            console.print(
+                f"[yellow]Ignoring apply_rate_per_minute {config['apply_rate_per_minute']!r}: "
+                f"it must be above 0 (using {default_rate})[/yellow]"
+            )
+            config["apply_rate_per_minute"] = default_rate
+        platform_rates = config.get("platform_rate_per_minute") or {}
+        for platform, rate in platform_rates.items():
+            if not positive(rate):
+                console.print(
+                    f"[yellow]Ignoring platform_rate_per_minute for {platform} ({rate!r}): "
+                    f"it must be above 0[/yellow]"
+                )
+        config["platform_rate_per_minute"] = {
+            platform: rate for platform, rate in platform_rates.items() if positive(rate)
         }
+        config["filters"] = self.checked_filters(config.get("filters") or {})
+        config["profiles"] = self.checked_profiles(config.get("profiles") or {})
+        return config
+    
+    def checked_profiles(self, profiles):
+        """The configured search profiles without the ones that can't be searched"""
+        if not isinstance(profiles, dict):
+            console.print(f"[yellow]Ignoring profiles {profiles!r}: expected an object "
+                          f"of named profiles[/yellow]")
+            return {}
+        
+        def text_or_list(value):
+            if isinstance(value, list):
+                return all(isinstance(item, str) for item in value)
+            return isinstance(value, str)
+        
+        checked = {}
+        for name, profile in profiles.items():
+            if not isinstance(profile, dict):
+                console.print(f"[yellow]Ignoring profiles.{name} {profile!r}: expected an object "
+                              f"with keywords, location and platforms[/yellow]")
+                continue
+            profile = dict(profile)
+            # A field that can't be used falls back to the top-level setting
+            for field in ("keywords", "location", "platforms"):
+                if profile.get(field) is not None and not text_or_list(profile[field]):
+                    console.print(f"[yellow]Ignoring profiles.{name}.{field} {profile[field]!r}: "
+                                  f"expected text or a list of text[/yellow]")
+                    del profile[field]
+            checked[name] = profile
+        return checked
     
-    def save_config(self):
-        """Save configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+    def checked_filters(self, filters):
+        """The configured filter rules without the ones that can't be used"""
+        import re
+        
+        filters = dict(filters)
+        for name in ("title_regex", "exclude_title_regex"):
+            pattern = filters.get(name)
+            if not pattern:
+                continue
+            try:
+                re.compile(pattern)
+            except (re.error, TypeError) as e:
+                console.print(f"[yellow]Ignoring filters.{name} {pattern!r}: not a valid regex ({e})[/yellow]")
+                del filters[name]
+        # Salaries are compared as numbers; "120k" in the file means 120000
+        min_salary = filters.get("min_salary")
+        if isinstance(min_salary, (str, bool)):
+            from job_filter import parse_salary
+            amount = None if isinstance(min_salary, bool) else parse_salary(min_salary)
+            if amount is None:
+                console.print(f"[yellow]Ignoring filters.min_salary {min_salary!r}: "
+                              f"not an amount[/yellow]")
+                del filters["min_salary"]
+            else:
+                filters["min_salary"] = amount
+        return filters
+    
+    def refresh_config(self):
+        """Reload the configuration if the file changed since it was read"""
+        if self.config_state.changed():
+            self.config = self.load_config()
+    
+    def save_config(self, changes):
+        """Save changed settings, merged into the file as it is now"""
+        try:
+            # Other runs may have saved since this one loaded the config; only
+            # `changes` are applied on top of what is on disk, under the lock
+            self.config_state.update(lambda saved: dict(saved, **changes))
+        except (OSError, RuntimeError) as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        self.config = self.load_config()
         console.print(f"[green]✓[/green] Configuration saved to {self.config_file}")
     
+    def set_filters(self, extra=None, use_config=True):
+        """Filter rules for the next command, layered over the configured ones.
+        
+        Returns False, after saying why, if the rules can't be used.
+        """
+        rules = self.config.get("filters") if use_config else None
+        if extra:
+            from job_filter import merge_rules
+            rules = merge_rules(rules, extra)
+        self.filter_rules = rules or {}
+        if not self.filter_rules:
+            return True
+        from job_filter import JobFilter
+        try:
+            self._filter = JobFilter(self.filter_rules)
+        except ValueError as e:
+            console.print(f"[red]Invalid filter: {str(e)}[/red]")
+            return False
+        self._filter_key = json.dumps(self.filter_rules, sort_keys=True)
+        return True
+    
+    @traced("JobBot.filter_jobs", "filter")
+    def filter_jobs(self, jobs, rank=True, report=True):
+        """Drop jobs the filter rules reject and rank the rest, best first"""
+        rules = self.filter_rules if self.filter_rules is not None else self.config.get("filters")
+        if not rules:
+            return jobs
+        
+        key = json.dumps(rules, sort_keys=True)
+        if key != self._filter_key:
+            from job_filter import JobFilter
+            self._filter = JobFilter(rules)
+            self._filter_key = key
+        
+        kept = self._filter.select(jobs, rank)
+        if report and len(kept) < len(jobs):
+            console.print(f"[dim]Filtered out {len(jobs) - len(kept)} of {len(jobs)} jobs[/dim]")
+        return kept
+    
     def show_banner(self):
         """Display welcome banner"""
         banner = """
@@ -69,15 +286,41 @@ class JobBot:
         """
         console.print(banner, style="bold cyan")
     
-    def search_jobs(self, keywords=None, location=None):
+    @traced("JobBot.search_jobs")
+    def search_jobs(self, keywords=None, location=None, refresh=False, incremental=False):
         """Search for jobs"""
+        import requests
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from job_search import search_errors
+        
         keywords = keywords or self.config["keywords"]
         location = location or self.config["location"]
+        platforms = self.config["platforms"]
         
         console.print(f"\n[bold]Searching for jobs...[/bold]")
         console.print(f"Keywords: [cyan]{keywords}[/cyan]")
         console.print(f"Location: [cyan]{location}[/cyan]\n")
         
+        query_key = since = None
+        if incremental:
+            query_key, since = self.search_hint(keywords, location, platforms)
+            if since:
+                last_run = datetime.fromtimestamp(since / 1000).strftime('%Y-%m-%d %H:%M')
+                console.print(f"[dim]Only fetching jobs posted since the last run ({last_run})[/dim]")
+            else:
+                console.print("[dim]First incremental run of this search; fetching everything[/dim]")
+        
+        # Incremental runs are narrowed by their own high-water mark, so they
+        # neither use nor fill the cache of complete results
+        cached = None if refresh or incremental else self.cache.get(keywords, location, platforms)
+        if cached is not None:
+            console.print("[dim]Using cached results (add --refresh to search again)[/dim]")
+            return self.show_search_results(cached)
+        
+        body = {"keywords": keywords, "location": location, "platforms": platforms}
+        if since:
+            body["since"] = since
+        started = time.time()
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -86,54 +329,20 @@ class JobBot:
             task = progress.add_task("Scraping job boards...", total=None)
             
             try:
-                response = requests.post(
-                    f"{self.api_url}/api/jobs/search",
-                    json={
-                        "keywords": keywords,
-                        "location": location,
-                        "platforms": self.config["platforms"]
-                    },
-                    timeout=60
-                )
+                response = self.client.post("/api/jobs/search", json=body)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = decode(response)
                     jobs = data.get("jobs", [])
-                    
+                    failed = search_errors(data)
                     progress.stop()
-                    
-                    if not jobs:
-                        console.print("[yellow]No jobs found matching your criteria[/yellow]")
-                        return []
-                    
-                    console.print(f"\n[green]✓[/green] Found [bold]{len(jobs)}[/bold] jobs!\n")
-                    
-                    # Display jobs in a table
-                    table = Table(show_header=True, header_style="bold magenta")
-                    table.add_column("#", style="dim", width=4)
-                    table.add_column("Title", style="cyan")
-                    table.add_column("Company", style="green")
-                    table.add_column("Location", style="yellow")
-                    table.add_column("Platform", style="blue")
-                    
-                    for idx, job in enumerate(jobs, 1):
-                        table.add_row(
-                            str(idx),
-                            job.get("title", "N/A"),
-                            job.get("company", "N/A"),
-                            job.get("location", "N/A"),
-                            job.get("platform", "N/A")
-                        )
-                    
-                    console.print(table)
-                    
-                    # Save jobs to file
-                    jobs_file = Path.home() / ".job-bot-jobs.json"
-                    with open(jobs_file, 'w') as f:
-                        json.dump(jobs, f, indent=2)
-                    
-                    console.print(f"\n[dim]Jobs saved to {jobs_file}[/dim]")
-                    return jobs
+                    self.warn_failed_platforms(failed)
+                    if incremental:
+                        return self.show_new_results(query_key, jobs, started, failed)
+                    if not failed:
+                        # A failed board would stay missing until the entry expires
+                        self.cache.put(keywords, location, platforms, jobs)
+                    return self.show_search_results(jobs)
                 else:
                     progress.stop()
                     console.print(f"[red]Error: {response.status_code}[/red]")
@@ -149,43 +358,684 @@ class JobBot:
                 console.print(f"[red]Error: {str(e)}[/red]")
                 return []
     
-    def apply_to_jobs(self, job_indices=None):
-        """Apply to jobs"""
-        jobs_file = Path.home() / ".job-bot-jobs.json"
+    @traced("JobBot.stream_search")
+    def stream_search(self, keywords=None, location=None, batch_size=200, incremental=False):
+        """Search for jobs, showing and saving them batch by batch as they arrive"""
+        import requests
+        from job_search import search_errors
+        from streaming import STREAM_ACCEPT, batched, iter_jobs
+        
+        keywords = keywords or self.config["keywords"]
+        location = location or self.config["location"]
+        
+        console.print(f"\n[bold]Streaming search results...[/bold]")
+        console.print(f"Keywords: [cyan]{keywords}[/cyan]")
+        console.print(f"Location: [cyan]{location}[/cyan]\n")
+        
+        body = {"keywords": keywords, "location": location, "platforms": self.config["platforms"]}
+        query_key = None
+        if incremental:
+            query_key, since = self.search_hint(keywords, location, self.config["platforms"])
+            if since:
+                body["since"] = since
+        
+        # Only job IDs are kept; each batch is released once shown and saved.
+        # Rows past the first page are saved for 'results' but not drawn.
+        page_size = None if self.output else self.config.get("page_size")
+        ids = []
+        dropped = 0
+        already_seen = 0
+        # Filled with the backend's end-of-stream record once the jobs run out
+        meta = {}
+        started = time.time()
+        try:
+            with self.client.post(
+                "/api/jobs/search",
+                json=body,
+                headers={"Accept": STREAM_ACCEPT},
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    console.print(f"[red]Error: {response.status_code}[/red]")
+                    return 0
+                for received in batched(iter_jobs(response, meta=meta), batch_size):
+                    batch = received
+                    if incremental:
+                        batch = self.store.unseen_jobs(query_key, received)
+                        already_seen += len(received) - len(batch)
+                    # Results are shown as they arrive, so filter without re-ranking
+                    kept = self.filter_jobs(batch, rank=False, report=False)
+                    dropped += len(batch) - len(kept)
+                    if kept:
+                        shown = kept[:max(page_size - len(ids), 0)] if page_size else kept
+                        if shown:
+                            self.display_jobs(shown, start=len(ids) + 1, show_header=not ids)
+                        ids.extend(self.store.upsert_jobs(kept))
+                    if incremental:
+                        # Like every search path: what the backend returned
+                        # counts as seen, whatever the filters keep
+                        self.store.mark_seen(query_key, received)
+            failed = search_errors(meta)
+            self.warn_failed_platforms(failed)
+            if incremental:
+                self.finish_incremental_run(query_key, started, failed)
+        except requests.exceptions.ConnectionError:
+            console.print("[red]✗[/red] Cannot connect to backend server!")
+            console.print("[yellow]Make sure the backend is running:[/yellow]")
+            console.print("  cd backend && npm start")
+        except Exception as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+        
+        if already_seen:
+            console.print(f"[dim]Skipped {already_seen} jobs seen in earlier runs[/dim]")
+        if dropped:
+            console.print(f"[dim]Filtered out {dropped} jobs[/dim]")
+        if not ids:
+            if incremental:
+                console.print("[yellow]No new jobs since the last run[/yellow]")
+            else:
+                console.print("[yellow]No jobs found matching your criteria[/yellow]")
+            return 0
+        
+        self.store.set_last_search(ids)
+        self.page_hint(len(ids))
+        console.print(f"\n[green]✓[/green] Found [bold]{len(ids)}[/bold] jobs!")
+        console.print(f"[dim]Jobs saved to {self.store.path}[/dim]")
+        return len(ids)
+    
+    def show_search_results(self, jobs):
+        """Display and save the jobs returned by a search"""
+        jobs = self.filter_jobs(jobs)
+        if not jobs:
+            console.print("[yellow]No jobs found matching your criteria[/yellow]")
+            return []
+        
+        console.print(f"\n[green]✓[/green] Found [bold]{len(jobs)}[/bold] jobs!\n")
+        self.display_first_page(jobs)
+        self.save_jobs(jobs)
+        return jobs
+    
+    def search_hint(self, keywords, location, platforms):
+        """Store key and `since` hint (epoch ms) for an incremental search"""
+        from search_cache import cache_key
+        
+        query_key = cache_key(keywords, location, platforms)
+        last_run = self.store.search_mark(query_key)
+        return query_key, None if last_run is None else int(last_run * 1000)
+    
+    def show_new_results(self, query_key, jobs, started, failed):
+        """Drop jobs earlier runs of this search returned, then show and save the rest"""
+        fresh = self.store.unseen_jobs(query_key, jobs)
+        if len(fresh) < len(jobs):
+            console.print(f"[dim]Skipped {len(jobs) - len(fresh)} jobs seen in earlier runs[/dim]")
+        if fresh:
+            shown = self.show_search_results(fresh)
+        else:
+            shown = []
+            console.print("[yellow]No new jobs since the last run[/yellow]")
+        # Like every search path: what the backend returned counts as seen,
+        # whatever the filters keep
+        self.store.mark_seen(query_key, jobs)
+        self.finish_incremental_run(query_key, started, failed)
+        return shown
+    
+    def finish_incremental_run(self, query_key, started, failed):
+        """Move a query's high-water mark to `started`, but only past a complete result"""
+        if failed == {}:
+            self.store.mark_seen(query_key, [], run_started=started)
+        else:
+            # Jobs posted while a board was failing would never be fetched again
+            console.print("[dim]Not every board confirmed its results; the next --new run "
+                          "searches this period again[/dim]")
+    
+    def warn_failed_platforms(self, failed, label=""):
+        """Point out boards that failed; their jobs are missing from the results"""
+        for platform, message in (failed or {}).items():
+            console.print(f"[yellow]{label}{platform} search failed: {message}[/yellow]")
+    
+    @traced("JobBot.search_many")
+    def search_many(self, queries, concurrency=4, refresh=False, incremental=False):
+        """Run several keyword/location searches concurrently and merge the results"""
+        from job_search import dedupe_jobs
+        from job_store import job_id
+        
+        results = self.fetch_searches(queries, concurrency, refresh, incremental)
+        found = [job for query in queries for job in results.get(query, [])]
+        jobs = dedupe_jobs(found)
+        unique = len(jobs)
+        jobs = self.filter_jobs(jobs)
+        
+        if not jobs:
+            if incremental:
+                console.print("\n[yellow]No new jobs since the last run[/yellow]")
+            else:
+                console.print("\n[yellow]No jobs found matching your criteria[/yellow]")
+            return []
+        
+        console.print(
+            f"\n[green]✓[/green] Found [bold]{len(jobs)}[/bold] unique jobs "
+            f"([dim]{len(found) - unique} duplicates dropped[/dim])\n"
+        )
+        self.display_first_page(jobs)
+        self.store.upsert_jobs(jobs)
+        self.store.set_last_search([job_id(job) for job in jobs])
+        console.print(f"\n[dim]Jobs saved to {self.store.path}[/dim]")
+        return jobs
+    
+    @traced("JobBot.search_profiles")
+    def search_profiles(self, names=None, concurrency=4, refresh=False, incremental=False):
+        """Search for several named profiles at once, fetching each shared search once"""
+        from rich.table import Table
+        from job_search import build_query_plan, dedupe_jobs, fan_out
+        from job_store import job_id
+        
+        profiles = self.config.get("profiles") or {}
+        if not profiles:
+            console.print(f'[red]Error: no profiles configured; add them under "profiles" in {self.config_file}[/red]')
+            return []
+        unknown = [name for name in names or [] if name not in profiles]
+        if unknown:
+            console.print(f"[red]Error: unknown profile(s): {', '.join(unknown)} "
+                          f"(configured: {', '.join(profiles)})[/red]")
+            return []
+        selected = {name: profiles[name] for name in names or profiles}
+        
+        plan, wanted = build_query_plan(selected, self.config)
+        requested = sum(len(pairs) for pairs in wanted.values())
+        unique = sum(len(platforms) for platforms in plan.values())
+        console.print(
+            f"\n[bold]{len(selected)} profiles need {requested} searches; "
+            f"{unique} are distinct[/bold] [dim]({len(plan)} backend requests)[/dim]"
+        )
+        
+        results = self.fetch_searches(list(plan), concurrency, refresh, incremental, plan)
+        found = {name: self.filter_jobs(jobs, report=False)
+                 for name, jobs in fan_out(results, wanted).items()}
+        jobs = dedupe_jobs(job for name in selected for job in found[name])
+        
+        if self.output:
+            # One record per profile and job; `index` is the job's place in
+            # the combined list that 'apply -i' uses
+            from output import job_record
+            index = {job_id(job): idx for idx, job in enumerate(jobs, 1)}
+            for name in selected:
+                for job in found[name]:
+                    self.output.write(dict(profile=name, **job_record(job, index[job_id(job)])))
+        else:
+            # The plan as executed: one row per distinct query
+            contributors = {query: [] for query in plan}
+            for name in selected:
+                for query, _ in wanted[name]:
+                    if name not in contributors[query]:
+                        contributors[query].append(name)
+            table = Table(show_header=True, header_style="bold magenta", title="Search Plan")
+            table.add_column("Keywords")
+            table.add_column("Location", style="yellow")
+            table.add_column("Platforms", style="blue")
+            table.add_column("Profiles", style="cyan")
+            table.add_column("Fetched", justify="right", style="green")
+            for query, platforms in plan.items():
+                keywords, location = query
+                table.add_row(
+                    keywords, location, ", ".join(platforms),
+                    ", ".join(contributors[query]), str(len(results.get(query, [])))
+                )
+            console.print()
+            console.print(table)
+            console.print("[dim]Jobs per profile after filters: " +
+                          ", ".join(f"{name} {len(found[name])}" for name in selected) + "[/dim]")
+        
+        if not jobs:
+            if incremental:
+                console.print("\n[yellow]No new jobs since the last run[/yellow]")
+            else:
+                console.print("\n[yellow]No jobs found matching your criteria[/yellow]")
+            return []
         
-        if not jobs_file.exists():
+        console.print(f"\n[green]✓[/green] Found [bold]{len(jobs)}[/bold] unique jobs across all profiles\n")
+        if not self.output:
+            self.display_first_page(jobs)
+        self.store.upsert_jobs(jobs)
+        self.store.set_last_search([job_id(job) for job in jobs])
+        console.print(f"\n[dim]Jobs saved to {self.store.path}[/dim]")
+        return jobs
+    
+    def fetch_searches(self, queries, concurrency=4, refresh=False, incremental=False,
+                       platforms=None):
+        """Run (keywords, location) searches concurrently; {query: jobs}, cached or fresh.
+        
+        `platforms` maps a query to the platforms it searches; by default
+        every query searches the configured ones.
+        """
+        from job_search import run_searches
+        
+        platforms = platforms or {}
+        default_platforms = self.config["platforms"]
+        results = {}
+        # Incremental runs: each query's store key and new jobs
+        query_keys = {}
+        new_jobs = {}
+        # Per-query request fields: the platforms when they differ, and `since`
+        bodies = {
+            query: {"platforms": platforms[query]} for query in queries if query in platforms
+        }
+        if incremental:
+            for query in queries:
+                query_keys[query], since = self.search_hint(
+                    *query, platforms.get(query, default_platforms)
+                )
+                if since:
+                    bodies.setdefault(query, {})["since"] = since
+            hinted = sum("since" in body for body in bodies.values())
+            console.print(
+                f"[dim]{hinted} of {len(queries)} searches only fetch jobs "
+                f"posted since their last run[/dim]"
+            )
+        elif not refresh:
+            for query in queries:
+                jobs = self.cache.get(*query, platforms.get(query, default_platforms))
+                if jobs is not None:
+                    results[query] = jobs
+                    console.print(f"[green]✓[/green] {query[0]} @ {query[1]}: {len(jobs)} jobs [dim](cached)[/dim]")
+        pending = [query for query in queries if query not in results]
+        
+        if pending:
+            console.print(f"\n[bold]Running {len(pending)} searches ({concurrency} at a time)...[/bold]\n")
+        
+        started = time.time()
+        
+        def show_query(query, jobs, error, failed):
+            keywords, location = query
+            if error:
+                console.print(f"[red]✗[/red] {keywords} @ {location}: {error}")
+                return
+            if incremental:
+                fresh = new_jobs[query] = self.store.unseen_jobs(query_keys[query], jobs)
+                self.store.upsert_jobs(fresh)
+                self.store.mark_seen(query_keys[query], jobs)
+                console.print(
+                    f"[green]✓[/green] {keywords} @ {location}: {len(fresh)} new jobs "
+                    f"[dim]({len(jobs) - len(fresh)} seen before)[/dim]"
+                )
+            else:
+                if not failed:
+                    self.cache.put(keywords, location, platforms.get(query, default_platforms), jobs)
+                self.store.upsert_jobs(jobs)
+                console.print(f"[green]✓[/green] {keywords} @ {location}: {len(jobs)} jobs")
+            self.warn_failed_platforms(failed, f"  {keywords} @ {location}: ")
+            if incremental:
+                self.finish_incremental_run(query_keys[query], started, failed)
+        
+        if pending:
+            outcomes = run_searches(
+                self.client, pending, default_platforms,
+                concurrency=concurrency, on_result=show_query, extra_body=bodies
+            )
+            results.update((query, new_jobs.get(query, jobs)) for query, jobs, _, _ in outcomes)
+        return results
+    
+    @traced("JobBot.display_jobs", "render")
+    def display_jobs(self, jobs, start=1, show_header=True, indices=None, highlight=None):
+        """Display jobs in a table, numbered from `start` or by their `indices`"""
+        indices = indices or itertools.count(start)
+        if self.output:
+            from output import job_record
+            self.output.write_many(job_record(job, idx) for idx, job in zip(indices, jobs))
+            return
+        
+        from rich.table import Table
+        from job_store import job_id
+        
+        table = Table(show_header=show_header, header_style="bold magenta")
+        table.add_column("#", style="dim", min_width=4, no_wrap=True)
+        table.add_column("ID", style="dim", width=12)
+        table.add_column("Title", style="cyan")
+        table.add_column("Company", style="green")
+        table.add_column("Location", style="yellow")
+        table.add_column("Platform", style="blue")
+        
+        for idx, job in zip(indices, jobs):
+            table.add_row(
+                str(idx),
+                job.get("id") or job_id(job),
+                job.get("title", "N/A"),
+                job.get("company", "N/A"),
+                job.get("location", "N/A"),
+                job.get("platform", "N/A"),
+                style="reverse" if idx == highlight else None
+            )
+        
+        console.print(table)
+    
+    def display_first_page(self, jobs):
+        """Show the first page of a result list; 'results' reads later pages from the store"""
+        page_size = self.config.get("page_size") or len(jobs)
+        if self.output or len(jobs) <= page_size:
+            return self.display_jobs(jobs)
+        self.display_jobs(list(itertools.islice(jobs, page_size)))
+        self.page_hint(len(jobs))
+    
+    def page_hint(self, total):
+        """Point at the 'results' pager when a result list is longer than one page"""
+        page_size = self.config.get("page_size")
+        if self.output or not page_size or total <= page_size:
+            return
+        console.print(
+            f"[dim]Showing 1-{page_size} of {total} • 'results --page 2' for more, "
+            f"'results --sort company' or 'results --at N' to browse[/dim]"
+        )
+    
+    @traced("JobBot.show_results")
+    def show_results(self, page=1, sort=None, descending=False, at=None, page_size=None,
+                     browse=False):
+        """Page through the last search, reading only the rows on screen"""
+        total = self.store.last_search_count()
+        if not total:
             console.print("[red]No jobs found. Run 'search' first![/red]")
             return
+        page_size = max(page_size or self.config.get("page_size") or 50, 1)
+        if at is not None:
+            rank = self.store.last_search_rank(at, sort, descending)
+            if rank is None:
+                console.print(f"[red]Error: there is no job #{at} (the last search has {total})[/red]")
+                return
+            page = rank // page_size + 1
         
-        with open(jobs_file, 'r') as f:
-            all_jobs = json.load(f)
+        pages = -(-total // page_size)
+        page = min(max(page, 1), pages)
+        if browse and not self.output and console.is_terminal:
+            return self.browse_results(page, page_size, total, sort, descending, at)
+        self.show_page(page, page_size, total, sort, descending, at)
+    
+    def show_page(self, page, page_size, total, sort=None, descending=False, highlight=None):
+        """Render one page of the last search; `#` is always the `apply -i` index"""
+        rows = self.store.last_search_page((page - 1) * page_size, page_size, sort, descending)
+        self.display_jobs([job for _, job in rows], indices=[position for position, _ in rows],
+                          highlight=highlight)
+        if self.output:
+            return
+        first = (page - 1) * page_size + 1
+        order = f", by {sort}{' (descending)' if descending else ''}" if sort else ""
+        console.print(
+            f"[dim]Page {page} of {-(-total // page_size)} • "
+            f"jobs {first}-{first + len(rows) - 1} of {total}{order}[/dim]"
+        )
+    
+    def browse_results(self, page, page_size, total, sort=None, descending=False, highlight=None):
+        """Interactive pager over the last search"""
+        from job_store import SORT_FIELDS
         
-        if not all_jobs:
-            console.print("[yellow]No jobs available to apply to[/yellow]")
+        pages = -(-total // page_size)
+        while True:
+            self.show_page(page, page_size, total, sort, descending, highlight)
+            try:
+                choice = console.input(
+                    "[dim]Enter/n next • p previous • page number • g N go to job N • "
+                    "s FIELD \\[desc] sort • q quit:[/dim] "
+                ).strip().lower()
+            except (EOFError, KeyboardInterrupt):
+                console.print()
+                return
+            command, _, arg = choice.partition(" ")
+            highlight = None
+            if command in ("q", "quit") or (not command and page == pages):
+                return
+            elif command in ("", "n"):
+                page = min(page + 1, pages)
+            elif command == "p":
+                page = max(page - 1, 1)
+            elif command.isdigit():
+                page = min(max(int(command), 1), pages)
+            elif command == "g" and arg.isdigit():
+                rank = self.store.last_search_rank(int(arg), sort, descending)
+                if rank is None:
+                    console.print(f"[red]There is no job #{arg}[/red]")
+                    continue
+                page, highlight = rank // page_size + 1, int(arg)
+            elif command == "s":
+                field, _, order = arg.partition(" ")
+                if field not in SORT_FIELDS + ("", "index"):
+                    console.print(f"[red]Sort by one of: index, {', '.join(SORT_FIELDS)}[/red]")
+                    continue
+                sort = field if field in SORT_FIELDS else None
+                descending = order.startswith("desc")
+                page = 1
+            else:
+                console.print("[yellow]Unknown command[/yellow]")
+    
+    @traced("JobBot.filter_history")
+    def filter_history(self, limit=50):
+        """Filter and rank every job in the local store without a new search"""
+        started = time.perf_counter()
+        # Records carry the job's URL; the table never shows it
+        jobs = self.store.all_jobs(with_urls=self.output is not None)
+        total = len(jobs)
+        jobs = self.filter_jobs(jobs, report=False)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        console.print(
+            f"\n[green]✓[/green] [bold]{len(jobs)}[/bold] of {total} stored jobs match "
+            f"[dim]({elapsed_ms:.0f} ms)[/dim]\n"
+        )
+        if not len(jobs):
+            return jobs
+        self.display_jobs(jobs.take(range(min(limit, len(jobs)))))
+        if len(jobs) > limit:
+            console.print(f"[dim]... and {len(jobs) - limit} more (use --limit to show more)[/dim]")
+        self.store.set_last_search(jobs.ids)
+        console.print("\n[dim]Use 'apply' to apply to all matches, or 'apply -i N' for one[/dim]")
+        return jobs
+    
+    def save_jobs(self, jobs):
+        """Save jobs to the local store for a later apply"""
+        ids = self.store.upsert_jobs(jobs)
+        self.store.set_last_search(ids)
+        
+        console.print(f"\n[dim]Jobs saved to {self.store.path}[/dim]")
+    
+    @traced("JobBot.apply_to_jobs")
+    def apply_to_jobs(self, job_indices=None, batch_size=None, concurrency=None,
+                      job_ids=None, queue=False, resume=False):
+        """Apply to jobs"""
+        if resume:
+            return self.resume_apply(batch_size, concurrency)
+        
+        if not job_ids and not self.store.last_search_count():
+            console.print("[red]No jobs found. Run 'search' first![/red]")
             return
         
         # Select jobs to apply to
-        if job_indices:
-            jobs_to_apply = [all_jobs[i-1] for i in job_indices if 0 < i <= len(all_jobs)]
+        if job_ids:
+            jobs_to_apply = self.store.jobs_by_ids(job_ids)
+        elif job_indices:
+            jobs_to_apply = self.store.jobs_at_positions(job_indices)
         else:
-            jobs_to_apply = all_jobs
+            # Rules may have changed since the search; explicit picks are kept as-is
+            jobs_to_apply = self.filter_jobs(self.store.last_search_jobs(), rank=False)
+        
+        if not jobs_to_apply:
+            console.print("[yellow]No jobs available to apply to[/yellow]")
+            return
+        
+        if queue:
+            # Jobs picked by hand are queued again even if a drain left them in-flight
+            added = self.scheduler.enqueue(jobs_to_apply, requeue=bool(job_ids or job_indices))
+            console.print(
+                f"\n[green]✓[/green] Queued {added} job(s) "
+                f"([bold]{self.scheduler.pending_count()}[/bold] waiting)"
+            )
+            console.print("[dim]Use 'apply --drain' to send them at a safe pace[/dim]")
+            return
+        
+        from apply_journal import ApplyJournal, replay
+        
+        journal = ApplyJournal()
+        try:
+            journal.lock()
+        except RuntimeError as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        # Checked under the lock, so a drain can't use up the quota meanwhile
+        jobs_to_apply = self.within_daily_limit(jobs_to_apply)
+        if not jobs_to_apply:
+            journal.close()
+            return
+        previous = replay()
+        if previous and previous.pending():
+            console.print(
+                f"[yellow]Discarding an interrupted apply run with {len(previous.pending())} "
+                f"unsent job(s)[/yellow] [dim](use 'apply --resume' to finish one instead)[/dim]"
+            )
+        try:
+            jobs_to_apply, payload = self.prepare_applications(jobs_to_apply)
+        except ValueError as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            journal.close()
+            return
+        journal.start_run(jobs_to_apply, payload)
+        self.send_applications(jobs_to_apply, payload, batch_size, concurrency, journal)
+    
+    @traced("JobBot.resume_apply")
+    def resume_apply(self, batch_size=None, concurrency=None):
+        """Finish an interrupted apply run, skipping jobs it already submitted"""
+        from apply_journal import ApplyJournal, replay
+        
+        # Holding the lock first means a run that is still going is never "resumed"
+        journal = ApplyJournal()
+        try:
+            journal.lock()
+        except RuntimeError as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        try:
+            state = replay()
+            if state is None:
+                console.print("[yellow]No apply run to resume[/yellow]")
+                return
+            
+            pending = state.pending()
+            in_flight = state.in_flight()
+            console.print(
+                f"\n[bold]Resuming apply run:[/bold] {len(state.finished())} done, "
+                f"{len(pending)} to send"
+            )
+            if in_flight:
+                console.print(
+                    f"[yellow]{len(in_flight)} job(s) may have been submitted but never got "
+                    f"a result; skipping them:[/yellow]"
+                )
+                console.print(f"  {' '.join(job['id'] for job in in_flight)}")
+                console.print("[dim]Check 'stats' and retry any with 'apply --ids ...'[/dim]")
+            if not pending:
+                console.print("[green]✓[/green] Nothing left to send")
+                return
+            
+            pending = self.within_daily_limit(pending)
+            if not pending:
+                return
+            journal.resume_run()
+            self.send_applications(pending, state.payload, batch_size, concurrency, journal)
+        finally:
+            journal.close()
+    
+    def apply_payload(self):
+        """Request fields shared by every job of an apply run"""
+        return {"resumePath": self.config.get("resume_path", ""), "coverLetter": ""}
+    
+    @traced("JobBot.prepare_applications")
+    def prepare_applications(self, jobs, workers=None, payload=None):
+        """Attach a tailored cover letter to every job.
         
+        Returns the prepared jobs and the fields shared by every request;
+        raises ValueError for an unusable cover letter template.
+        """
+        from apply_prep import build_context, prepare_payloads
+        
+        payload = payload or self.apply_payload()
+        context = build_context(self.config)
+        if workers is None:
+            workers = self.config.get("prepare_workers", 0)
+        started = time.perf_counter()
+        prepared = prepare_payloads(jobs, context, workers)
+        if len(jobs) > 1:
+            console.print(
+                f"[dim]Prepared {len(jobs)} cover letters "
+                f"({(time.perf_counter() - started) * 1000:.0f} ms)[/dim]"
+            )
+        return [dict(job, **fields) for job, fields in zip(jobs, prepared)], payload
+    
+    def within_daily_limit(self, jobs):
+        """Trim `jobs` to what today's quota still allows"""
+        remaining = self.scheduler.remaining_today()
+        if not remaining:
+            console.print(f"[yellow]Daily limit of {self.scheduler.daily_limit} applications reached[/yellow]")
+            console.print("[dim]Use 'apply --queue' to send them later[/dim]")
+            return []
+        if len(jobs) > remaining:
+            console.print(
+                f"[yellow]Only {remaining} application(s) left today; "
+                f"skipping {len(jobs) - remaining} job(s)[/yellow]"
+            )
+            jobs = jobs[:remaining]
+        return jobs
+    
+    def send_applications(self, jobs_to_apply, payload, batch_size, concurrency, journal):
+        """Submit applications, journaling every job's state so the run can resume"""
         console.print(f"\n[bold]Applying to {len(jobs_to_apply)} job(s)...[/bold]\n")
         
+        batch_size = batch_size or self.config.get("apply_batch_size", 0)
         try:
-            response = requests.post(
-                f"{self.api_url}/api/jobs/apply",
-                json={
-                    "jobs": jobs_to_apply,
-                    "resumePath": self.config.get("resume_path", ""),
-                    "coverLetter": ""
-                },
-                timeout=120
+            if batch_size:
+                concurrency = concurrency or self.config.get("apply_concurrency", 3)
+                self.apply_in_batches(jobs_to_apply, payload, batch_size, concurrency, journal)
+            else:
+                self.apply_at_once(jobs_to_apply, payload, journal)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Interrupted[/yellow] - run 'apply --resume' to continue")
+        finally:
+            journal.close()
+    
+    def warn_unknown(self, results):
+        """Point out jobs whose request failed after it may have been processed"""
+        from apply_journal import UNKNOWN
+        
+        unknown = sum(1 for result in results if result.get("status") == UNKNOWN)
+        if unknown:
+            console.print(
+                f"[yellow]{unknown} job(s) may have been submitted before the error; "
+                f"'apply --resume' will not send them again[/yellow]"
+            )
+            console.print("[dim]Check 'stats' and retry any with 'apply --ids ...'[/dim]")
+    
+    def record_outcomes(self, jobs, results):
+        """Count the backend's per-job results in the local stats"""
+        self.apply_stats.record(
+            (job, result.get("status", "failed")) for job, result in zip(jobs, results)
+        )
+    
+    def apply_at_once(self, jobs_to_apply, payload, journal):
+        """Apply to every job in a single request and show a results table"""
+        from rich.table import Table
+        from apply_pipeline import unanswered_results
+        
+        ids = [job["id"] for job in jobs_to_apply]
+        journal.record(ids, "in-flight", sync=True)
+        try:
+            response = self.client.post(
+                "/api/jobs/apply",
+                json=dict(payload, jobs=jobs_to_apply)
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response)
                 results = data.get("results", [])
+                journal.record_results(jobs_to_apply, results)
+                self.scheduler.record_applied(len(results))
+                self.record_outcomes(jobs_to_apply, results)
+                
+                if self.output:
+                    self.output.write_many(results)
+                    return
                 
                 # Display results
                 table = Table(show_header=True, header_style="bold magenta")
@@ -203,62 +1053,394 @@ class JobBot:
                         result["message"]
                     )
                 
-                console.print(table)
+                with span("render results", "render", rows=len(results)):
+                    console.print(table)
                 console.print(f"\n[green]✓[/green] Application process completed!")
             else:
+                results = unanswered_results(jobs_to_apply, response=response)
+                journal.record_results(jobs_to_apply, results)
                 console.print(f"[red]Error: {response.status_code}[/red]")
+                self.warn_unknown(results)
         except Exception as e:
+            # Results already journaled are final; unknown ones stay in-flight
+            results = unanswered_results(jobs_to_apply, error=e)
+            journal.record_results(jobs_to_apply, results)
             console.print(f"[red]Error: {str(e)}[/red]")
+            self.warn_unknown(results)
     
-    def show_stats(self):
-        """Show application statistics"""
-        try:
-            response = requests.get(f"{self.api_url}/api/stats", timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                stats = data.get("stats", {})
-                
-                panel = Panel(
-                    f"""
-[bold cyan]Total Applications:[/bold cyan] {stats.get('total', 0)}
-[bold green]Successful:[/bold green] {stats.get('successful', 0)}
-[bold yellow]Pending:[/bold yellow] {stats.get('pending', 0)}
-[bold red]Failed:[/bold red] {stats.get('failed', 0)}
-                    """,
-                    title="📊 Application Statistics",
-                    border_style="cyan"
-                )
-                console.print(panel)
+    def apply_in_batches(self, jobs_to_apply, payload, batch_size, concurrency, journal):
+        """Apply in chunks, printing each result as its chunk completes"""
+        from apply_pipeline import run_apply_pipeline
+        
+        console.print(
+            f"[dim]Sending {batch_size} job(s) per request, "
+            f"{concurrency} request(s) in flight[/dim]\n"
+        )
+        
+        def mark_sending(index, chunk):
+            # Durable before the request goes out, so a crash can't hide a send
+            journal.record([job["id"] for job in chunk], "in-flight", sync=True)
+        
+        def show_chunk(index, chunk, results, ok):
+            journal.record_results(chunk, results)
+            if ok:
+                self.scheduler.record_applied(len(results))
+                self.record_outcomes(chunk, results)
             else:
-                console.print(f"[red]Error fetching stats: {response.status_code}[/red]")
-        except Exception as e:
+                console.print(f"[red]✗[/red] Batch {index + 1} failed: {results[0]['message']}")
+            for result in results:
+                self.print_result(result)
+        
+        results = run_apply_pipeline(
+            self.client, jobs_to_apply, payload,
+            chunk_size=batch_size, concurrency=concurrency,
+            on_chunk=show_chunk, on_send=mark_sending
+        )
+        
+        # Keep partial results so failed jobs can be retried later
+        results_file = Path.home() / ".job-bot-apply-results.json"
+        with FileLock(results_file):
+            atomic_write(results_file, json.dumps(results, indent=2))
+        
+        succeeded = sum(1 for r in results if r["status"] == "success")
+        console.print(
+            f"\n[green]✓[/green] Application process completed: "
+            f"{succeeded}/{len(results)} succeeded"
+        )
+        console.print(f"[dim]Results saved to {results_file}[/dim]")
+        self.warn_unknown(results)
+    
+    @traced("JobBot.drain_queue")
+    def drain_queue(self, max_jobs=None):
+        """Send queued applications at the configured per-platform pace"""
+        import requests
+        
+        scheduler = self.scheduler
+        pending = scheduler.pending_count()
+        in_flight = scheduler.in_flight_ids()
+        if in_flight:
+            console.print(
+                f"[yellow]{len(in_flight)} queued job(s) may have been submitted by an earlier "
+                f"drain that never got a result; they are not sent again:[/yellow]"
+            )
+            console.print(f"  {' '.join(in_flight)}")
+            console.print("[dim]Check 'stats' and queue any that did not go through again "
+                          "with 'apply --queue --ids ...'[/dim]")
+        if not pending:
+            console.print("[yellow]The apply queue is empty[/yellow]")
+            return
+        
+        remaining = scheduler.remaining_today()
+        console.print(
+            f"\n[bold]Draining apply queue:[/bold] {pending} waiting, "
+            f"{remaining} of {scheduler.daily_limit} applications left today\n"
+        )
+        
+        payload = self.apply_payload()
+        
+        def send(job):
+            from apply_pipeline import failed_results, unanswered_results
+            from http_client import request_not_sent
+            
+            try:
+                jobs, _ = self.prepare_applications([job], workers=1, payload=payload)
+            except ValueError as e:
+                console.print(f"[red]Error: {str(e)}[/red]")
+                return None
+            try:
+                response = self.client.post("/api/jobs/apply", json=dict(payload, jobs=jobs))
+            except requests.exceptions.RequestException as e:
+                if request_not_sent(e):
+                    console.print(f"[red]✗[/red] Backend unreachable, stopping: {str(e)}")
+                    return None
+                console.print(f"[red]✗[/red] No answer from the backend, stopping: {str(e)}")
+                return unanswered_results([job], error=e)[0], False
+            if response.status_code in (429, 503):
+                console.print(f"[yellow]Backend is throttling ({response.status_code}), stopping[/yellow]")
+                return None
+            if response.status_code >= 500:
+                console.print(f"[red]✗[/red] Backend error ({response.status_code}), stopping")
+                return None
+            if response.status_code != 200:
+                # Rejected as a whole: nothing was applied, and sending it again won't help
+                return unanswered_results([job], response=response)[0], False
+            try:
+                results = decode(response).get("results", [])
+            except (ValueError, AttributeError) as e:
+                # The backend took the request, so the job may have been applied
+                console.print(f"[red]✗[/red] Unreadable answer from the backend, stopping: {str(e)}")
+                return failed_results([job], f"Unreadable response: {e}", maybe_sent=True)[0], False
+            self.record_outcomes([job], results)
+            if not results:
+                return failed_results([job], "No result returned")[0], False
+            return results[0], True
+        
+        try:
+            sent = scheduler.drain(send, on_result=lambda job, result: self.print_result(result),
+                                   max_jobs=max_jobs)
+        except RuntimeError as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        
+        console.print(
+            f"\n[green]✓[/green] Sent {sent} application(s); "
+            f"[bold]{scheduler.pending_count()}[/bold] still queued"
+        )
+        if scheduler.pending_count() and not scheduler.remaining_today():
+            console.print("[dim]Daily limit reached - run 'apply --drain' again tomorrow[/dim]")
+    
+    def print_result(self, result):
+        """Print a single apply result line"""
+        if self.output:
+            self.output.write(result)
+            return
+        status_color = {"success": "green", "unknown": "yellow"}.get(result["status"], "red")
+        console.print(
+            f"  [{status_color}]{result['status']:<8}[/{status_color}] "
+            f"[cyan]{result['job']}[/cyan] - [green]{result['company']}[/green] "
+            f"[dim]{result['message']}[/dim]"
+        )
+    
+    @traced("JobBot.show_stats")
+    def show_stats(self, by=None, since=None, sync=False, limit=20):
+        """Show application statistics from the local rollups"""
+        from rich.panel import Panel
+        from apply_stats import parse_since
+        
+        try:
+            since_day = parse_since(since) if since else None
+        except ValueError as e:
             console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        
+        if sync and not self.sync_stats():
+            return
+        
+        if self.output:
+            return self.write_stats(by, since_day)
+        
+        totals = self.apply_stats.totals(since_day)
+        period = f"since {since_day.isoformat()}" if since_day else "all time"
+        panel = Panel(
+            f"""
+[bold cyan]Total Applications:[/bold cyan] {sum(totals.values())}
+[bold green]Successful:[/bold green] {totals.get('success', 0)}
+[bold yellow]Skipped:[/bold yellow] {totals.get('skipped', 0)}
+[bold red]Failed:[/bold red] {totals.get('failed', 0)}
+            """,
+            title=f"📊 Application Statistics ({period})",
+            border_style="cyan"
+        )
+        console.print(panel)
+        if not totals and not sync:
+            console.print("[dim]Nothing recorded locally yet; 'stats --sync' imports the backend's history[/dim]")
+        elif by:
+            self.show_breakdown(by, since_day, limit)
+    
+    def write_stats(self, by, since_day):
+        """Stats as records: one totals record, or one per group with --by"""
+        if not by:
+            totals = self.apply_stats.totals(since_day)
+            self.output.write(dict(
+                since=since_day.isoformat() if since_day else None,
+                total=sum(totals.values()),
+                **{status: totals.get(status, 0) for status in ("success", "skipped", "failed")}
+            ))
+            return
+        
+        groups = {}
+        for group, status, count in self.apply_stats.breakdown(by, since_day):
+            groups.setdefault(group, {})[status] = count
+        for group, counts in sorted(groups.items()):
+            self.output.write({
+                by: group,
+                "total": sum(counts.values()),
+                "success": counts.get("success", 0),
+                "skipped": counts.get("skipped", 0),
+                "failed": counts.get("failed", 0),
+            })
+    
+    @traced("JobBot.show_breakdown", "render")
+    def show_breakdown(self, by, since_day, limit):
+        """Table of outcomes per platform, company, day or status"""
+        from collections import Counter
+        from rich.table import Table
+        
+        groups = {}
+        for group, status, count in self.apply_stats.breakdown(by, since_day):
+            groups.setdefault(group, Counter())[status] += count
+        if by == "day":
+            rows = sorted(groups.items(), reverse=True)
+        else:
+            rows = sorted(groups.items(), key=lambda item: (-sum(item[1].values()), item[0] or ""))
+        
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column(by.title(), style="cyan")
+        table.add_column("Total", justify="right")
+        table.add_column("Successful", justify="right", style="green")
+        table.add_column("Skipped", justify="right", style="yellow")
+        table.add_column("Failed", justify="right", style="red")
+        table.add_column("Success Rate", justify="right")
+        for group, counts in rows[:limit]:
+            total = sum(counts.values())
+            table.add_row(
+                group or "N/A",
+                str(total),
+                str(counts.get("success", 0)),
+                str(counts.get("skipped", 0)),
+                str(counts.get("failed", 0)),
+                f"{100 * counts.get('success', 0) / total:.0f}%"
+            )
+        console.print(table)
+        if len(rows) > limit:
+            console.print(f"[dim]... and {len(rows) - limit} more (use --limit to show more)[/dim]")
+    
+    @traced("JobBot.sync_stats")
+    def sync_stats(self):
+        """Rebuild the local rollups from the backend's application history"""
+        import requests
+        
+        try:
+            response = self.client.get("/api/applications")
+        except requests.exceptions.ConnectionError:
+            console.print("[red]✗[/red] Cannot connect to backend server!")
+            return False
+        if response.status_code != 200:
+            console.print(f"[red]Error fetching applications: {response.status_code}[/red]")
+            return False
+        
+        counted = self.apply_stats.rebuild(decode(response).get("applications", []))
+        console.print(f"[green]✓[/green] Imported {counted} application(s) from the backend")
+        return True
     
     def configure(self):
         """Interactive configuration"""
         console.print("\n[bold]Configuration Setup[/bold]\n")
+        changes = {}
         
         keywords = console.input(f"Job keywords [{self.config['keywords']}]: ").strip()
         if keywords:
-            self.config['keywords'] = keywords
+            changes['keywords'] = keywords
         
         location = console.input(f"Location [{self.config['location']}]: ").strip()
         if location:
-            self.config['location'] = location
+            changes['location'] = location
         
         resume = console.input(f"Resume path [{self.config.get('resume_path', 'None')}]: ").strip()
         if resume:
-            self.config['resume_path'] = resume
+            changes['resume_path'] = resume
         
         limit = console.input(f"Daily limit [{self.config['daily_limit']}]: ").strip()
         if limit and limit.isdigit():
-            self.config['daily_limit'] = int(limit)
+            changes['daily_limit'] = int(limit)
+        
+        self.save_config(changes)
+    
+    @traced("JobBot.load_test")
+    def load_test(self, rates, duration=10, targets=("search",), max_in_flight=64, timeout=10):
+        """Drive an open-loop request rate at the backend and report how it held up"""
+        from http_client import ApiClient
+        from loadtest import TARGETS, parse_mix, run_load_step
+        
+        try:
+            plan = parse_mix(targets)
+        except ValueError as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        if duration <= 0 or max_in_flight < 1 or any(rate <= 0 for rate in rates):
+            console.print("[red]Error: rates, --duration and --max-in-flight must be positive[/red]")
+            return
         
-        self.save_config()
+        # A client of its own: no retries, so every 429/5xx is counted, and a
+        # connection per request in flight
+        client = ApiClient(
+            self.api_url,
+            timeouts={path: timeout for _, path in TARGETS.values()},
+            retries=0,
+            pool_size=max_in_flight
+        )
+        bodies = {"search": {
+            "keywords": self.config["keywords"],
+            "location": self.config["location"],
+            "platforms": self.config["platforms"]
+        }}
+        mix = ", ".join(f"{name} ×{plan.count(name)}" for name in dict.fromkeys(plan))
+        console.print(f"\n[bold]Load test against {self.api_url}[/bold] [dim]({mix} per {len(plan)} requests)[/dim]\n")
+        
+        steps = []
+        try:
+            for rate in rates:
+                console.print(f"[dim]{rate:g} req/s for {duration:g}s...[/dim]")
+                result = run_load_step(client, plan, rate, duration, bodies, max_in_flight)
+                steps.append(result)
+                if self.output:
+                    self.output.write(result.to_dict())
+        except KeyboardInterrupt:
+            console.print("[yellow]Interrupted[/yellow]")
+        finally:
+            client.close()
+        if steps and not self.output:
+            self.show_load_results(steps)
+    
+    @traced("JobBot.show_load_results", "render")
+    def show_load_results(self, steps):
+        """Summary, error breakdown and latency histogram per load step"""
+        from rich.table import Table
+        
+        def ms(value):
+            return "-" if value is None else f"{value:.1f}"
+        
+        summary = Table(show_header=True, header_style="bold magenta", title="Throughput")
+        for column in ("Rate", "Sent", "OK", "Errors", "OK/s", "p50 ms", "p90 ms", "p99 ms", "Max ms"):
+            summary.add_column(column, justify="right")
+        for step in steps:
+            errors = sum(step.errors.values())
+            summary.add_row(
+                f"{step.rate:g}/s",
+                str(step.sent),
+                str(step.ok),
+                f"[red]{errors}[/red]" if errors else "0",
+                f"{step.throughput:.1f}",
+                ms(step.percentile(50)),
+                ms(step.percentile(90)),
+                ms(step.percentile(99)),
+                ms(max(step.latencies) if step.latencies else None)
+            )
+        console.print(summary)
+        
+        for step in steps:
+            if step.errors:
+                breakdown = ", ".join(f"{outcome} ×{count}" for outcome, count in step.errors.items())
+                console.print(f"[red]✗[/red] {step.rate:g}/s: {breakdown}")
+        
+        # Only the buckets between the fastest and slowest response
+        histograms = [step.histogram() for step in steps]
+        used = [i for i in range(len(histograms[0])) if any(h[i][1] for h in histograms)]
+        if not used:
+            return
+        table = Table(show_header=True, header_style="bold magenta", title="Latency")
+        table.add_column("Latency", style="dim")
+        for step in steps:
+            table.add_column(f"{step.rate:g}/s", justify="right")
+            table.add_column("", style="cyan")
+        for i in range(used[0], used[-1] + 1):
+            row = [histograms[0][i][0]]
+            for step, histogram in zip(steps, histograms):
+                count = histogram[i][1]
+                share = count / len(step.latencies) if step.latencies else 0
+                row += [str(count), "█" * round(share * 20)]
+            table.add_row(*row)
+        with span("render histogram", "render"):
+            console.print(table)
     
     def show_config(self):
         """Display current configuration"""
+        if self.output:
+            self.output.write(self.config)
+            return
+        
+        from rich.panel import Panel
+        
         panel = Panel(
             f"""
 [bold cyan]Keywords:[/bold cyan] {self.config['keywords']}
@@ -266,54 +1448,470 @@ class JobBot:
 [bold cyan]Platforms:[/bold cyan] {', '.join(self.config['platforms'])}
 [bold cyan]Resume Path:[/bold cyan] {self.config.get('resume_path', 'Not set')}
 [bold cyan]Daily Limit:[/bold cyan] {self.config['daily_limit']}
+[bold cyan]Profiles:[/bold cyan] {', '.join(self.config.get('profiles') or {}) or 'None'}
             """,
             title="⚙️  Current Configuration",
             border_style="cyan"
         )
         console.print(panel)
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Job Application Bot - Automate your job search",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+EPILOG = """
 Examples:
   %(prog)s search                          # Search for jobs
   %(prog)s search -k "Python Developer"    # Search with custom keywords
+  %(prog)s search -k "Python" "Go" -l "Remote" "Berlin"  # 4 searches in parallel
+  %(prog)s search -f queries.txt           # One "keywords | location" per line
+  %(prog)s search --new                    # Only jobs the last run did not return
+  %(prog)s search --all-profiles           # Every profile in the config, shared searches once
+  %(prog)s search --exclude-company Acme --title-regex "backend|platform"
+  %(prog)s filter --include python --min-salary 120000  # Rank stored jobs offline
+  %(prog)s results --page 3 --sort company  # Page through the last search
+  %(prog)s results --at 731 --browse       # Jump to job #731 and keep paging
   %(prog)s apply                           # Apply to all found jobs
   %(prog)s apply -i 1 2 3                  # Apply to specific jobs
+  %(prog)s apply -b 10 -c 4                # Apply in chunks of 10, 4 at a time
+  %(prog)s apply --queue                   # Queue jobs for paced applying
+  %(prog)s apply --drain                   # Send queued jobs within the limits
+  %(prog)s apply --resume                  # Finish an interrupted apply run
   %(prog)s stats                           # Show statistics
+  %(prog)s stats --by platform --since 7d  # Last week per platform, offline
+  %(prog)s loadtest --rate 10 50 100 --target search monitor-status:4
   %(prog)s config                          # Configure settings
-        """
+  %(prog)s monitor add -k "DevOps" -l "Remote" --auto-apply
+  %(prog)s monitor status                  # Real-time monitor commands
+  %(prog)s daemon &                        # Keep a warm process on a socket
+  %(prog)s --socket ~/.job-bot.sock search # Run a command in the daemon
+  %(prog)s repl                            # Interactive shell
+  %(prog)s --trace search.json search      # Time HTTP/decode/render/persist spans
+  %(prog)s search --output ndjson | jq .url  # Records on stdout, messages on stderr
+"""
+
+# Commands that need a terminal or would start another server
+LOCAL_ONLY_COMMANDS = ('config', 'daemon', 'repl')
+
+def build_parser():
+    """Build the parser for every job-bot subcommand"""
+    from job_bot_monitor import MONITOR_EPILOG, add_monitor_arguments
+    from output import add_output_argument
+    from tracing import add_trace_arguments
+    
+    parser = argparse.ArgumentParser(
+        description="Job Application Bot - Automate your job search",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
     )
+    parser.add_argument('--api-url',
+                       default=os.environ.get("JOB_BOT_API_URL", "http://localhost:5000"),
+                       help='Backend URL (default: $JOB_BOT_API_URL or http://localhost:5000)')
+    parser.add_argument('--socket',
+                       default=os.environ.get("JOB_BOT_SOCKET"),
+                       help='Daemon socket: run commands there if a daemon is listening '
+                            '(default: $JOB_BOT_SOCKET)')
+    add_trace_arguments(parser)
+    add_output_argument(parser)
+    
+    # Lets --api-url also follow the subcommand without overriding the global value
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--api-url', default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    add_trace_arguments(common, hidden=True)
+    add_output_argument(common, hidden=True)
+    
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+    
+    # Client-side filter rules, added to the "filters" in the config file
+    filtering = argparse.ArgumentParser(add_help=False)
+    filtering.add_argument('--include',
+                       nargs='+',
+                       help='Keep only jobs mentioning one of these terms')
+    filtering.add_argument('--exclude',
+                       nargs='+',
+                       help='Drop jobs mentioning any of these terms')
+    filtering.add_argument('--exclude-company',
+                       nargs='+',
+                       help='Drop jobs from these companies')
+    filtering.add_argument('--title-regex',
+                       help='Keep only jobs whose title matches this regex')
+    filtering.add_argument('--min-salary',
+                       type=int,
+                       help='Drop jobs listing a salary below this')
+    filtering.add_argument('--no-filters',
+                       action='store_true',
+                       help='Ignore the filters in the config file')
+    
+    search = commands.add_parser('search', parents=[common, filtering], help='Search for jobs')
+    search.add_argument('-k', '--keywords', 
+                       nargs='+',
+                       help='Job search keywords (several phrases run in parallel)')
+    search.add_argument('-l', '--location', 
+                       nargs='+',
+                       help='Job location (several locations run in parallel)')
+    search.add_argument('-f', '--queries-file',
+                       help='File of "keywords | location" lines to search in parallel')
+    search.add_argument('--refresh',
+                       action='store_true',
+                       help='Ignore cached search results and query the backend')
+    search.add_argument('--stream',
+                       action='store_true',
+                       help='Show and save search results incrementally as they arrive')
+    search.add_argument('-c', '--concurrency',
+                       type=int,
+                       help='Searches in flight for multi-query search')
+    search.add_argument('--new',
+                       action='store_true',
+                       help='Only fetch and show jobs that earlier runs of the same search did not return')
+    search.add_argument('--full',
+                       action='store_true',
+                       help='Show every result even if "incremental_search" is on in the config')
+    search.add_argument('--profiles',
+                       nargs='+',
+                       metavar='NAME',
+                       help='Search for these named profiles from the config')
+    search.add_argument('--all-profiles',
+                       action='store_true',
+                       help='Search for every profile in the config, fetching shared searches once')
     
-    parser.add_argument('command', 
-                       choices=['search', 'apply', 'stats', 'config', 'show-config'],
-                       help='Command to execute')
-    parser.add_argument('-k', '--keywords', 
-                       help='Job search keywords')
-    parser.add_argument('-l', '--location', 
-                       help='Job location')
-    parser.add_argument('-i', '--indices', 
+    apply = commands.add_parser('apply', parents=[common, filtering], help='Apply to found jobs')
+    apply.add_argument('-i', '--indices', 
                        nargs='+', 
                        type=int,
                        help='Job indices to apply to')
+    apply.add_argument('--ids',
+                       nargs='+',
+                       help='Stable job IDs (from the ID column) to apply to')
+    apply.add_argument('-b', '--batch-size',
+                       type=int,
+                       help='Apply in chunks of this many jobs, streaming results')
+    apply.add_argument('-c', '--concurrency',
+                       type=int,
+                       help='Number of apply chunks in flight (with --batch-size)')
+    apply.add_argument('--queue',
+                       action='store_true',
+                       help='Queue the selected jobs instead of applying now')
+    apply.add_argument('--drain',
+                       action='store_true',
+                       help='Send queued jobs, paced per platform and within the daily limit')
+    apply.add_argument('--max',
+                       type=int,
+                       help='Send at most this many queued jobs (with --drain)')
+    apply.add_argument('--resume',
+                       action='store_true',
+                       help='Finish an interrupted apply run, skipping jobs already submitted')
     
-    args = parser.parse_args()
+    filter_jobs = commands.add_parser('filter', parents=[common, filtering],
+                                      help='Filter and rank stored jobs without searching')
+    filter_jobs.add_argument('--limit',
+                       type=int,
+                       default=50,
+                       help='Number of top-ranked jobs to show')
     
-    bot = JobBot()
-    bot.show_banner()
+    results = commands.add_parser('results', parents=[common],
+                                  help='Page through the last search results')
+    results.add_argument('--page',
+                       type=int,
+                       default=1,
+                       help='Page to show (default: 1)')
+    results.add_argument('--page-size',
+                       type=int,
+                       help='Jobs per page (default: "page_size" in the config, 50)')
+    results.add_argument('--sort',
+                       choices=['title', 'company', 'location', 'platform'],
+                       help='Order the pages by this field; # keeps the apply -i index')
+    results.add_argument('--desc',
+                       action='store_true',
+                       help='Sort descending')
+    results.add_argument('--at',
+                       type=int,
+                       metavar='N',
+                       help='Jump to the page holding job #N')
+    results.add_argument('--browse',
+                       action='store_true',
+                       help='Page interactively (n/p, page number, g N, s FIELD, q)')
+    
+    stats = commands.add_parser('stats', parents=[common], help='Show statistics')
+    stats.add_argument('--by',
+                       choices=['platform', 'company', 'day', 'status'],
+                       help='Break the numbers down by this field')
+    stats.add_argument('--since',
+                       help='Only count applications from this period (e.g. 7d, 2w, today, 2024-05-01)')
+    stats.add_argument('--limit',
+                       type=int,
+                       default=20,
+                       help='Number of rows to show with --by')
+    stats.add_argument('--sync',
+                       action='store_true',
+                       help="Rebuild the local numbers from the backend's application history")
+    loadtest = commands.add_parser('loadtest', parents=[common],
+                                   help='Measure how much request load the backend sustains')
+    loadtest.add_argument('--rate',
+                       type=float,
+                       nargs='+',
+                       default=[10],
+                       help='Requests started per second; several values run one step each '
+                            '(e.g. 10 50 100)')
+    loadtest.add_argument('--duration',
+                       type=float,
+                       default=10,
+                       help='Seconds per step (default: 10)')
+    loadtest.add_argument('--target',
+                       nargs='+',
+                       default=['search'],
+                       metavar='NAME[:WEIGHT]',
+                       help='Requests to send: search, monitor-status, monitor-list '
+                            '(e.g. search:1 monitor-status:4)')
+    loadtest.add_argument('--max-in-flight',
+                       type=int,
+                       default=64,
+                       help='Requests allowed in flight; more are dropped and counted (default: 64)')
+    loadtest.add_argument('--timeout',
+                       type=float,
+                       default=10,
+                       help='Read timeout per request in seconds (default: 10)')
+    commands.add_parser('config', parents=[common], help='Configure settings')
+    commands.add_parser('show-config', parents=[common], help='Show current settings')
+    
+    monitor = commands.add_parser(
+        'monitor',
+        parents=[common],
+        help='Real-time job monitor commands',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=MONITOR_EPILOG
+    )
+    add_monitor_arguments(monitor)
+    
+    commands.add_parser('daemon', parents=[common],
+                        help='Serve commands from a warm process on a Unix socket')
+    commands.add_parser('repl', parents=[common],
+                        help='Interactive shell that keeps connections and config warm')
+    return parser
+
+def command_filters(args):
+    """Filter rules given on the command line"""
+    return {
+        "include": args.include,
+        "exclude": args.exclude,
+        "exclude_companies": args.exclude_company,
+        "title_regex": args.title_regex,
+        "min_salary": args.min_salary,
+    }
+
+def command_name(args):
+    """Words naming the command, e.g. 'monitor list'"""
+    return " ".join(filter(None, (args.command, getattr(args, 'monitor_command', None))))
+
+def needs_terminal(args):
+    """True for commands that prompt or redraw the screen, which a daemon cannot serve"""
+    return (args.command == 'config'
+            or getattr(args, 'monitor_command', None) == 'watch'
+            or (args.command == 'results' and args.browse))
+
+def run_command(bot, args, monitor=None):
+    """Dispatch a parsed command to the bot"""
+    if hasattr(args, 'no_filters'):
+        if not bot.set_filters(command_filters(args), use_config=not args.no_filters):
+            return
     
     if args.command == 'search':
-        bot.search_jobs(args.keywords, args.location)
+        from job_search import build_queries, load_queries
+        
+        incremental = (args.new or bot.config.get("incremental_search", False)) and not args.full
+        if args.profiles or args.all_profiles:
+            if args.keywords or args.location or args.queries_file:
+                console.print("[red]Error: profile searches come from the config; "
+                              "drop -k, -l and -f[/red]")
+            else:
+                bot.search_profiles(args.profiles, args.concurrency or 4, args.refresh, incremental)
+            return
+        queries = []
+        if args.queries_file:
+            queries = load_queries(args.queries_file, bot.config["location"])
+        if args.keywords or args.location or not queries:
+            queries += build_queries(
+                args.keywords or [bot.config["keywords"]],
+                args.location or [bot.config["location"]]
+            )
+        queries = list(dict.fromkeys(queries))
+        if len(queries) > 1:
+            bot.search_many(queries, args.concurrency or 4, args.refresh, incremental)
+        elif queries and args.stream:
+            bot.stream_search(*queries[0], batch_size=bot.config.get("stream_batch_size", 200),
+                              incremental=incremental)
+        elif queries:
+            bot.search_jobs(*queries[0], refresh=args.refresh, incremental=incremental)
     elif args.command == 'apply':
-        bot.apply_to_jobs(args.indices)
+        if args.drain:
+            bot.drain_queue(args.max)
+        else:
+            bot.apply_to_jobs(args.indices, args.batch_size, args.concurrency, args.ids,
+                              queue=args.queue, resume=args.resume)
+    elif args.command == 'filter':
+        bot.filter_history(args.limit)
+    elif args.command == 'results':
+        bot.show_results(args.page, args.sort, args.desc, args.at, args.page_size, args.browse)
     elif args.command == 'stats':
-        bot.show_stats()
+        bot.show_stats(args.by, args.since, args.sync, args.limit)
+    elif args.command == 'loadtest':
+        bot.load_test(args.rate, args.duration, args.target, args.max_in_flight, args.timeout)
     elif args.command == 'config':
         bot.configure()
     elif args.command == 'show-config':
         bot.show_config()
+    elif args.command == 'monitor':
+        from job_bot_monitor import MonitorCLI, run_monitor_command
+        
+        run_monitor_command(monitor or MonitorCLI(bot.api_url), args)
+
+def run_output_command(bot, args, monitor=None):
+    """run_command, streaming records to stdout when --output is given"""
+    import job_bot_monitor
+    from output import run_with_output
+    
+    targets = [target for target in (bot, monitor) if target is not None]
+    return run_with_output(args, lambda: run_command(bot, args, monitor), targets,
+                           [sys.modules[__name__], job_bot_monitor])
+
+class CommandSession:
+    """Warm JobBot/MonitorCLI instances reused by the repl and daemon"""
+    
+    def __init__(self):
+        self.parser = build_parser()
+        self.bots = {}
+        self.monitors = {}
+    
+    def execute(self, argv, banner=False, interactive=True):
+        """Parse and run one command line; returns its exit code"""
+        from job_bot_monitor import MonitorCLI, show_monitor_banner, writes_to_stdout
+        from tracing import run_traced
+        
+        try:
+            args = self.parser.parse_args(argv)
+        except SystemExit as e:
+            return e.code or 0
+        
+        if args.command in ('daemon', 'repl') or (needs_terminal(args) and not interactive):
+            console.print(f"[red]'{args.command}' cannot run here[/red]")
+            return 2
+        
+        if args.api_url not in self.bots:
+            self.bots[args.api_url] = JobBot(args.api_url)
+            self.monitors[args.api_url] = MonitorCLI(args.api_url)
+        bot = self.bots[args.api_url]
+        bot.refresh_config()
+        
+        if banner and args.command == 'monitor':
+            if not writes_to_stdout(args):
+                show_monitor_banner()
+        elif banner and not args.output:
+            bot.show_banner()
+        try:
+            run_traced(command_name(args), args,
+                       lambda: run_output_command(bot, args, self.monitors[args.api_url]))
+        except SystemExit as e:
+            return e.code or 0
+        except Exception as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            return 1
+        return 0
+    
+    def execute_captured(self, argv, color=False, width=None):
+        """Run a command with all console output captured; returns (output, exit_code)"""
+        import io
+        import contextlib
+        import job_bot_monitor
+        global console
+        
+        buffer = io.StringIO()
+        saved = console, job_bot_monitor.console
+        console = job_bot_monitor.console = Console(
+            file=buffer, force_terminal=color, width=width
+        )
+        try:
+            with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+                code = self.execute(argv, banner=True, interactive=False)
+        finally:
+            console, job_bot_monitor.console = saved
+        return buffer.getvalue(), code
+    
+    def repl(self):
+        """Read commands interactively until exit"""
+        import shlex
+        
+        console.print("[dim]Type a command (e.g. 'search -k Python'), 'help' or 'exit'[/dim]\n")
+        while True:
+            try:
+                line = console.input("[bold cyan]job-bot>[/bold cyan] ").strip()
+            except (EOFError, KeyboardInterrupt):
+                console.print()
+                return
+            if line in ('exit', 'quit'):
+                return
+            if line == 'help':
+                self.parser.print_help()
+                continue
+            try:
+                argv = shlex.split(line)
+            except ValueError as e:
+                console.print(f"[red]Error: {str(e)}[/red]")
+                continue
+            if argv:
+                self.execute(argv)
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    
+    # Traces and profiles describe this process, and the daemon returns stdout
+    # and stderr as one stream, so those runs and --output runs stay local;
+    # so do prompts and live screens, which need this terminal
+    local = args.trace or args.profile or args.output or needs_terminal(args)
+    if args.socket and args.command not in LOCAL_ONLY_COMMANDS and not local:
+        from daemon import early_socket, forward
+        
+        # Commands early_socket() accepts were already offered to the daemon
+        code = None if early_socket(sys.argv[1:]) else forward(args.socket, sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
+    
+    if args.command == 'daemon':
+        from daemon import DEFAULT_SOCKET_PATH, serve
+        
+        socket_path = args.socket or DEFAULT_SOCKET_PATH
+        console.print(f"[green]✓[/green] Daemon listening on {socket_path} [dim](Ctrl+C to stop)[/dim]")
+        try:
+            serve(socket_path, CommandSession().execute_captured)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Daemon stopped[/yellow]")
+        except RuntimeError as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            sys.exit(1)
+        return
+    
+    if args.command == 'repl':
+        JobBot(args.api_url).show_banner()
+        CommandSession().repl()
+        return
+    
+    try:
+        from tracing import run_traced
+        
+        if args.command == 'monitor':
+            from job_bot_monitor import MonitorCLI, show_monitor_banner, writes_to_stdout
+            
+            if not writes_to_stdout(args):
+                show_monitor_banner()
+            monitor = MonitorCLI(args.api_url)
+            run_traced(command_name(args), args,
+                       lambda: run_output_command(None, args, monitor))
+        else:
+            bot = JobBot(args.api_url)
+            if not args.output:
+                bot.show_banner()
+            run_traced(command_name(args), args, lambda: run_output_command(bot, args))
+    except ImportError as e:
+        console.print(f"[red]Missing dependency: {e.name or e}[/red]")
+        console.print("[yellow]Install the CLI requirements:[/yellow]")
+        console.print(f"  {sys.executable} -m pip install -r {Path(__file__).parent / 'requirements.txt'}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
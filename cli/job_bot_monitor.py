@@ -4,21 +4,36 @@ Job Application Bot - Monitor Extension for CLI
 Real-time job monitoring commands
 """
 
-import requests
+import os
+import sys
+
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import print as rprint
+
+from tracing import decode, span, traced
 
 console = Console()
 
 class MonitorCLI:
     def __init__(self, api_url="http://localhost:5000"):
         self.api_url = api_url
+        self._client = None
+        # Record writer set while a command runs with --output
+        self.output = None
     
+    @property
+    def client(self):
+        """Pooled backend client, created on first use"""
+        if self._client is None:
+            from http_client import get_client
+            self._client = get_client(self.api_url)
+        return self._client
+    
+    @traced("MonitorCLI.add_watch")
     def add_watch(self, keywords, location, platforms=None, auto_apply=True, 
                   email=None, resume=None, remote=False, min_salary=None):
         """Add a new watch criteria"""
+        from rich.panel import Panel
+        
         data = {
             "keywords": keywords,
             "location": location,
@@ -35,15 +50,17 @@ class MonitorCLI:
             data["minSalary"] = min_salary
         
         try:
-            response = requests.post(
-                f"{self.api_url}/api/monitor/watch",
-                json=data,
-                timeout=10
+            response = self.client.post(
+                "/api/monitor/watch",
+                json=data
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = decode(response)
                 watch = result.get("watchItem", {})
+                if self.output:
+                    self.output.write(watch)
+                    return
                 
                 console.print("\n[green]✓[/green] Watch criteria added successfully!\n")
                 
@@ -66,17 +83,20 @@ class MonitorCLI:
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
     
+    @traced("MonitorCLI.list_watches")
     def list_watches(self):
         """List all watch criteria"""
+        from rich.table import Table
+        
         try:
-            response = requests.get(
-                f"{self.api_url}/api/monitor/watch",
-                timeout=10
-            )
+            response = self.client.get("/api/monitor/watch")
             
             if response.status_code == 200:
-                data = response.json()
+                data = decode(response)
                 watches = data.get("watchList", [])
+                if self.output:
+                    self.output.write_many(watches)
+                    return
                 
                 if not watches:
                     console.print("\n[yellow]No watch criteria configured[/yellow]")
@@ -107,37 +127,134 @@ class MonitorCLI:
                         status
                     )
                 
-                console.print(table)
+                with span("render watches", "render", rows=len(watches)):
+                    console.print(table)
                 console.print()
             else:
                 console.print(f"[red]Error: {response.status_code}[/red]")
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
     
+    @traced("MonitorCLI.remove_watch")
     def remove_watch(self, watch_id):
         """Remove a watch criteria"""
         try:
-            response = requests.delete(
-                f"{self.api_url}/api/monitor/watch/{watch_id}",
-                timeout=10
-            )
+            response = self.client.delete(f"/api/monitor/watch/{watch_id}")
             
             if response.status_code == 200:
+                if self.output:
+                    self.output.write({"id": watch_id, "removed": True})
+                    return
                 console.print(f"\n[green]✓[/green] Watch {watch_id} removed successfully\n")
             else:
                 console.print(f"[red]Error: {response.status_code}[/red]")
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
     
+    @traced("MonitorCLI.fetch_watches")
+    def fetch_watches(self):
+        """Current watch list from the backend"""
+        response = self.client.get("/api/monitor/watch")
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+        return decode(response).get("watchList", [])
+    
+    @traced("MonitorCLI.export_watches")
+    def export_watches(self, path=None, fmt=None):
+        """Write the watch list to a file, or stdout when no path is given"""
+        from watch_sync import detect_format, dump_watches, watch_rows
+        
+        try:
+            watches = self.fetch_watches()
+            if path in (None, "-") and self.output:
+                self.output.write_many(watch_rows(watches))
+                return
+            if path in (None, "-"):
+                dump_watches(watches, sys.stdout, fmt or "json")
+                return
+            with open(path, "w", newline="") as f:
+                dump_watches(watches, f, detect_format(path, fmt))
+            console.print(f"\n[green]✓[/green] Exported {len(watches)} watches to {path}\n")
+        except Exception as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+    
+    @traced("MonitorCLI.import_watches")
+    def import_watches(self, path, fmt=None, keep_existing=False, dry_run=False,
+                       concurrency=8):
+        """Sync the backend watch list to match a file, sending only the differences"""
+        from watch_sync import diff_watches, load_watches, sync_watches
+        
+        try:
+            desired = load_watches(path, fmt)
+            to_add, to_remove = diff_watches(desired, self.fetch_watches())
+        except Exception as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        if keep_existing:
+            to_remove = []
+        
+        unchanged = len(desired) - len(to_add)
+        console.print(
+            f"\n[bold]{path}:[/bold] {len(desired)} watches "
+            f"([green]+{len(to_add)}[/green] / [red]-{len(to_remove)}[/red] / {unchanged} unchanged)\n"
+        )
+        for watch in to_add:
+            console.print(f"  [green]+[/green] {watch['keywords']} in {watch['location']}")
+        for watch in to_remove:
+            console.print(f"  [red]-[/red] {watch.get('keywords')} in {watch.get('location')} [dim]({watch.get('id')})[/dim]")
+        
+        if dry_run or not (to_add or to_remove):
+            if self.output:
+                self.output.write_many(self.change_record("remove", w) for w in to_remove)
+                self.output.write_many(self.change_record("add", w) for w in to_add)
+            console.print("\n[dim]Nothing sent[/dim]\n" if dry_run else "[green]✓[/green] Already in sync\n")
+            return
+        
+        errors = []
+        
+        def on_done(action, watch, error):
+            if self.output:
+                self.output.write(self.change_record(action, watch, sent=True, error=error))
+            if error:
+                errors.append(f"{action} {watch.get('keywords')} in {watch.get('location')}: {error}")
+        
+        try:
+            failed = sync_watches(self.client, to_add, to_remove, concurrency=concurrency,
+                                  on_done=on_done)
+        except Exception as e:
+            console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        
+        for error in errors:
+            console.print(f"[red]✗[/red] {error}")
+        done = len(to_add) + len(to_remove) - failed
+        style = "green" if not failed else "yellow"
+        console.print(f"\n[{style}]✓[/{style}] Applied {done} changes ({failed} failed)\n")
+    
+    @staticmethod
+    def change_record(action, watch, sent=False, error=None):
+        """One import change as an output record"""
+        return {
+            "action": action,
+            "keywords": watch.get("keywords"),
+            "location": watch.get("location"),
+            "id": watch.get("id"),
+            "sent": sent,
+            "error": error,
+        }
+    
+    @traced("MonitorCLI.start_monitor")
     def start_monitor(self):
         """Start the job monitor"""
+        from rich.panel import Panel
+        
         try:
-            response = requests.post(
-                f"{self.api_url}/api/monitor/start",
-                timeout=10
-            )
+            response = self.client.post("/api/monitor/start")
             
             if response.status_code == 200:
+                if self.output:
+                    self.output.write({"monitoring": True})
+                    return
                 console.print("\n[green]✓[/green] Job monitor started successfully!\n")
                 
                 panel = Panel(
@@ -163,75 +280,138 @@ You'll receive email notifications when:
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
     
+    @traced("MonitorCLI.stop_monitor")
     def stop_monitor(self):
         """Stop the job monitor"""
         try:
-            response = requests.post(
-                f"{self.api_url}/api/monitor/stop",
-                timeout=10
-            )
+            response = self.client.post("/api/monitor/stop")
             
             if response.status_code == 200:
+                if self.output:
+                    self.output.write({"monitoring": False})
+                    return
                 console.print("\n[yellow]⏸️[/yellow] Job monitor stopped\n")
             else:
                 console.print(f"[red]Error: {response.status_code}[/red]")
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
     
-    def show_status(self):
-        """Show monitor status"""
-        try:
-            response = requests.get(
-                f"{self.api_url}/api/monitor/status",
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                status = data.get("status", {})
-                
-                is_running = status.get("isMonitoring", False)
-                status_emoji = "🟢" if is_running else "⏸️"
-                status_text = "Running" if is_running else "Stopped"
-                
-                panel = Panel(
-                    f"""
+    def status_panel(self, status, footer=""):
+        """Build the monitor status panel"""
+        from rich.panel import Panel
+        
+        is_running = status.get("isMonitoring", False)
+        status_emoji = "🟢" if is_running else "⏸️"
+        status_text = "Running" if is_running else "Stopped"
+        
+        return Panel(
+            f"""
 [bold cyan]Status:[/bold cyan] {status_emoji} {status_text}
 [bold cyan]Active Watches:[/bold cyan] {status.get('watchListCount', 0)}
 [bold cyan]Jobs Tracked:[/bold cyan] {status.get('seenJobsCount', 0)}
 [bold cyan]Check Interval:[/bold cyan] Every {status.get('checkIntervalMinutes', 0)} minutes
 [bold cyan]Today's Applications:[/bold cyan] {status.get('dailyApplicationCount', 0)} / {status.get('dailyLimit', 0)}
-                    """,
-                    title="📊 Monitor Status",
-                    border_style="cyan"
-                )
-                console.print(panel)
+{footer}""",
+            title="📊 Monitor Status",
+            border_style="cyan"
+        )
+    
+    @traced("MonitorCLI.show_status")
+    def show_status(self):
+        """Show monitor status"""
+        try:
+            response = self.client.get("/api/monitor/status")
+            
+            if response.status_code == 200:
+                data = decode(response)
+                if self.output:
+                    self.output.write(data.get("status", {}))
+                    return
+                with span("render status", "render"):
+                    console.print(self.status_panel(data.get("status", {})))
             else:
                 console.print(f"[red]Error: {response.status_code}[/red]")
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
 
-def main():
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description="Job Monitor - Real-time job watching and auto-apply",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+    def watch_status(self, interval=1.0):
+        """Live status dashboard that only redraws when something changes"""
+        import time
+        from contextlib import nullcontext
+        from datetime import datetime
+        from rich.live import Live
+        
+        etag = None
+        status = None
+        last_change = "waiting for first update..."
+        
+        def render(note=""):
+            footer = f"[dim]Last change: {last_change}{note}  •  Ctrl+C to exit[/dim]"
+            return self.status_panel(status or {}, footer)
+        
+        # With --output every change becomes a record instead of a redraw
+        live = None if self.output else Live(render(), console=console, auto_refresh=False)
+        
+        def show(note=""):
+            if live is not None:
+                live.update(render(note), refresh=True)
+            elif note:
+                console.print(note.replace("  •  ", "", 1))
+        
+        with live or nullcontext():
+            try:
+                while True:
+                    # Conditional GET over the pooled keep-alive connection:
+                    # an unchanged status costs a 304 with no body
+                    headers = {"If-None-Match": etag} if etag else {}
+                    try:
+                        response = self.client.get("/api/monitor/status", headers=headers)
+                    except Exception as e:
+                        show(f"  •  [red]{str(e)}[/red]")
+                        time.sleep(max(interval, 5))
+                        continue
+                    
+                    if response.status_code == 200:
+                        etag = response.headers.get("ETag")
+                        new_status = decode(response).get("status", {})
+                        if new_status != status:
+                            status = new_status
+                            last_change = datetime.now().strftime("%H:%M:%S")
+                            if self.output:
+                                self.output.write(status)
+                            show()
+                    elif response.status_code != 304:
+                        show(f"  •  [red]Error: {response.status_code}[/red]")
+                    
+                    time.sleep(interval)
+            except KeyboardInterrupt:
+                pass
+
+MONITOR_EPILOG = """
 Examples:
   %(prog)s add -k "Python Developer" -l "Remote" --auto-apply
   %(prog)s add -k "DevOps Engineer" -l "San Francisco" --email me@email.com
   %(prog)s list
   %(prog)s start
   %(prog)s status
+  %(prog)s watch --interval 2
   %(prog)s stop
   %(prog)s remove 1696789012345.678
-        """
-    )
-    
-    parser.add_argument('command', 
-                       choices=['add', 'list', 'remove', 'start', 'stop', 'status'],
+  %(prog)s export watches.yaml
+  %(prog)s import watches.yaml --dry-run
+  %(prog)s list --output csv > watches.csv
+"""
+
+def add_monitor_arguments(parser):
+    """Register the monitor command and its options on a parser"""
+    parser.add_argument('monitor_command', 
+                       metavar='command',
+                       choices=['add', 'list', 'remove', 'start', 'stop', 'status', 'watch',
+                                'import', 'export'],
                        help='Monitor command to execute')
+    parser.add_argument('target',
+                       nargs='?',
+                       help='Watch ID (for remove) or watch file (for import/export)')
     parser.add_argument('-k', '--keywords', 
                        help='Job search keywords')
     parser.add_argument('-l', '--location', 
@@ -255,14 +435,28 @@ Examples:
                        help='Minimum salary requirement')
     parser.add_argument('--watch-id', 
                        help='Watch ID to remove')
-    
-    args = parser.parse_args()
-    
-    monitor = MonitorCLI()
-    
-    console.print("\n[bold cyan]🤖 Job Application Bot - Monitor[/bold cyan]\n")
-    
-    if args.command == 'add':
+    parser.add_argument('--interval', 
+                       type=float,
+                       default=1.0,
+                       help='Seconds between status checks (for watch)')
+    parser.add_argument('--format',
+                       choices=['json', 'yaml', 'csv'],
+                       help='Watch file format (for import/export; default: from the extension)')
+    parser.add_argument('--keep-existing',
+                       action='store_true',
+                       help='Only add watches on import, never remove')
+    parser.add_argument('--dry-run',
+                       action='store_true',
+                       help='Show what import would change without sending it')
+    parser.add_argument('-c', '--concurrency',
+                       type=int,
+                       default=8,
+                       help='Requests in flight on import against older backends')
+
+def run_monitor_command(monitor, args):
+    """Dispatch a parsed monitor command"""
+    command = args.monitor_command
+    if command == 'add':
         if not args.keywords or not args.location:
             console.print("[red]Error: --keywords and --location are required[/red]")
             return
@@ -276,19 +470,66 @@ Examples:
             args.remote,
             args.min_salary
         )
-    elif args.command == 'list':
+    elif command == 'list':
         monitor.list_watches()
-    elif args.command == 'remove':
-        if not args.watch_id:
-            console.print("[red]Error: --watch-id is required[/red]")
+    elif command == 'remove':
+        watch_id = args.watch_id or args.target
+        if not watch_id:
+            console.print("[red]Error: a watch ID is required[/red]")
             return
-        monitor.remove_watch(args.watch_id)
-    elif args.command == 'start':
+        monitor.remove_watch(watch_id)
+    elif command == 'start':
         monitor.start_monitor()
-    elif args.command == 'stop':
+    elif command == 'stop':
         monitor.stop_monitor()
-    elif args.command == 'status':
+    elif command == 'status':
         monitor.show_status()
+    elif command == 'watch':
+        monitor.watch_status(args.interval)
+    elif command == 'export':
+        monitor.export_watches(args.target, args.format)
+    elif command == 'import':
+        if not args.target:
+            console.print("[red]Error: a watch file is required[/red]")
+            return
+        monitor.import_watches(args.target, args.format, args.keep_existing,
+                               args.dry_run, args.concurrency)
+
+def writes_to_stdout(args):
+    """True when the command's output is data (--output, or export without a file), not a report"""
+    if getattr(args, 'output', None):
+        return True
+    return args.monitor_command == 'export' and args.target in (None, '-')
+
+def show_monitor_banner():
+    console.print("\n[bold cyan]🤖 Job Application Bot - Monitor[/bold cyan]\n")
+
+def main():
+    import argparse
+    from output import add_output_argument, run_with_output
+    from tracing import add_trace_arguments, run_traced
+    
+    parser = argparse.ArgumentParser(
+        description="Job Monitor - Real-time job watching and auto-apply",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=MONITOR_EPILOG
+    )
+    add_monitor_arguments(parser)
+    parser.add_argument('--api-url',
+                       default=os.environ.get("JOB_BOT_API_URL", "http://localhost:5000"),
+                       help='Backend URL (default: $JOB_BOT_API_URL or http://localhost:5000)')
+    add_trace_arguments(parser)
+    add_output_argument(parser)
+    
+    args = parser.parse_args()
+    
+    monitor = MonitorCLI(args.api_url)
+    
+    if not writes_to_stdout(args):
+        show_monitor_banner()
+    run_traced(f"monitor {args.monitor_command}", args,
+               lambda: run_with_output(args, lambda: run_monitor_command(monitor, args),
+                                       [monitor], [sys.modules[__name__]]))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Job Filter
+Client-side include/exclude/regex/salary rules compiled once and applied in one pass
+"""
+
+import re
+import string
+
+from job_model import JobSet
+from job_search import normalize_text
+
+# Rule keys that hold term lists; the CLI appends to them instead of replacing
+LIST_RULES = ("include", "exclude", "exclude_companies")
+
+# Punctuation becomes a word break, except "+" and "#" (C++, C#) and the
+# "|" placed between fields so multi-word terms never span two fields
+_BREAKS = "".join(c for c in string.punctuation if c not in "+#|")
+_separators = str.maketrans(_BREAKS, " " * len(_BREAKS))
+
+_number = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([kK])?")
+
+
+def tokenize(text):
+    """Lowercased words of `text`"""
+    return (text or "").lower().translate(_separators).split()
+
+
+def normalize_term(term):
+    """Canonical spelling of a filter term, as reported by KeywordMatcher"""
+    return " ".join(tokenize(term))
+
+
+class KeywordMatcher:
+    """Keyword trie over words for whole-word include/exclude matching.
+
+    Single-word terms are found with one set intersection per text, and
+    the trie is only walked from words that start a multi-word term, so a
+    text is scanned once however many terms there are.
+    """
+
+    def __init__(self, terms):
+        self.terms = sorted({normalize_term(t) for t in terms} - {""})
+        self.single = {term for term in self.terms if " " not in term}
+        self.trie = {}
+        for term in self.terms:
+            if " " in term:
+                node = self.trie
+                for word in term.split(" "):
+                    node = node.setdefault(word, {})
+                node[None] = term
+
+    def _match(self, words):
+        found = self.single.intersection(words)
+        if self.trie and not self.trie.keys().isdisjoint(words):
+            for start, word in enumerate(words):
+                node = self.trie.get(word)
+                position = start + 1
+                while node:
+                    if None in node:
+                        found.add(node[None])
+                    if position == len(words):
+                        break
+                    node = node.get(words[position])
+                    position += 1
+        return found
+
+    def find(self, text):
+        """Set of terms occurring in `text`"""
+        return self._match(tokenize(text))
+
+    def find_all(self, texts):
+        """Sets of terms for many texts, lowercased and split in one go"""
+        joined = "\x00".join(texts).lower().translate(_separators).split("\x00")
+        if len(joined) != len(texts):
+            # A text contained the separator itself
+            return [self.find(text) for text in texts]
+        return [self._match(text.split()) for text in joined]
+
+
+def parse_salary(value):
+    """First amount in a salary string ("$120K - $150K" -> 120000), or None"""
+    if isinstance(value, (int, float)):
+        return value
+    if not isinstance(value, str):
+        return None
+    match = _number.search(value)
+    if not match:
+        return None
+    amount = float(match.group(1).replace(",", ""))
+    return amount * 1000 if match.group(2) else amount
+
+
+def merge_rules(base, extra):
+    """Layer command-line rules over the configured ones"""
+    rules = dict(base or {})
+    for key, value in (extra or {}).items():
+        if value in (None, [], ""):
+            continue
+        if key in LIST_RULES:
+            rules[key] = list(rules.get(key) or []) + list(value)
+        else:
+            rules[key] = value
+    return rules
+
+
+class JobFilter:
+    """Compiled filter/rank rules.
+
+    Rules (all optional):
+      include            terms of which at least one must appear
+      exclude            terms of which none may appear
+      exclude_companies  company names to drop (case-insensitive, exact)
+      title_regex        regex the title must match
+      exclude_title_regex  regex the title must not match
+      min_salary         drop jobs whose listed salary is below this
+      boost              {term: weight} added to the score when present
+
+    Terms are matched as whole words against title, company, location and
+    description. The score is the summed weight of the distinct include and
+    boost terms found (include terms weigh 1 unless boosted). Raises
+    ValueError for a rule that can't be used, e.g. an invalid regex.
+    """
+
+    def __init__(self, rules=None):
+        rules = rules or {}
+        self.rules = rules
+        self.include = {normalize_term(t) for t in rules.get("include") or []} - {""}
+        self.exclude = {normalize_term(t) for t in rules.get("exclude") or []} - {""}
+        self.weights = {term: 1.0 for term in self.include}
+        for term, weight in (rules.get("boost") or {}).items():
+            try:
+                self.weights[normalize_term(term)] = float(weight)
+            except (TypeError, ValueError):
+                raise ValueError(f"boost weight for {term!r} must be a number, not {weight!r}")
+        self.matcher = KeywordMatcher(self.include | self.exclude | set(self.weights))
+        self.exclude_companies = {normalize_text(c) for c in rules.get("exclude_companies") or []}
+        self.title_regex = self._compile(rules, "title_regex")
+        self.exclude_title_regex = self._compile(rules, "exclude_title_regex")
+        self.min_salary = self._amount(rules, "min_salary")
+
+    @staticmethod
+    def _compile(rules, name):
+        pattern = rules.get(name)
+        if not pattern:
+            return None
+        try:
+            return re.compile(pattern, re.IGNORECASE)
+        except (re.error, TypeError) as e:
+            raise ValueError(f"{name} {pattern!r} is not a valid regex: {e}")
+
+    @staticmethod
+    def _amount(rules, name):
+        value = rules.get(name)
+        if value in (None, ""):
+            return None
+        amount = parse_salary(value) if not isinstance(value, bool) else None
+        if amount is None:
+            raise ValueError(f"{name} must be an amount such as 120000 or \"120k\", not {value!r}")
+        return amount
+
+    @property
+    def active(self):
+        return bool(
+            self.matcher.terms or self.exclude_companies or self.title_regex
+            or self.exclude_title_regex or self.min_salary
+        )
+
+    def _value_checks(self):
+        """(field, predicate) pairs for the non-keyword rules, cheapest first.
+
+        Each predicate takes a single field value, so callers can evaluate
+        it once per distinct company/title/salary instead of once per job.
+        """
+        checks = []
+        if self.exclude_companies:
+            checks.append(("company", self._company_ok))
+        if self.title_regex or self.exclude_title_regex:
+            checks.append(("title", self._title_ok))
+        if self.min_salary:
+            checks.append(("salary", self._salary_ok))
+        return checks
+
+    def _company_ok(self, company):
+        return normalize_text(company) not in self.exclude_companies
+
+    def _title_ok(self, title):
+        title = title or ""
+        if self.title_regex and not self.title_regex.search(title):
+            return False
+        return not (self.exclude_title_regex and self.exclude_title_regex.search(title))
+
+    def _salary_ok(self, value):
+        salary = parse_salary(value)
+        return salary is None or salary >= self.min_salary
+
+    @staticmethod
+    def _value(job, field):
+        if field == "salary":
+            return job.get("salary") or job.get("salaryMin")
+        return job.get(field)
+
+    def _score(self, found):
+        if found & self.exclude:
+            return None
+        if self.include and not found & self.include:
+            return None
+        return sum(self.weights.get(term, 0.0) for term in found)
+
+    def score(self, job):
+        """Rank score for a job, or None when a rule rejects it"""
+        if not all(check(self._value(job, field)) for field, check in self._value_checks()):
+            return None
+        return self._score(self.matcher.find(self._text(job)))
+
+    @staticmethod
+    def _text(job):
+        return " | ".join((
+            job.get("title") or "", job.get("company") or "",
+            job.get("location") or "", job.get("description") or "",
+        ))
+
+    def _rank(self, items, text_of, rank, chunk_size=10000):
+        """Score `items` by their text; survivors best first.
+
+        Texts are built and scanned a chunk at a time so the temporary
+        strings and match sets never exist for the whole list at once.
+        """
+        scored = []
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            for item, terms in zip(chunk, self.matcher.find_all([text_of(i) for i in chunk])):
+                score = self._score(terms)
+                if score is not None:
+                    scored.append((score, item))
+        if rank:
+            scored.sort(key=lambda pair: -pair[0])
+        return [item for _, item in scored]
+
+    def select(self, jobs, rank=True):
+        """Jobs that pass every rule, best score first (ties keep their order).
+
+        A JobSet is filtered column by column and returned as a JobSet.
+        """
+        if isinstance(jobs, JobSet):
+            return jobs.take(self.select_rows(jobs, rank))
+        if not self.active:
+            return list(jobs)
+
+        candidates = list(jobs)
+        for field, check in self._value_checks():
+            answers = {}
+            kept = []
+            for job in candidates:
+                value = self._value(job, field)
+                try:
+                    ok = answers[value]
+                except KeyError:
+                    ok = answers[value] = check(value)
+                except TypeError:
+                    ok = check(value)
+                if ok:
+                    kept.append(job)
+            candidates = kept
+        if not self.matcher.terms:
+            return candidates
+        return self._rank(candidates, self._text, rank)
+
+    def select_rows(self, jobset, rank=True):
+        """Row numbers of a JobSet that pass every rule, best score first"""
+        rows = list(range(len(jobset)))
+        if not self.active:
+            return rows
+
+        columns = jobset.columns
+        extras = jobset.extras
+        for field, check in self._value_checks():
+            if field in columns:
+                # One check per distinct value, then a lookup per row
+                column = columns[field]
+                allowed = [check(value) for value in column.values]
+                codes = column.codes
+                rows = [row for row in rows if allowed[codes[row]]]
+            else:
+                answers = {}
+                kept = []
+                for row in rows:
+                    value = self._value(extras[row], field) if row in extras else None
+                    try:
+                        ok = answers[value]
+                    except KeyError:
+                        ok = answers[value] = check(value)
+                    except TypeError:
+                        ok = check(value)
+                    if ok:
+                        kept.append(row)
+                rows = kept
+        if not self.matcher.terms:
+            return rows
+
+        # Join the distinct strings once per row straight from the code arrays
+        title, company, location = columns["title"], columns["company"], columns["location"]
+        titles, companies, locations = (
+            [value or "" for value in column.values] for column in (title, company, location)
+        )
+        title_codes, company_codes, location_codes = title.codes, company.codes, location.codes
+
+        def text_of(row):
+            return (
+                f"{titles[title_codes[row]]} | {companies[company_codes[row]]} | "
+                f"{locations[location_codes[row]]} | "
+                f"{extras[row].get('description') or '' if row in extras else ''}"
+            )
+        return self._rank(rows, text_of, rank)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Job Records
+Compact job record and a columnar job set for large result sets
+"""
+
+import sys
+from array import array
+
+# Fields every scraper returns; anything else is kept in `extra`
+CORE_FIELDS = ("title", "company", "location", "platform", "url")
+
+# Low-cardinality fields stored once per distinct value
+CATEGORICAL_FIELDS = ("title", "company", "location", "platform")
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Job:
+    """One job posting with fixed fields instead of a per-job dict.
+
+    Supports the read-only dict interface (`get`, `[]`, `in`, `keys`) the
+    rest of the CLI uses, so it can be passed anywhere a job dict is read.
+    Use `to_dict()` before serializing.
+    """
+
+    __slots__ = ("id", "title", "company", "location", "platform", "url", "extra")
+
+    def __init__(self, title=None, company=None, location=None, platform=None,
+                 url=None, id=None, extra=None):
+        self.id = id
+        self.title = _intern(title)
+        self.company = _intern(company)
+        self.location = _intern(location)
+        self.platform = _intern(platform)
+        self.url = url
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {k: v for k, v in data.items() if k not in CORE_FIELDS and k != "id"}
+        return cls(data.get("title"), data.get("company"), data.get("location"),
+                   data.get("platform"), data.get("url"), data.get("id"), extra)
+
+    def get(self, key, default=None):
+        if key in CORE_FIELDS or key == "id":
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None and key not in self:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        if key in CORE_FIELDS or key == "id":
+            return getattr(self, key) is not None
+        return bool(self.extra) and key in self.extra
+
+    def keys(self):
+        return [key for key in CORE_FIELDS + ("id",) if getattr(self, key) is not None] + \
+            list(self.extra or ())
+
+    def to_dict(self):
+        """Plain dict in the backend's job format"""
+        data = {key: getattr(self, key) for key in CORE_FIELDS if getattr(self, key) is not None}
+        if self.extra:
+            data.update(self.extra)
+        if self.id is not None:
+            data["id"] = self.id
+        return data
+
+    def __repr__(self):
+        return f"Job(id={self.id!r}, title={self.title!r}, company={self.company!r})"
+
+
+class _Column:
+    """Dictionary-encoded column: an int array of codes into a value table"""
+
+    __slots__ = ("codes", "values", "lookup")
+
+    def __init__(self):
+        self.codes = array("I")
+        self.values = []
+        self.lookup = {}
+
+    def append(self, value):
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def sort_ranks(self):
+        """Code -> position of its value in sorted order (None sorts first)"""
+        order = sorted(range(len(self.values)),
+                       key=lambda code: (self.values[code] is not None, self.values[code] or ""))
+        ranks = array("I", bytes(4 * len(order)))
+        for rank, code in enumerate(order):
+            ranks[code] = rank
+        return ranks
+
+
+class JobSet:
+    """Column-oriented collection of jobs for bulk work on large result sets.
+
+    Titles, companies, locations and platforms are dictionary-encoded (one
+    copy of each distinct string plus a 4-byte code per row), IDs and URLs
+    are plain lists, and the rare non-core fields live in a sparse mapping.
+    Rows are materialized as `Job` objects only when iterated or indexed.
+    """
+
+    def __init__(self, jobs=()):
+        self.columns = {field: _Column() for field in CATEGORICAL_FIELDS}
+        self.ids = []
+        self.urls = []
+        self.extras = {}
+        self.extend(jobs)
+
+    def append(self, job):
+        """Add a job dict or Job"""
+        get = job.get
+        row = len(self.ids)
+        for field, column in self.columns.items():
+            column.append(get(field))
+        self.ids.append(get("id"))
+        self.urls.append(get("url"))
+        extra = job.extra if isinstance(job, Job) else {
+            k: v for k, v in job.items() if k not in CORE_FIELDS and k != "id"
+        }
+        if extra:
+            self.extras[row] = extra
+
+    def extend(self, jobs):
+        for job in jobs:
+            self.append(job)
+
+    def append_row(self, job_id, title, company, location, platform, url, extra=None):
+        """Add a job from already-split fields, e.g. straight from SQLite columns"""
+        row = len(self.ids)
+        columns = self.columns
+        columns["title"].append(title)
+        columns["company"].append(company)
+        columns["location"].append(location)
+        columns["platform"].append(platform)
+        self.ids.append(job_id)
+        self.urls.append(url)
+        if extra:
+            self.extras[row] = extra
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self)
+        columns = self.columns
+        return Job(
+            columns["title"][row], columns["company"][row], columns["location"][row],
+            columns["platform"][row], self.urls[row], self.ids[row], self.extras.get(row),
+        )
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def column(self, field):
+        """All values of one field, in row order"""
+        if field in self.columns:
+            column = self.columns[field]
+            return [column.values[code] for code in column.codes]
+        if field == "id":
+            return list(self.ids)
+        if field == "url":
+            return list(self.urls)
+        return [self.extras.get(row, {}).get(field) for row in range(len(self))]
+
+    def value_counts(self, field):
+        """{value: count} for a categorical field, counted on the codes"""
+        column = self.columns[field]
+        counts = [0] * len(column.values)
+        for code in column.codes:
+            counts[code] += 1
+        return {value: counts[code] for code, value in enumerate(column.values) if counts[code]}
+
+    def take(self, rows):
+        """New, independent JobSet with the given rows, in the given order"""
+        subset = JobSet()
+        for field, column in self.columns.items():
+            # The value tables hold distinct strings only, so copying them is
+            # cheap and keeps appends to the subset out of this set
+            target = subset.columns[field]
+            target.values = list(column.values)
+            target.lookup = dict(column.lookup)
+            target.codes = array("I", map(column.codes.__getitem__, rows))
+        subset.ids = list(map(self.ids.__getitem__, rows))
+        subset.urls = list(map(self.urls.__getitem__, rows))
+        if self.extras:
+            subset.extras = {
+                new: dict(self.extras[old]) for new, old in enumerate(rows) if old in self.extras
+            }
+        return subset
+
+    def argsort(self, field, reverse=False):
+        """Row order sorted by a categorical field, comparing small ints only"""
+        column = self.columns[field]
+        keys = list(map(column.sort_ranks().__getitem__, column.codes))
+        return sorted(range(len(self)), key=keys.__getitem__, reverse=reverse)
+
+    def sorted_by(self, field, reverse=False):
+        return self.take(self.argsort(field, reverse))
+
+    def to_dicts(self):
+        return [job.to_dict() for job in self]
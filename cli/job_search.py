@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Multi-Query Search
+Fans keyword x location combinations out to the backend and merges the results
+"""
+
+import re
+from itertools import product
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from tracing import decode
+
+# Query parameters that identify a posting; everything else is tracking noise
+IDENTITY_PARAMS = {"jk", "vjk", "currentjobid"}
+
+_whitespace = re.compile(r"\s+")
+
+
+def normalize_text(value):
+    """Lowercase and collapse whitespace for comparisons"""
+    return _whitespace.sub(" ", (value or "").strip().lower())
+
+
+def canonical_url(url):
+    """Strip tracking parameters and fragments from a job URL"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    params = sorted(
+        (key.lower(), value) for key, value in parse_qsl(parts.query)
+        if key.lower() in IDENTITY_PARAMS
+    )
+    query = f"?{urlencode(params)}" if params else ""
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}{query}"
+
+
+def job_key(job):
+    """Normalized title/company/URL key used to de-duplicate jobs"""
+    return (
+        normalize_text(job.get("title")),
+        normalize_text(job.get("company")),
+        canonical_url(job.get("url")),
+    )
+
+
+def dedupe_jobs(jobs):
+    """Drop repeated jobs, keeping the first occurrence"""
+    seen = set()
+    unique = []
+    for job in jobs:
+        key = job_key(job)
+        if key not in seen:
+            seen.add(key)
+            unique.append(job)
+    return unique
+
+
+def search_errors(data):
+    """{platform: message} for the boards a search response says failed.
+
+    None when the response does not say, e.g. a cut-off stream or an older
+    backend; only an empty mapping means every board answered.
+    """
+    errors = data.get("errors")
+    return errors if isinstance(errors, dict) else None
+
+
+def build_queries(keywords_list, locations):
+    """Cross every keyword phrase with every location"""
+    return list(product(keywords_list, locations))
+
+
+def load_queries(path, default_location):
+    """Read `keywords | location` lines from a file; location is optional"""
+    queries = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            keywords, _, location = line.partition("|")
+            queries.append((keywords.strip(), location.strip() or default_location))
+    return queries
+
+
+def _profile_values(profile, defaults, field):
+    """A profile field as a list; a missing or empty field falls back to `defaults`"""
+    value = profile.get(field) or defaults.get(field)
+    return [value] if isinstance(value, str) else list(value or [])
+
+
+def build_query_plan(profiles, defaults):
+    """Deduplicated searches for several named profiles.
+
+    Every profile searches each of its keywords x locations x platforms;
+    fields it leaves out come from `defaults`. Returns `(plan, wanted)`:
+    `plan` maps each distinct (keywords, location) query to the platforms
+    to fetch for it, so a triple shared by several profiles is fetched
+    once, and `wanted` maps each profile to the (query, platform) pairs
+    whose results belong to it.
+    """
+    plan = {}
+    spelling = {}
+    wanted = {}
+    for name, profile in profiles.items():
+        pairs = []
+        platforms = [value.lower() for value in _profile_values(profile, defaults, "platforms")]
+        for keywords, location in product(_profile_values(profile, defaults, "keywords"),
+                                          _profile_values(profile, defaults, "location")):
+            # Queries differing only in case or spacing are the same search
+            key = (normalize_text(keywords), normalize_text(location))
+            query = spelling.setdefault(key, (keywords.strip(), location.strip()))
+            fetched = plan.setdefault(query, [])
+            for platform in platforms:
+                if platform not in fetched:
+                    fetched.append(platform)
+                pairs.append((query, platform))
+        wanted[name] = list(dict.fromkeys(pairs))
+    # Sorted, so a query's cache key does not depend on profile order
+    return {query: sorted(platforms) for query, platforms in plan.items()}, wanted
+
+
+def fan_out(results, wanted):
+    """Each profile's jobs from the shared `results` of a query plan, de-duplicated"""
+    def belongs(job, platform):
+        # Jobs without a platform go to every profile that searched the query
+        return (job.get("platform") or platform).lower() == platform
+
+    return {
+        name: dedupe_jobs(
+            job for query, platform in pairs for job in results.get(query, [])
+            if belongs(job, platform)
+        )
+        for name, pairs in wanted.items()
+    }
+
+
+async def search_concurrently(client, queries, platforms, concurrency=4, on_result=None,
+                              extra_body=None):
+    """Run every (keywords, location) query with at most `concurrency` in flight.
+
+    Returns a list of (query, jobs, error, failed) tuples in the order of
+    `queries`, where `failed` is the response's `search_errors`.
+    `on_result(query, jobs, error, failed)` fires as each query completes.
+    `extra_body` maps a query to additional request fields, e.g. `since`.
+    """
+    import asyncio
+    from request_pool import RequestPool
+
+    async def run_query(pool, query):
+        keywords, location = query
+        body = {"keywords": keywords, "location": location, "platforms": platforms}
+        body.update((extra_body or {}).get(query) or {})
+        try:
+            response = await pool.call(client.post, "/api/jobs/search", json=body)
+            if response.status_code == 200:
+                data = decode(response)
+                jobs, error, failed = data.get("jobs", []), None, search_errors(data)
+            else:
+                jobs, error, failed = [], f"HTTP {response.status_code}", None
+        except Exception as e:
+            jobs, error, failed = [], str(e), None
+        if on_result:
+            on_result(query, jobs, error, failed)
+        return query, jobs, error, failed
+
+    async with RequestPool(concurrency) as pool:
+        return await asyncio.gather(*(run_query(pool, query) for query in queries))
+
+
+def run_searches(client, queries, platforms, concurrency=4, on_result=None, extra_body=None):
+    """Blocking wrapper around search_concurrently for the synchronous CLI"""
+    import asyncio
+
+    return asyncio.run(
+        search_concurrently(client, queries, platforms, concurrency, on_result, extra_body)
+    )
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Local Job Store
+SQLite-backed history of every job the CLI has seen
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from job_search import job_key
+from tracing import traced
+
+DEFAULT_DB_PATH = Path.home() / ".job-bot-jobs.db"
+LEGACY_JOBS_FILE = Path.home() / ".job-bot-jobs.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    platform TEXT,
+    url TEXT,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_platform ON jobs(platform);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs(first_seen);
+
+CREATE TABLE IF NOT EXISTS last_search (
+    position INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS search_marks (
+    query_key TEXT PRIMARY KEY,
+    last_run REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS query_seen (
+    query_key TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (query_key, job_id)
+) WITHOUT ROWID;
+"""
+
+# Incremental searches forget fingerprints older than this; boards rarely
+# return a posting again that long after the run that first saw it
+SEEN_RETENTION_DAYS = 30
+
+# Stay well below SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
+# Columns the last search can be paged through in, besides result order
+SORT_FIELDS = ("title", "company", "location", "platform")
+
+
+def job_id(job):
+    """Stable short ID derived from the normalized title/company/URL key"""
+    digest = hashlib.sha1("\x1f".join(job_key(job)).encode("utf-8")).hexdigest()
+    return digest[:12]
+
+
+class JobStore:
+    """Indexed job history with the result order of the last search"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = Path(path)
+        is_new = not self.path.exists()
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        if is_new and self.path == DEFAULT_DB_PATH and LEGACY_JOBS_FILE.exists():
+            self.import_legacy(LEGACY_JOBS_FILE)
+
+    def import_legacy(self, jobs_file):
+        """Carry over the last search from the old JSON dump"""
+        try:
+            with open(jobs_file, 'r') as f:
+                jobs = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.set_last_search(self.upsert_jobs(jobs))
+
+    @traced("store.upsert_jobs", "persist")
+    def upsert_jobs(self, jobs):
+        """Insert new jobs and refresh known ones; returns their IDs in order"""
+        now = time.time()
+        ids = []
+        rows = []
+        for job in jobs:
+            jid = job_id(job)
+            ids.append(jid)
+            rows.append((
+                jid, job.get("title"), job.get("company"), job.get("location"),
+                job.get("platform"), job.get("url"), json.dumps(job), now, now,
+            ))
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO jobs (id, title, company, location, platform, url, data,
+                                  first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    location = excluded.location,
+                    platform = excluded.platform,
+                    url = excluded.url,
+                    data = excluded.data,
+                    last_seen = excluded.last_seen
+                """,
+                rows,
+            )
+        return ids
+
+    @traced("store.set_last_search", "persist")
+    def set_last_search(self, ids):
+        """Remember result order so `apply -i N` keeps addressing the same jobs"""
+        with self.conn:
+            self.conn.execute("DELETE FROM last_search")
+            self.conn.executemany(
+                "INSERT INTO last_search (position, job_id) VALUES (?, ?)",
+                enumerate(ids, 1),
+            )
+
+    def last_search_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM last_search").fetchone()[0]
+
+    def last_search_jobs(self):
+        """All jobs of the last search, in result order"""
+        rows = self.conn.execute(
+            """
+            SELECT jobs.id, jobs.data FROM last_search
+            JOIN jobs ON jobs.id = last_search.job_id
+            ORDER BY last_search.position
+            """
+        )
+        return [self._decode(row) for row in rows]
+
+    def jobs_at_positions(self, positions):
+        """Look up jobs of the last search by their 1-based result index"""
+        jobs = []
+        for position in positions:
+            row = self.conn.execute(
+                """
+                SELECT jobs.id, jobs.data FROM last_search
+                JOIN jobs ON jobs.id = last_search.job_id
+                WHERE last_search.position = ?
+                """,
+                (position,),
+            ).fetchone()
+            if row:
+                jobs.append(self._decode(row))
+        return jobs
+
+    @staticmethod
+    def _sort_key(sort):
+        if sort is None:
+            return "last_search.position"
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Cannot sort results by '{sort}'")
+        return f"COALESCE(jobs.{sort}, '') COLLATE NOCASE"
+
+    @traced("store.last_search_page", "load")
+    def last_search_page(self, offset, limit, sort=None, descending=False):
+        """One page of the last search as (position, job) pairs.
+
+        Only the indexed core columns are read, and only for the rows on
+        the page; `position` is the job's `apply -i` index whatever the sort.
+        """
+        # Ties keep result order, so a sorted view is stable between pages
+        rows = self.conn.execute(
+            f"""
+            SELECT last_search.position, jobs.id, jobs.title, jobs.company,
+                   jobs.location, jobs.platform
+            FROM last_search JOIN jobs ON jobs.id = last_search.job_id
+            ORDER BY {self._sort_key(sort)} {"DESC" if descending else "ASC"},
+                     last_search.position
+            LIMIT ? OFFSET ?
+            """,
+            (limit, offset),
+        )
+        return [(row["position"], {field: row[field] for field in ("id",) + SORT_FIELDS})
+                for row in rows]
+
+    def last_search_rank(self, position, sort=None, descending=False):
+        """0-based row of a result index in the sorted view, or None if out of range"""
+        key = self._sort_key(sort)
+        target = self.conn.execute(
+            f"""
+            SELECT {key} FROM last_search
+            JOIN jobs ON jobs.id = last_search.job_id
+            WHERE last_search.position = ?
+            """,
+            (position,),
+        ).fetchone()
+        if target is None:
+            return None
+        before = ">" if descending else "<"
+        return self.conn.execute(
+            f"""
+            SELECT COUNT(*) FROM last_search
+            JOIN jobs ON jobs.id = last_search.job_id
+            WHERE {key} {before} ?1
+               OR ({key} = ?1 AND last_search.position < ?2)
+            """,
+            (target[0], position),
+        ).fetchone()[0]
+
+    def jobs_by_ids(self, ids):
+        """Look up jobs by their stable ID"""
+        jobs = []
+        for jid in ids:
+            row = self.conn.execute(
+                "SELECT id, data FROM jobs WHERE id = ?", (jid,)
+            ).fetchone()
+            if row:
+                jobs.append(self._decode(row))
+        return jobs
+
+    @traced("store.all_jobs", "load")
+    def all_jobs(self, with_urls=False):
+        """Every stored job as a compact JobSet, most recently seen first.
+
+        Tracking URLs are most of a job's size and bulk work rarely needs
+        them, so they stay in SQLite unless `with_urls` is set.
+        """
+        from job_model import CORE_FIELDS, JobSet
+
+        url = "url" if with_urls else "NULL"
+        jobs = JobSet()
+        try:
+            # Let SQLite strip the core fields so only rare extras get decoded
+            rows = self.conn.execute(
+                f"""
+                SELECT id, title, company, location, platform, {url},
+                       json_remove(data, '$.title', '$.company', '$.location',
+                                   '$.platform', '$.url', '$.id')
+                FROM jobs ORDER BY last_seen DESC
+                """
+            )
+        except sqlite3.OperationalError:
+            # SQLite built without JSON support
+            for row in self.conn.execute(
+                f"SELECT id, title, company, location, platform, {url}, data "
+                "FROM jobs ORDER BY last_seen DESC"
+            ):
+                extra = {k: v for k, v in json.loads(row[6]).items()
+                         if k not in CORE_FIELDS and k != "id"}
+                jobs.append_row(*row[:6], extra=extra)
+            return jobs
+
+        for row in rows:
+            extra = row[6]
+            jobs.append_row(*row[:6], extra=json.loads(extra) if extra != "{}" else None)
+        return jobs
+
+    def search_mark(self, query_key):
+        """Start time of the last completed incremental run of a query, or None"""
+        row = self.conn.execute(
+            "SELECT last_run FROM search_marks WHERE query_key = ?", (query_key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def unseen_jobs(self, query_key, jobs):
+        """Jobs a query has not returned before, in order and without repeats"""
+        ids = [job_id(job) for job in jobs]
+        seen = set()
+        for start in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[start:start + _IN_CHUNK]
+            seen.update(row[0] for row in self.conn.execute(
+                f"SELECT job_id FROM query_seen WHERE query_key = ? "
+                f"AND job_id IN ({','.join('?' * len(chunk))})",
+                [query_key] + chunk,
+            ))
+        fresh = []
+        for job, jid in zip(jobs, ids):
+            if jid not in seen:
+                seen.add(jid)
+                fresh.append(job)
+        return fresh
+
+    @traced("store.mark_seen", "persist")
+    def mark_seen(self, query_key, jobs, run_started=None):
+        """Record jobs as seen by a query.
+
+        Passing `run_started` also moves the query's high-water mark, which
+        should only happen once a run has received its complete result.
+        """
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO query_seen (query_key, job_id, seen_at) VALUES (?, ?, ?)",
+                ((query_key, job_id(job), now) for job in jobs),
+            )
+            if run_started is not None:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO search_marks (query_key, last_run) VALUES (?, ?)",
+                    (query_key, run_started),
+                )
+                self.conn.execute(
+                    "DELETE FROM query_seen WHERE query_key = ? AND seen_at < ?",
+                    (query_key, now - SEEN_RETENTION_DAYS * 86400),
+                )
+
+    def _decode(self, row):
+        job = json.loads(row["data"])
+        job["id"] = row["id"]
+        return job
+
+    def close(self):
+        self.conn.close()
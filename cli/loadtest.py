@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Load Test
+Open-loop request generator that measures backend throughput, errors and latency
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+from collections import Counter
+
+from request_pool import RequestPool
+
+# The requests JobBot and MonitorCLI send; the search body comes from the config
+TARGETS = {
+    "search": ("POST", "/api/jobs/search"),
+    "monitor-status": ("GET", "/api/monitor/status"),
+    "monitor-list": ("GET", "/api/monitor/watch"),
+}
+
+# Upper bounds of the latency histogram buckets, in ms
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# Outcome of a request the client could not start because too many were in flight
+DROPPED = "dropped"
+
+
+def parse_mix(tokens):
+    """Request plan from "target[:weight]" tokens, e.g. ["search:1", "monitor-status:4"]"""
+    weights = {}
+    for token in tokens:
+        name, _, weight = token.partition(":")
+        if name not in TARGETS:
+            raise ValueError(f"Unknown target '{name}'; use one of: {', '.join(TARGETS)}")
+        try:
+            count = int(weight or 1)
+        except ValueError:
+            count = 0
+        if count < 1:
+            raise ValueError(f"Invalid weight in '{token}'")
+        weights[name] = weights.get(name, 0) + count
+
+    # Smooth weighted round-robin: a 1:4 mix is sent as s m m s m m ...,
+    # not in bursts of one target
+    total = sum(weights.values())
+    current = dict.fromkeys(weights, 0)
+    plan = []
+    for _ in range(total):
+        for name in current:
+            current[name] += weights[name]
+        name = max(current, key=current.get)
+        current[name] -= total
+        plan.append(name)
+    return plan
+
+
+class LoadResult:
+    """Outcomes and latencies of one load step"""
+
+    def __init__(self, rate, duration):
+        self.rate = rate
+        self.duration = duration
+        self.elapsed = 0.0
+        self.latencies = []
+        self.outcomes = Counter()
+        self.targets = Counter()
+
+    def record(self, target, outcome, latency_ms=None):
+        self.outcomes[outcome] += 1
+        self.targets[target] += 1
+        if latency_ms is not None:
+            self.latencies.append(latency_ms)
+
+    @property
+    def sent(self):
+        return sum(self.outcomes.values()) - self.outcomes[DROPPED]
+
+    @property
+    def ok(self):
+        return sum(count for outcome, count in self.outcomes.items()
+                   if outcome[:1] in ("2", "3"))
+
+    @property
+    def errors(self):
+        """{outcome: count} for everything but 2xx/3xx responses"""
+        return {outcome: count for outcome, count in self.outcomes.most_common()
+                if outcome[:1] not in ("2", "3")}
+
+    @property
+    def throughput(self):
+        """Successful responses per second"""
+        return self.ok / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))]
+
+    def histogram(self):
+        """(label, count) per latency bucket, including the overflow bucket"""
+        counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        for latency in self.latencies:
+            counts[bisect_left(LATENCY_BUCKETS_MS, latency)] += 1
+        labels = [f"≤{bound:g} ms" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]:g} ms")
+        return list(zip(labels, counts))
+
+    def to_dict(self):
+        def ms(value):
+            return None if value is None else round(value, 2)
+
+        return {
+            "rate": self.rate,
+            "duration": self.duration,
+            "sent": self.sent,
+            "ok": self.ok,
+            "errors": self.errors,
+            "throughput": round(self.throughput, 2),
+            "p50_ms": ms(self.percentile(50)),
+            "p90_ms": ms(self.percentile(90)),
+            "p99_ms": ms(self.percentile(99)),
+            "max_ms": ms(max(self.latencies) if self.latencies else None),
+            "histogram": dict(self.histogram()),
+        }
+
+
+async def drive(client, plan, rate, duration, bodies=None, max_in_flight=64):
+    """Start requests at a fixed `rate` for `duration` seconds, whatever the responses do.
+
+    Latency is measured from each request's scheduled start, so a backend
+    that falls behind shows up as growing latency instead of a quietly
+    lower request rate. Requests that would exceed `max_in_flight` are not
+    sent and count as dropped.
+    """
+    import requests
+
+    result = LoadResult(rate, duration)
+    bodies = bodies or {}
+    # Counted here rather than waiting for a pool slot: an open-loop test
+    # drops what it cannot start on time
+    in_flight = 0
+
+    async def fire(pool, target, scheduled):
+        nonlocal in_flight
+        method, path = TARGETS[target]
+        kwargs = {"json": bodies[target]} if target in bodies else {}
+        try:
+            response = await pool.run(client.request, method, path, **kwargs)
+            outcome = str(response.status_code)
+        except requests.exceptions.RequestException as e:
+            outcome = type(e).__name__
+        finally:
+            in_flight -= 1
+        result.record(target, outcome, (time.perf_counter() - scheduled) * 1000)
+
+    tasks = []
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    async with RequestPool(max_in_flight) as pool:
+        for i in range(max(1, int(rate * duration))):
+            scheduled = start + i * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            target = plan[i % len(plan)]
+            if in_flight >= max_in_flight:
+                result.record(target, DROPPED)
+                continue
+            in_flight += 1
+            tasks.append(asyncio.ensure_future(fire(pool, target, scheduled)))
+        await asyncio.gather(*tasks)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def run_load_step(client, plan, rate, duration, bodies=None, max_in_flight=64):
+    """Blocking wrapper around drive() for the synchronous CLI"""
+    return asyncio.run(drive(client, plan, rate, duration, bodies, max_in_flight))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Machine-Readable Output
+Streams command results to stdout as JSON, NDJSON or CSV instead of rich tables
+"""
+
+import csv
+import json
+import os
+import sys
+from contextlib import contextmanager
+
+OUTPUT_FORMATS = ("json", "ndjson", "csv")
+
+
+class RecordWriter:
+    """Writes records as they are produced; `close()` finishes the document"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, record):
+        try:
+            self._write(record)
+        except BrokenPipeError:
+            self._reader_gone()
+        self.count += 1
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def _write(self, record):
+        raise NotImplementedError
+
+    def close(self):
+        try:
+            self.stream.flush()
+        except BrokenPipeError:
+            self._reader_gone()
+
+    def _reader_gone(self):
+        """The reader stopped early (e.g. `| head`): exit quietly instead of with a traceback"""
+        try:
+            # Later flushes, including the interpreter's own at exit, go nowhere
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, self.stream.fileno())
+        except (AttributeError, OSError, ValueError):
+            pass
+        sys.exit(1)
+
+
+class NdjsonWriter(RecordWriter):
+    """One JSON object per line, flushed per record so pipes see it at once"""
+
+    def _write(self, record):
+        self.stream.write(json.dumps(record, default=str) + "\n")
+        self.stream.flush()
+
+
+class JsonWriter(RecordWriter):
+    """A single JSON array, written element by element"""
+
+    def _write(self, record):
+        self.stream.write("[\n" if not self.count else ",\n")
+        self.stream.write(json.dumps(record, default=str))
+
+    def close(self):
+        try:
+            self.stream.write("[]\n" if not self.count else "\n]\n")
+        except BrokenPipeError:
+            self._reader_gone()
+        super().close()
+
+
+class CsvWriter(RecordWriter):
+    """CSV with the columns of the first record plus `extra`.
+
+    Fields that only later records have go into `extra` as a JSON object,
+    so nothing is dropped without holding rows back to learn every column.
+    Nested values are JSON-encoded.
+    """
+
+    EXTRA = "extra"
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.writer = None
+        self.columns = None
+
+    def _write(self, record):
+        if self.writer is None:
+            self.columns = [key for key in record if key != self.EXTRA]
+            self.writer = csv.DictWriter(self.stream, fieldnames=self.columns + [self.EXTRA],
+                                         lineterminator="\n")
+            self.writer.writeheader()
+        row = {}
+        extra = {}
+        for key, value in record.items():
+            if key in self.columns:
+                row[key] = json.dumps(value) if isinstance(value, (list, dict)) else value
+            else:
+                extra[key] = value
+        if extra:
+            row[self.EXTRA] = json.dumps(extra, default=str)
+        self.writer.writerow(row)
+
+
+WRITERS = {"json": JsonWriter, "ndjson": NdjsonWriter, "csv": CsvWriter}
+
+
+def open_writer(fmt, stream=None):
+    return WRITERS[fmt](stream or sys.stdout)
+
+
+def job_record(job, index=None):
+    """Flat record for a job: its position and ID first, then every field"""
+    from job_store import job_id
+
+    data = job.to_dict() if hasattr(job, "to_dict") else dict(job)
+    record = {"index": index, "id": data.pop("id", None) or job_id(data)}
+    for field in ("title", "company", "location", "platform", "url"):
+        record[field] = data.pop(field, None)
+    record.update(data)
+    return record
+
+
+@contextmanager
+def machine_output(fmt, targets, modules):
+    """Send records from `targets` to stdout and every module's console to stderr.
+
+    Each target gets the writer as its `output` attribute for the duration
+    of the command; messages meant for people keep working, just off stdout.
+    """
+    from rich.console import Console
+
+    writer = open_writer(fmt)
+    saved = [(module, module.console) for module in modules]
+    messages = Console(stderr=True)
+    for module in modules:
+        module.console = messages
+    for target in targets:
+        target.output = writer
+    try:
+        yield writer
+    finally:
+        for target in targets:
+            target.output = None
+        for module, console in saved:
+            module.console = console
+        writer.close()
+
+
+def add_output_argument(parser, hidden=False):
+    """Register --output; `hidden` copies accept it after a subcommand"""
+    import argparse
+
+    kwargs = dict(choices=OUTPUT_FORMATS,
+                  help='Write results to stdout as JSON, NDJSON or CSV records; '
+                       'messages go to stderr')
+    if hidden:
+        kwargs.update(default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    parser.add_argument('--output', **kwargs)
+
+
+def run_with_output(args, run, targets, modules):
+    """Run a command, streaming its records to stdout when --output is given"""
+    fmt = getattr(args, "output", None)
+    if not fmt:
+        return run()
+    with machine_output(fmt, targets, modules):
+        return run()
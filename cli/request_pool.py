@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Request Pool
+Runs blocking backend calls from asyncio with a bounded number in flight
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+
+class RequestPool:
+    """Worker threads for blocking calls such as `client.post`, at most `size` at a time.
+
+    Use as an async context manager. However the block ends (results,
+    an exception, Ctrl+C or cancellation), the workers are shut down
+    without waiting: requests already on the wire finish in the
+    background, and nothing new is started.
+    """
+
+    def __init__(self, size):
+        self.size = max(1, size)
+        self._executor = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._executor = ThreadPoolExecutor(max_workers=self.size)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._executor.shutdown(wait=False)
+        return False
+
+    def slot(self):
+        """Async context manager holding one of the `size` slots"""
+        return self._semaphore
+
+    async def run(self, fn, *args, **kwargs):
+        """Run `fn(*args, **kwargs)` on a worker thread; the caller manages slots"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def call(self, fn, *args, **kwargs):
+        """Wait for a free slot, then run `fn(*args, **kwargs)` on a worker thread"""
+        async with self.slot():
+            return await self.run(fn, *args, **kwargs)
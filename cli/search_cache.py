@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Search Cache
+On-disk cache of search responses with a TTL and LRU eviction
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from job_search import normalize_text
+from tracing import traced
+
+DEFAULT_CACHE_PATH = Path.home() / ".job-bot-cache.db"
+DEFAULT_TTL_MINUTES = 60
+DEFAULT_MAX_ENTRIES = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_cache (
+    key TEXT PRIMARY KEY,
+    jobs TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_cache_last_access ON search_cache(last_access);
+"""
+
+
+def cache_key(keywords, location, platforms):
+    """Hash of the normalized (keywords, location, platforms) tuple"""
+    parts = [
+        normalize_text(keywords),
+        normalize_text(location),
+        ",".join(sorted(normalize_text(p) for p in platforms or [])),
+    ]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """Size-bounded, TTL-expiring cache of /api/jobs/search results"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_minutes=DEFAULT_TTL_MINUTES,
+                 max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = Path(path)
+        self.ttl = ttl_minutes * 60
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    @traced("cache.get", "load")
+    def get(self, keywords, location, platforms):
+        """Return cached jobs for a query, or None when missing or expired"""
+        key = cache_key(keywords, location, platforms)
+        row = self.conn.execute(
+            "SELECT jobs, created_at FROM search_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        with self.conn:
+            if now - row[1] > self.ttl:
+                self.conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                return None
+            self.conn.execute(
+                "UPDATE search_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(row[0])
+
+    @traced("cache.put", "persist")
+    def put(self, keywords, location, platforms, jobs):
+        """Store a search result and evict the least recently used overflow"""
+        key = cache_key(keywords, location, platforms)
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO search_cache (key, jobs, created_at, last_access)
+                VALUES (?, ?, ?, ?)
+                """,
+                (key, json.dumps(jobs), now, now),
+            )
+            self.conn.execute(
+                "DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl,)
+            )
+            self.conn.execute(
+                """
+                DELETE FROM search_cache WHERE key IN (
+                    SELECT key FROM search_cache
+                    ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM search_cache")
+
+    def close(self):
+        self.conn.close()
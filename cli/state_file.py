@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - State Files
+Atomic, lock-protected JSON files that concurrent CLI runs can share
+"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: renames are still atomic, writers just aren't serialized
+    fcntl = None
+
+
+class FileLock:
+    """Advisory lock on a sidecar `<path>.lock` file, so the data file itself can be replaced.
+
+    The lock file is never removed; deleting it would let two processes
+    lock two different files.
+    """
+
+    def __init__(self, path):
+        self.path = Path(f"{path}.lock")
+        self._file = None
+
+    def acquire(self, blocking=True):
+        """Take the lock; raises BlockingIOError if `blocking` is off and it is held"""
+        self._file = open(self.path, "a")
+        if fcntl is None:
+            return
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            self._file.close()
+            self._file = None
+            raise
+
+    def release(self):
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+        return False
+
+
+def atomic_write(path, text):
+    """Replace `path` with `text`; readers see the old or the new file, never a mix"""
+    import tempfile
+
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Make the rename itself survive a crash
+        dir_fd = os.open(str(path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class StateFile:
+    """A JSON object on disk with a format `version`, safe to share between processes.
+
+    Writers hold the file's lock while they read, change and atomically
+    replace it, so use update() to change some keys. Readers need no
+    lock; they parse the file again only when its inode, size or mtime
+    changed, so re-reading an unchanged file costs one stat().
+    """
+
+    def __init__(self, path, version=1):
+        self.path = Path(path)
+        self.version = version
+        self.file_version = None
+        self._signature = None
+        self._data = None
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def changed(self):
+        """True if the file was written, replaced or removed since the last read"""
+        return self._stat() != self._signature
+
+    def read(self):
+        """The stored object without its `version` key, or None if there is no file.
+
+        The result is cached and shared, so copy it before changing it.
+        Raises ValueError if the file is not a JSON object.
+        """
+        signature = self._stat()
+        if signature is None:
+            self._signature = self._data = self.file_version = None
+            return None
+        if signature == self._signature:
+            return self._data
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            # Removed since the stat()
+            return None
+        if not isinstance(data, dict):
+            raise ValueError(f"{self.path} does not hold a JSON object")
+        # Files from before versioning have no key and count as version 0
+        self.file_version = data.pop("version", 0)
+        self._signature, self._data = signature, data
+        return data
+
+    def update(self, change):
+        """Atomically replace the stored object with `change(current)` and return it.
+
+        Reading, changing and writing all happen under the file's lock, so
+        concurrent updates of different keys are never lost. `change` gets a
+        copy of the stored object ({} if there is none, or it is unreadable).
+        Raises RuntimeError if a newer format is on disk.
+        """
+        with FileLock(self.path):
+            try:
+                current = self.read()
+            except ValueError:
+                # An unreadable file is what this write repairs
+                current = self.file_version = None
+            if (self.file_version or 0) > self.version:
+                raise RuntimeError(
+                    f"{self.path} was written by a newer version (format {self.file_version}); "
+                    f"not overwriting it"
+                )
+            data = change(dict(current or {}))
+            stored = {key: value for key, value in data.items() if key != "version"}
+            atomic_write(self.path, json.dumps(dict(version=self.version, **stored), indent=2) + "\n")
+            self._signature = self._stat()
+            self._data = stored
+            self.file_version = self.version
+            return stored
+
+    def write(self, data):
+        """Atomically store `data` as the whole object, replacing every key"""
+        return self.update(lambda current: data)
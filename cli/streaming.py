@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Streaming Response Parsing
+Yields jobs from a search response without holding the whole payload
+"""
+
+import codecs
+import json
+import re
+from itertools import islice
+
+NDJSON_TYPE = "application/x-ndjson"
+STREAM_ACCEPT = f"{NDJSON_TYPE}, application/json;q=0.9"
+# Key of the record that ends a complete NDJSON search stream
+END_KEY = "_end"
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\r\n"
+# What may follow a number that is cut off mid-token, e.g. "1.", "1.5e", "-0."
+_number_tail = re.compile(r"[0-9.eE+-]*\Z")
+
+
+def batched(iterable, size):
+    """Yield lists of at most `size` items"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_ndjson(lines):
+    """Parse one JSON document per non-empty line"""
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+class _Buffer:
+    """Text buffer refilled from a byte-chunk iterator on demand"""
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+
+    def fill(self):
+        """Append the next chunk; returns False once the input is exhausted"""
+        for chunk in self.chunks:
+            if chunk:
+                # Drop what has been consumed so memory stays bounded
+                self.text = self.text[self.pos:] + self.decoder.decode(chunk)
+                self.pos = 0
+                return True
+        return False
+
+    def skip_whitespace(self):
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _whitespace:
+                self.pos += 1
+            if self.pos < len(self.text) or not self.fill():
+                return
+
+    def peek(self):
+        self.skip_whitespace()
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} in JSON stream at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed"""
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except ValueError:
+                if not self.fill():
+                    raise
+                continue
+            # A number followed by nothing but number characters may continue
+            # in the next chunk: raw_decode stops early on "1." or "1.5e"
+            if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and _number_tail.match(self.text, end) and self.fill()):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks, key="jobs", others=None):
+    """Yield the items of the top-level `key` array of a JSON object.
+
+    Other top-level members are decoded and skipped, or stored in the
+    `others` dict if one is given, so only one array item is materialized
+    at a time.
+    """
+    buf = _Buffer(chunks)
+    buf.expect("{")
+    while buf.peek() != "}":
+        name = buf.value()
+        buf.expect(":")
+        if name == key and buf.peek() == "[":
+            buf.expect("[")
+            while buf.peek() != "]":
+                yield buf.value()
+                if buf.peek() == ",":
+                    buf.pos += 1
+            buf.expect("]")
+        else:
+            value = buf.value()
+            if others is not None:
+                others[name] = value
+        if buf.peek() == ",":
+            buf.pos += 1
+
+
+def _strip_end(records, meta):
+    for record in records:
+        if isinstance(record, dict) and record.get(END_KEY):
+            meta.update(record)
+        else:
+            yield record
+
+
+def iter_jobs(response, chunk_size=65536, meta=None):
+    """Yield jobs from a streamed search response, NDJSON or plain JSON.
+
+    Once the jobs are exhausted, `meta` (if given) holds the rest of the
+    response: the other JSON members, or the NDJSON end record. Both carry
+    the backend's per-platform `errors`.
+    """
+    meta = {} if meta is None else meta
+    content_type = response.headers.get("Content-Type", "")
+    if content_type.startswith(NDJSON_TYPE):
+        return _strip_end(iter_ndjson(response.iter_lines(decode_unicode=True)), meta)
+    return iter_json_array(response.iter_content(chunk_size=chunk_size), "jobs", meta)
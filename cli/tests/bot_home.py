@@ -0,0 +1,26 @@
+"""
+Job Application Bot - Test Home
+JobBot instances whose config, history and cache live in a temporary directory
+"""
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from job_bot import JobBot
+from job_store import JobStore
+from search_cache import SearchCache
+
+
+def make_bot(test, api_url):
+    """A JobBot for `test` whose state lives in a fresh directory, removed afterwards"""
+    home = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, home)
+    with mock.patch.dict(os.environ, {"HOME": home}):
+        bot = JobBot(api_url)
+    bot.home = home
+    bot._store = JobStore(os.path.join(home, "jobs.db"))
+    bot._cache = SearchCache(os.path.join(home, "cache.db"))
+    test.addCleanup(bot.store.close)
+    return bot
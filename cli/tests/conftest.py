@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The CLI modules live next to this directory, not in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,78 @@
+"""
+Job Application Bot - Test Backend
+In-process HTTP server whose responses each test scripts per route
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeBackend:
+    """Records every request; `routes` maps "METHOD /path" to a handler.
+
+    A handler gets the parsed JSON body and returns `(status, payload)`,
+    `(status, records, "application/x-ndjson")` to send one JSON record per
+    line, `(status, text, content_type)` to send `text` as is, or a number
+    of seconds to stall before answering 200.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self._lock = threading.Lock()
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def handle_one(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"null")
+                key = f"{self.command} {self.path}"
+                with backend._lock:
+                    backend.requests.append((key, body))
+                result = backend.routes.get(key, (404, {"error": "not found"}))
+                if callable(result):
+                    result = result(body)
+                if isinstance(result, (int, float)):
+                    time.sleep(result)
+                    result = (200, {"success": True})
+                status, payload, content_type = (tuple(result) + ("application/json",))[:3]
+                if content_type == "application/json":
+                    data = json.dumps(payload).encode()
+                elif content_type == "application/x-ndjson":
+                    data = "".join(json.dumps(record) + "\n" for record in payload).encode()
+                else:
+                    data = payload.encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up waiting
+                    pass
+
+            do_GET = do_POST = do_PUT = do_DELETE = handle_one
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def count(self, key):
+        with self._lock:
+            return sum(1 for seen, _ in self.requests if seen == key)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+        return False
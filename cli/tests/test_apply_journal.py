@@ -0,0 +1,75 @@
+import os
+import socket
+import tempfile
+import unittest
+
+from fake_backend import FakeBackend
+from apply_journal import ApplyJournal, replay
+from apply_pipeline import run_apply_pipeline
+from http_client import DEFAULT_TIMEOUTS, ApiClient
+
+JOBS = [{"id": f"job{i}", "title": f"Engineer {i}", "company": "Acme"} for i in range(4)]
+
+
+class ApplyJournalTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(handle)
+        self.addCleanup(os.unlink, self.path)
+
+    def apply(self, api_url):
+        """Run a journaled batch apply the way JobBot does and replay the journal"""
+        client = ApiClient(api_url, timeouts=dict.fromkeys(DEFAULT_TIMEOUTS, 0.2),
+                           retries=0)
+        journal = ApplyJournal(self.path)
+        journal.start_run(JOBS, {})
+        results = run_apply_pipeline(
+            client, JOBS, {}, chunk_size=2, concurrency=2,
+            on_send=lambda index, chunk: journal.record(
+                [job["id"] for job in chunk], "in-flight", sync=True),
+            on_chunk=lambda index, chunk, results, ok: journal.record_results(chunk, results),
+        )
+        journal.close()
+        client.close()
+        return results, replay(self.path)
+
+    def test_read_timeout_stays_in_flight(self):
+        with FakeBackend({"POST /api/jobs/apply": 1.0}) as backend:
+            results, state = self.apply(backend.url)
+            self.assertEqual(backend.count("POST /api/jobs/apply"), 2)
+        self.assertEqual({result["status"] for result in results}, {"unknown"})
+        self.assertEqual(state.pending(), [])
+        self.assertEqual(len(state.in_flight()), len(JOBS))
+
+    def test_server_error_stays_in_flight(self):
+        with FakeBackend({"POST /api/jobs/apply": (500, {"error": "boom"})}) as backend:
+            _, state = self.apply(backend.url)
+        self.assertEqual(state.pending(), [])
+        self.assertEqual(len(state.in_flight()), len(JOBS))
+
+    def test_refused_request_is_pending(self):
+        with FakeBackend({"POST /api/jobs/apply": (503, {"error": "busy"})}) as backend:
+            _, state = self.apply(backend.url)
+        self.assertEqual(len(state.pending()), len(JOBS))
+        self.assertEqual(state.in_flight(), [])
+
+    def test_connection_refused_is_pending(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        _, state = self.apply(f"http://127.0.0.1:{port}")
+        self.assertEqual(len(state.pending()), len(JOBS))
+
+    def test_results_are_final(self):
+        def applied(body):
+            return 200, {"results": [
+                {"job": job["title"], "company": job["company"], "status": "success",
+                 "message": "ok"}
+                for job in body["jobs"]
+            ]}
+
+        with FakeBackend({"POST /api/jobs/apply": applied}) as backend:
+            _, state = self.apply(backend.url)
+        self.assertEqual(len(state.finished()), len(JOBS))
+        self.assertEqual(state.pending() + state.in_flight(), [])
+
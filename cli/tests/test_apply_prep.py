@@ -0,0 +1,44 @@
+import unittest
+from unittest import mock
+
+import apply_prep
+from apply_prep import build_context, check_template, prepare_payloads
+
+JOBS = [
+    {"title": "Python Developer", "company": "Acme", "location": "Remote",
+     "description": "Django and PostgreSQL"},
+    {"title": "Data Engineer", "company": "Globex", "location": "Berlin", "salary": 90000},
+]
+CONFIG = {"skills": ["python", "django"], "keywords": "software engineering",
+          "cover_letter_template": "{title} at {company}: {skills}{unknown}"}
+
+
+class TemplateTest(unittest.TestCase):
+    def test_invalid_templates(self):
+        for template in ("{company.name}", "{title[x]}", "{title[0]}", "{}", "{0}",
+                         "Dear {company", "{title:d}", "{title:{width}}", "{title!z}"):
+            with self.subTest(template=template), self.assertRaises(ValueError):
+                check_template(template)
+
+    def test_format_specs_on_plain_fields(self):
+        check_template("{company:>10} {title!r} {{literal}}")
+
+    def test_unsuitable_value_is_reported_per_job(self):
+        context = build_context(dict(CONFIG, cover_letter_template="{salary:s}"))
+        with self.assertRaises(ValueError):
+            prepare_payloads(JOBS, context, workers=1)
+
+
+class PrepareTest(unittest.TestCase):
+    def test_letters_name_matched_skills(self):
+        letters = [fields["coverLetter"]
+                   for fields in prepare_payloads(JOBS, build_context(CONFIG), workers=1)]
+        self.assertEqual(letters, ["Python Developer at Acme: django, python",
+                                   "Data Engineer at Globex: software engineering"])
+
+    def test_worker_processes_give_the_same_result(self):
+        jobs = JOBS * 5
+        context = build_context(CONFIG)
+        serial = prepare_payloads(jobs, context, workers=1)
+        with mock.patch.object(apply_prep, "PARALLEL_THRESHOLD", 2):
+            self.assertEqual(prepare_payloads(jobs, context, workers=2), serial)
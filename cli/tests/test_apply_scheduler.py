@@ -0,0 +1,125 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from apply_scheduler import ApplyScheduler, TokenBucket
+from bot_home import make_bot
+from fake_backend import FakeBackend
+
+JOBS = [{"id": f"job{i}", "title": f"Engineer {i}", "platform": "linkedin"} for i in range(3)]
+
+
+def result(job, status):
+    return {"job": job["title"], "company": "Acme", "status": status, "message": ""}
+
+
+class DrainTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.scheduler = self.open_scheduler()
+        self.scheduler.enqueue(JOBS)
+
+    def open_scheduler(self):
+        """A scheduler on its own connection, as a separate CLI run would have"""
+        conn = sqlite3.connect(os.path.join(self.dir, "jobs.db"))
+        self.addCleanup(conn.close)
+        return ApplyScheduler(conn, daily_limit=10, rate_per_minute=600, burst=10,
+                              sleep=lambda s: None,
+                              lock_path=os.path.join(self.dir, "journal.jsonl"))
+
+    def test_backend_failure_keeps_jobs_queued(self):
+        sent = self.scheduler.drain(lambda job: None)
+        self.assertEqual(sent, 0)
+        self.assertEqual(self.scheduler.pending_count(), len(JOBS))
+        self.assertEqual(self.scheduler.in_flight_ids(), [])
+        self.assertEqual(self.scheduler.used_today(), 0)
+
+    def test_only_processed_results_use_quota(self):
+        outcomes = iter([(result(JOBS[0], "success"), True), (result(JOBS[1], "failed"), False),
+                         (result(JOBS[2], "failed"), True)])
+        sent = self.scheduler.drain(lambda job: next(outcomes))
+        self.assertEqual(sent, 3)
+        self.assertEqual(self.scheduler.pending_count(), 0)
+        self.assertEqual(self.scheduler.used_today(), 2)
+
+    def test_unknown_result_stays_in_flight(self):
+        sent = self.scheduler.drain(lambda job: (result(job, "unknown"), False))
+        self.assertEqual(sent, 1)
+        self.assertEqual(self.scheduler.pending_count(), len(JOBS) - 1)
+        self.assertEqual(self.scheduler.in_flight_ids(), ["job0"])
+        self.assertEqual(self.scheduler.used_today(), 0)
+
+    def test_concurrent_drain_is_refused(self):
+        other = self.open_scheduler()
+        sent = []
+        refused = []
+
+        def send(job):
+            sent.append(job["id"])
+            try:
+                other.drain(lambda job: sent.append(job["id"]))
+            except RuntimeError as e:
+                refused.append(str(e))
+            return result(job, "success"), True
+
+        self.scheduler.drain(send)
+        self.assertEqual(sent, ["job0", "job1", "job2"])
+        self.assertEqual(len(refused), len(JOBS))
+        self.assertEqual(self.scheduler.used_today(), len(JOBS))
+        # The lock is released once the drain ends
+        self.assertEqual(other.drain(lambda job: None), 0)
+
+    def test_crash_mid_send_is_not_resent(self):
+        def crash(job):
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            self.scheduler.drain(crash)
+        sent = []
+        self.open_scheduler().drain(lambda job: (sent.append(job["id"]) or
+                                                 (result(job, "success"), True)))
+        self.assertEqual(sent, ["job1", "job2"])
+        self.assertEqual(self.scheduler.in_flight_ids(), ["job0"])
+
+    def test_explicit_requeue_releases_in_flight_jobs(self):
+        self.scheduler.drain(lambda job: (result(job, "unknown"), False))
+        self.assertEqual(self.scheduler.enqueue(JOBS[:1]), 0)
+        self.assertEqual(self.scheduler.in_flight_ids(), ["job0"])
+        self.assertEqual(self.scheduler.enqueue(JOBS[:1], requeue=True), 1)
+        self.assertEqual(self.scheduler.in_flight_ids(), [])
+
+    def test_queues_from_before_claims_are_migrated(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE apply_queue (job_id TEXT PRIMARY KEY, platform TEXT, "
+                     "data TEXT NOT NULL, enqueued_at REAL NOT NULL)")
+        conn.execute("INSERT INTO apply_queue VALUES ('job0', 'linkedin', '{\"id\": \"job0\"}', 1)")
+        scheduler = ApplyScheduler(conn, daily_limit=10, sleep=lambda s: None)
+        self.assertEqual(scheduler.pending_count(), 1)
+
+
+class DrainQueueTest(unittest.TestCase):
+    def test_unreadable_answer_is_not_resent(self):
+        routes = {"POST /api/jobs/apply": (200, "<html>Bad gateway</html>", "text/html")}
+        with FakeBackend(routes) as backend:
+            bot = make_bot(self, backend.url)
+            bot._scheduler = ApplyScheduler(
+                bot.store.conn, daily_limit=10, rate_per_minute=600, burst=10,
+                sleep=lambda s: None, lock_path=os.path.join(bot.home, "journal.jsonl"),
+            )
+            bot.scheduler.enqueue(JOBS)
+            bot.drain_queue()
+            bot.drain_queue()
+            sent = [job["id"] for _, body in backend.requests for job in body["jobs"]]
+        self.assertEqual(sent, ["job0", "job1"])
+        self.assertEqual(bot.scheduler.in_flight_ids(), ["job0", "job1"])
+        self.assertEqual(bot.scheduler.pending_count(), 1)
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_rejects_non_positive_rates(self):
+        for rate in (0, -1):
+            with self.assertRaises(ValueError):
+                TokenBucket(rate)
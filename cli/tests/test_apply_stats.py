@@ -0,0 +1,65 @@
+import sqlite3
+import unittest
+from datetime import date
+
+from apply_stats import ApplyStats, parse_since
+
+TODAY = date(2024, 5, 15)
+
+
+class ParseSinceTest(unittest.TestCase):
+    def test_values(self):
+        self.assertEqual(parse_since("today", TODAY), TODAY)
+        self.assertEqual(parse_since("1d", TODAY), TODAY)
+        self.assertEqual(parse_since("7d", TODAY), date(2024, 5, 9))
+        self.assertEqual(parse_since(" 2W ", TODAY), date(2024, 5, 2))
+        self.assertEqual(parse_since("2024-05-01", TODAY), date(2024, 5, 1))
+
+    def test_invalid(self):
+        for value in ("", "week", "7m", "2024-13-01"):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_since(value, TODAY)
+
+
+class RollupTest(unittest.TestCase):
+    def setUp(self):
+        conn = sqlite3.connect(":memory:")
+        self.addCleanup(conn.close)
+        self.stats = ApplyStats(conn)
+
+    def record_week(self):
+        acme = {"company": "Acme ", "platform": "LinkedIn"}
+        globex = {"company": "Globex", "platform": "indeed"}
+        self.stats.record([(acme, "success"), (globex, "failed")], day=date(2024, 5, 1))
+        self.stats.record([(acme, "success"), ({}, None)], day=TODAY)
+
+    def test_breakdowns(self):
+        self.record_week()
+        self.assertEqual(self.stats.totals(), {"success": 2, "failed": 2})
+        self.assertEqual(sorted(self.stats.breakdown("platform")),
+                         [("indeed", "failed", 1), ("linkedin", "success", 2),
+                          ("unknown", "failed", 1)])
+        self.assertEqual(sorted(self.stats.breakdown("company")),
+                         [("Acme", "success", 2), ("Globex", "failed", 1),
+                          ("unknown", "failed", 1)])
+        self.assertEqual(sorted(self.stats.breakdown("day")),
+                         [("2024-05-01", "failed", 1), ("2024-05-01", "success", 1),
+                          ("2024-05-15", "failed", 1), ("2024-05-15", "success", 1)])
+        with self.assertRaises(ValueError):
+            self.stats.breakdown("location")
+
+    def test_since_limits_the_days(self):
+        self.record_week()
+        self.assertEqual(self.stats.totals(parse_since("7d", TODAY)), {"success": 1, "failed": 1})
+
+    def test_rebuild_replaces_the_rollups(self):
+        self.record_week()
+        counted = self.stats.rebuild([
+            {"timestamp": "2024-05-14T10:00:00", "status": "success", "platform": "LinkedIn",
+             "company": "Acme"},
+            {"timestamp": "not a date", "status": "success"},
+            {"status": "failed"},
+        ])
+        self.assertEqual(counted, 1)
+        self.assertEqual(self.stats.totals(), {"success": 1})
+        self.assertEqual(self.stats.breakdown("day"), [("2024-05-14", "success", 1)])
@@ -0,0 +1,57 @@
+import os
+import shutil
+import socketserver
+import tempfile
+import threading
+import unittest
+
+from daemon import DaemonServer, early_socket, forward, send_command
+
+
+class EarlySocketTest(unittest.TestCase):
+    def test_socket_from_environment_or_option(self):
+        env = {"JOB_BOT_SOCKET": "/tmp/env.sock"}
+        self.assertEqual(early_socket(["search", "-k", "python"], env), "/tmp/env.sock")
+        self.assertEqual(early_socket(["--socket", "/tmp/a.sock", "stats"], env), "/tmp/a.sock")
+        self.assertEqual(early_socket(["--socket=/tmp/a.sock", "stats"], {}), "/tmp/a.sock")
+        self.assertIsNone(early_socket(["stats"], {}))
+
+    def test_local_commands_are_left_to_the_parser(self):
+        env = {"JOB_BOT_SOCKET": "/tmp/env.sock"}
+        for argv in (["config"], ["monitor", "watch"], ["results", "--brow"],
+                     ["search", "--output", "csv"], ["--out=json", "stats"],
+                     ["--trace", "t.json", "search"], ["--prof", "p.out", "stats"],
+                     ["--sock", "/tmp/a.sock", "stats"]):
+            with self.subTest(argv=argv):
+                self.assertIsNone(early_socket(argv, env))
+
+
+class ForwardTest(unittest.TestCase):
+    def serve(self, make_server):
+        """Path of a temporary socket served by `make_server(path)` in a thread"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "bot.sock")
+        server = make_server(path)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return path
+
+    def test_output_and_exit_code(self):
+        path = self.serve(lambda path: DaemonServer(
+            path, lambda argv, color, width: (" ".join(argv) + "\n", 3)))
+        self.assertEqual(send_command(path, ["stats", "--by", "day"]), ("stats --by day\n", 3))
+
+    def test_no_daemon_runs_locally(self):
+        self.assertIsNone(forward("/nonexistent/bot.sock", ["stats"]))
+
+    def test_daemon_without_an_answer_runs_locally(self):
+        class Hangup(socketserver.StreamRequestHandler):
+            def handle(self):
+                self.rfile.readline()
+
+        path = self.serve(lambda path: socketserver.UnixStreamServer(path, Hangup))
+        with self.assertRaises(ConnectionError):
+            send_command(path, ["stats"])
+        self.assertIsNone(forward(path, ["stats"]))
@@ -0,0 +1,59 @@
+import socket
+import unittest
+
+import requests
+
+from fake_backend import FakeBackend
+from http_client import DEFAULT_TIMEOUTS, ApiClient, request_not_sent
+
+
+def client_for(backend, read_timeout=0.2):
+    return ApiClient(
+        backend.url,
+        timeouts=dict.fromkeys(DEFAULT_TIMEOUTS, read_timeout),
+        retries=3,
+        backoff_factor=0,
+    )
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_apply_read_timeout_sends_once(self):
+        with FakeBackend({"POST /api/jobs/apply": 1.0}) as backend:
+            client = client_for(backend)
+            with self.assertRaises(requests.exceptions.ReadTimeout) as caught:
+                client.post("/api/jobs/apply", json={"jobs": [{"title": "x"}]})
+            client.close()
+            self.assertEqual(backend.count("POST /api/jobs/apply"), 1)
+            self.assertFalse(request_not_sent(caught.exception))
+
+    def test_post_retries_only_safe_statuses(self):
+        routes = {
+            "POST /api/jobs/search": (500, {"error": "boom"}),
+            "POST /api/monitor/watch": (503, {"error": "busy"}),
+        }
+        with FakeBackend(routes) as backend:
+            client = client_for(backend)
+            self.assertEqual(client.post("/api/jobs/search", json={}).status_code, 500)
+            self.assertEqual(client.post("/api/monitor/watch", json={}).status_code, 503)
+            client.close()
+            self.assertEqual(backend.count("POST /api/jobs/search"), 1)
+            self.assertEqual(backend.count("POST /api/monitor/watch"), 4)
+
+    def test_get_retries_read_timeouts(self):
+        with FakeBackend({"GET /api/monitor/status": 1.0}) as backend:
+            client = client_for(backend)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                client.get("/api/monitor/status")
+            client.close()
+            self.assertEqual(backend.count("GET /api/monitor/status"), 4)
+
+    def test_connection_refused_was_not_sent(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = ApiClient(f"http://127.0.0.1:{port}", retries=0)
+        with self.assertRaises(requests.exceptions.ConnectionError) as caught:
+            client.post("/api/jobs/apply", json={})
+        client.close()
+        self.assertTrue(request_not_sent(caught.exception))
+
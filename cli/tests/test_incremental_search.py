@@ -0,0 +1,75 @@
+import unittest
+
+from bot_home import make_bot
+from fake_backend import FakeBackend
+from search_cache import cache_key
+
+NDJSON = "application/x-ndjson"
+JOBS = [{"title": f"Engineer {i}", "company": "Acme", "url": f"https://jobs.example/{i}",
+         "platform": "LinkedIn"} for i in range(3)]
+
+
+class HighWaterMarkTest(unittest.TestCase):
+    def search(self, response, stream=False):
+        """Run one incremental search against a backend that sends `response`"""
+        with FakeBackend({"POST /api/jobs/search": lambda body: response}) as backend:
+            bot = make_bot(self, backend.url)
+            if stream:
+                bot.stream_search("python", "Remote", incremental=True)
+            else:
+                bot.search_jobs("python", "Remote", incremental=True)
+        return bot
+
+    def mark(self, bot, keywords="python", location="Remote"):
+        return bot.store.search_mark(cache_key(keywords, location, bot.config["platforms"]))
+
+    def test_complete_result_moves_the_mark(self):
+        bot = self.search((200, {"success": True, "jobs": JOBS, "errors": {}}))
+        self.assertIsNotNone(self.mark(bot))
+
+    def test_failed_platform_keeps_the_mark(self):
+        bot = self.search((200, {"success": True, "jobs": JOBS,
+                                    "errors": {"indeed": "Navigation timeout"}}))
+        self.assertIsNone(self.mark(bot))
+        # What did arrive still counts as seen
+        query_key = cache_key("python", "Remote", bot.config["platforms"])
+        self.assertEqual(bot.store.unseen_jobs(query_key, JOBS), [])
+
+    def test_unreported_errors_keep_the_mark(self):
+        bot = self.search((200, {"success": True, "jobs": JOBS}))
+        self.assertIsNone(self.mark(bot))
+
+    def test_stream_with_end_record_moves_the_mark(self):
+        bot = self.search((200, JOBS + [{"_end": True, "errors": {}}], NDJSON), stream=True)
+        self.assertIsNotNone(self.mark(bot))
+        self.assertEqual(bot.store.last_search_count(), len(JOBS))
+
+    def test_cut_off_stream_keeps_the_mark(self):
+        bot = self.search((200, JOBS, NDJSON), stream=True)
+        self.assertIsNone(self.mark(bot))
+
+    def test_stream_error_record_keeps_the_mark(self):
+        records = JOBS + [{"_end": True, "errors": {"search": "browser crashed"}}]
+        bot = self.search((200, records, NDJSON), stream=True)
+        self.assertIsNone(self.mark(bot))
+
+    def test_multi_query_marks_only_complete_queries(self):
+        def search(body):
+            errors = {"linkedin": "blocked"} if body["keywords"] == "go" else {}
+            return 200, {"success": True, "jobs": JOBS, "errors": errors}
+
+        with FakeBackend({"POST /api/jobs/search": search}) as backend:
+            bot = make_bot(self, backend.url)
+            bot.search_many([("python", "Remote"), ("go", "Remote")], incremental=True)
+        self.assertIsNotNone(self.mark(bot, "python"))
+        self.assertIsNone(self.mark(bot, "go"))
+
+    def test_next_run_searches_the_failed_period_again(self):
+        partial = (200, {"success": True, "jobs": JOBS, "errors": {"indeed": "timeout"}})
+        with FakeBackend({"POST /api/jobs/search": lambda body: partial}) as backend:
+            bot = make_bot(self, backend.url)
+            bot.search_jobs("python", "Remote", incremental=True)
+            bot.search_jobs("python", "Remote", incremental=True)
+            bodies = [body for key, body in backend.requests]
+        self.assertEqual(len(bodies), 2)
+        self.assertNotIn("since", bodies[1])
@@ -0,0 +1,104 @@
+import json
+import os
+import unittest
+
+from bot_home import make_bot
+from job_filter import JobFilter, KeywordMatcher, merge_rules, parse_salary
+from job_model import JobSet
+
+JOBS = [
+    {"id": "a", "title": "Senior Python Developer", "company": "Acme", "location": "Remote",
+     "salary": "$120K - $150K", "description": "Django and machine learning"},
+    {"id": "b", "title": "C++ Engineer", "company": "Globex", "location": "Berlin",
+     "salary": 90000},
+    {"id": "c", "title": "Python Intern", "company": "Initech", "location": "Remote",
+     "salary": "45,000 per year"},
+    {"id": "d", "title": "Data Engineer (Python)", "company": "Umbrella", "location": "Paris",
+     "description": "Machine-learning platform"},
+]
+
+
+def ids(jobs):
+    return [job["id"] for job in jobs]
+
+
+class KeywordMatcherTest(unittest.TestCase):
+    def test_whole_words_and_phrases(self):
+        matcher = KeywordMatcher(["python", "machine learning", "C++", "go"])
+        self.assertEqual(matcher.find("Python/Django dev, machine-learning"),
+                         {"python", "machine learning"})
+        self.assertEqual(matcher.find("Senior C++ engineer"), {"c++"})
+        # "go" is not found inside other words
+        self.assertEqual(matcher.find("Google ergonomics"), set())
+
+    def test_phrases_do_not_span_fields(self):
+        matcher = KeywordMatcher(["machine learning"])
+        self.assertEqual(matcher.find_all(["Machine | Learning Corp", "machine learning"]),
+                         [set(), {"machine learning"}])
+
+
+class ParseSalaryTest(unittest.TestCase):
+    def test_amounts(self):
+        self.assertEqual(parse_salary("$120K - $150K"), 120000)
+        self.assertEqual(parse_salary("45,000 per year"), 45000)
+        self.assertEqual(parse_salary("€ 65.5k"), 65500)
+        self.assertEqual(parse_salary(90000), 90000)
+
+    def test_no_amount(self):
+        for value in (None, "", "Competitive", {"min": 1}):
+            self.assertIsNone(parse_salary(value))
+
+
+class JobFilterTest(unittest.TestCase):
+    def select(self, rules, rank=True):
+        selected = JobFilter(rules).select(JOBS, rank)
+        # The column store gives the same answer
+        self.assertEqual(ids(JobFilter(rules).select(JobSet(JOBS), rank)), ids(selected))
+        return ids(selected)
+
+    def test_include_ranks_by_boost(self):
+        rules = {"include": ["python"], "boost": {"machine learning": 2}}
+        self.assertEqual(self.select(rules), ["a", "d", "c"])
+        self.assertEqual(self.select(rules, rank=False), ["a", "c", "d"])
+
+    def test_exclusions(self):
+        self.assertEqual(self.select({"exclude": ["intern"]}), ["a", "b", "d"])
+        self.assertEqual(self.select({"exclude_companies": ["globex", " ACME "]}), ["c", "d"])
+        self.assertEqual(self.select({"exclude_title_regex": r"^(senior|c\+\+)"}), ["c", "d"])
+        self.assertEqual(self.select({"title_regex": "engineer$"}), ["b"])
+
+    def test_min_salary_keeps_unlisted_salaries(self):
+        self.assertEqual(self.select({"min_salary": 100000}), ["a", "d"])
+        self.assertEqual(self.select({"min_salary": "85k"}), ["a", "b", "d"])
+
+    def test_invalid_rules(self):
+        for rules in ({"title_regex": "("}, {"exclude_title_regex": "[a-"},
+                      {"min_salary": "lots"}, {"boost": {"python": "high"}}):
+            with self.subTest(rules=rules), self.assertRaises(ValueError):
+                JobFilter(rules)
+
+    def test_command_line_rules_extend_the_config(self):
+        rules = merge_rules({"include": ["python"], "min_salary": 1},
+                            {"include": ["go"], "min_salary": None, "title_regex": ""})
+        self.assertEqual(rules, {"include": ["python", "go"], "min_salary": 1})
+
+
+class FilterConfigTest(unittest.TestCase):
+    def bot_with_filters(self, filters):
+        bot = make_bot(self, "http://127.0.0.1:9")
+        with open(os.path.join(bot.home, ".job-bot-config.json"), "w") as f:
+            json.dump({"filters": filters}, f)
+        return bot, bot.load_config()["filters"]
+
+    def test_salary_string_becomes_a_number(self):
+        _, filters = self.bot_with_filters({"min_salary": "120k", "include": ["python"]})
+        self.assertEqual(filters, {"min_salary": 120000, "include": ["python"]})
+
+    def test_unusable_rules_are_dropped(self):
+        _, filters = self.bot_with_filters({"exclude_title_regex": "(", "min_salary": "lots"})
+        self.assertEqual(filters, {})
+
+    def test_invalid_command_line_regex_is_refused(self):
+        bot, _ = self.bot_with_filters({})
+        self.assertFalse(bot.set_filters({"title_regex": "("}))
+        self.assertTrue(bot.set_filters({"title_regex": "python"}))
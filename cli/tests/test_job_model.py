@@ -0,0 +1,30 @@
+import unittest
+
+from job_model import JobSet
+
+JOBS = [
+    {"id": "a", "title": "Backend Engineer", "company": "Acme", "location": "Remote",
+     "platform": "linkedin", "url": "https://example.com/a", "salary": 120000},
+    {"id": "b", "title": "Data Engineer", "company": "Globex", "location": "Berlin",
+     "platform": "indeed", "url": "https://example.com/b"},
+    {"id": "c", "title": "Backend Engineer", "company": "Initech", "location": "Remote",
+     "platform": "linkedin", "url": "https://example.com/c", "salary": 90000},
+]
+
+
+class TakeTest(unittest.TestCase):
+    def test_rows_in_given_order(self):
+        subset = JobSet(JOBS).take([2, 0])
+        self.assertEqual(subset.to_dicts(), [JOBS[2], JOBS[0]])
+
+    def test_subset_is_independent(self):
+        jobs = JobSet(JOBS)
+        before = jobs.to_dicts()
+        subset = jobs.take([0, 2])
+        subset.append({"id": "d", "title": "Site Reliability Engineer", "company": "Umbrella",
+                       "location": "Paris", "platform": "glassdoor"})
+        subset[0].extra["salary"] = 1
+        self.assertEqual(jobs.to_dicts(), before)
+        self.assertNotIn("Umbrella", jobs.value_counts("company"))
+        self.assertEqual(len(jobs.columns["title"].values), 2)
+
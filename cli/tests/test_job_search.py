@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import unittest
+
+from bot_home import make_bot
+from fake_backend import FakeBackend
+from http_client import ApiClient
+from job_search import (build_query_plan, canonical_url, dedupe_jobs, fan_out, load_queries,
+                        run_searches)
+
+
+class DedupeTest(unittest.TestCase):
+    def test_tracking_parameters_are_ignored(self):
+        self.assertEqual(
+            canonical_url("https://WWW.Indeed.com/viewjob/?jk=abc&utm_source=x&from=serp#top"),
+            canonical_url("https://www.indeed.com/viewjob?jk=abc"),
+        )
+        self.assertNotEqual(canonical_url("https://indeed.com/viewjob?jk=abc"),
+                            canonical_url("https://indeed.com/viewjob?jk=def"))
+
+    def test_keeps_first_occurrence(self):
+        jobs = [
+            {"title": "Backend Engineer", "company": "Acme", "url": "https://a.io/1?ref=x", "n": 1},
+            {"title": "backend  engineer", "company": "ACME ", "url": "https://a.io/1", "n": 2},
+            {"title": "Backend Engineer", "company": "Globex", "url": "https://a.io/1", "n": 3},
+        ]
+        self.assertEqual([job["n"] for job in dedupe_jobs(jobs)], [1, 3])
+
+    def test_load_queries(self):
+        handle, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as f:
+            f.write("# comment\nPython Developer | Berlin\n\nData Engineer\n")
+        self.addCleanup(os.unlink, path)
+        self.assertEqual(load_queries(path, "Remote"),
+                         [("Python Developer", "Berlin"), ("Data Engineer", "Remote")])
+
+
+class RunSearchesTest(unittest.TestCase):
+    def test_results_in_query_order_with_errors(self):
+        def search(body):
+            if body["keywords"] == "broken":
+                return 500, {"error": "boom"}
+            return 200, {"jobs": [{"title": body["keywords"], "location": body["location"],
+                                   "platforms": body["platforms"]}]}
+
+        queries = [("python", "Remote"), ("broken", "Remote"), ("go", "Berlin")]
+        seen = []
+        with FakeBackend({"POST /api/jobs/search": search}) as backend:
+            client = ApiClient(backend.url, retries=0)
+            results = run_searches(client, queries, ["linkedin"], concurrency=2,
+                                   on_result=lambda query, jobs, error, failed: seen.append(query))
+            client.close()
+        self.assertEqual([query for query, _, _, _ in results], queries)
+        self.assertEqual(sorted(seen), sorted(queries))
+        (_, python, ok, _), (_, broken, error, _), (_, go, _, _) = results
+        self.assertEqual(python, [{"title": "python", "location": "Remote",
+                                   "platforms": ["linkedin"]}])
+        self.assertIsNone(ok)
+        self.assertEqual((broken, error), ([], "HTTP 500"))
+        self.assertEqual(go[0]["location"], "Berlin")
+
+
+class QueryPlanTest(unittest.TestCase):
+    DEFAULTS = {"keywords": "Software Engineer", "location": "Remote",
+                "platforms": ["linkedin", "indeed"]}
+
+    def test_shared_searches_are_planned_once(self):
+        profiles = {
+            "alice": {"keywords": ["Python Developer", "Data Engineer"],
+                      "platforms": ["LinkedIn"]},
+            "bob": {"keywords": "python  developer", "location": ["Remote", "Berlin"]},
+        }
+        plan, wanted = build_query_plan(profiles, self.DEFAULTS)
+        self.assertEqual(list(plan), [("Python Developer", "Remote"), ("Data Engineer", "Remote"),
+                                      ("python  developer", "Berlin")])
+        self.assertEqual(plan[("Python Developer", "Remote")], ["indeed", "linkedin"])
+        self.assertEqual(plan[("Data Engineer", "Remote")], ["linkedin"])
+        self.assertEqual(wanted["alice"], [(("Python Developer", "Remote"), "linkedin"),
+                                           (("Data Engineer", "Remote"), "linkedin")])
+        self.assertEqual(wanted["bob"][:2], [(("Python Developer", "Remote"), "linkedin"),
+                                             (("Python Developer", "Remote"), "indeed")])
+
+    def test_plan_does_not_depend_on_profile_order(self):
+        profiles = {"a": {"platforms": ["indeed"]}, "b": {"platforms": ["linkedin"]}}
+        reordered = dict(reversed(list(profiles.items())))
+        self.assertEqual(build_query_plan(profiles, self.DEFAULTS)[0],
+                         build_query_plan(reordered, self.DEFAULTS)[0])
+
+    def test_fan_out_by_platform_without_duplicates(self):
+        query = ("Python Developer", "Remote")
+        job = {"title": "Python Developer", "company": "Acme", "url": "https://a.io/1"}
+        results = {query: [dict(job, platform="LinkedIn"), dict(job, platform="Indeed"),
+                           dict(job, company="Globex")]}
+        wanted = {"alice": [(query, "linkedin")],
+                  "bob": [(query, "linkedin"), (query, "indeed")]}
+        jobs = fan_out(results, wanted)
+        self.assertEqual([(job.get("platform"), job["company"]) for job in jobs["alice"]],
+                         [("LinkedIn", "Acme"), (None, "Globex")])
+        # The same posting from both boards is kept once
+        self.assertEqual([(job.get("platform"), job["company"]) for job in jobs["bob"]],
+                         [("LinkedIn", "Acme"), (None, "Globex")])
+
+
+class ProfileConfigTest(unittest.TestCase):
+    def test_unusable_profiles_are_dropped(self):
+        bot = make_bot(self, "http://127.0.0.1:9")
+        with open(os.path.join(bot.home, ".job-bot-config.json"), "w") as f:
+            json.dump({"profiles": {"alice": "python", "bob": {"keywords": 42,
+                                                               "location": ["Remote"]}}}, f)
+        profiles = bot.load_config()["profiles"]
+        self.assertEqual(profiles, {"bob": {"location": ["Remote"]}})
+        plan, _ = build_query_plan(profiles, bot.config)
+        self.assertEqual(list(plan), [("Software Engineer", "Remote")])
@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from job_store import JobStore, job_id
+
+JOBS = [
+    {"title": "Python Developer", "company": "Acme", "location": "Remote",
+     "platform": "LinkedIn", "url": "https://jobs.example/1?utm_source=x"},
+    {"title": "Data Engineer", "company": "Globex", "location": "Berlin",
+     "platform": "Indeed", "url": "https://jobs.example/2"},
+    {"title": "Backend Engineer", "company": "acme", "location": "Paris",
+     "platform": "LinkedIn", "url": "https://jobs.example/3"},
+]
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.store = JobStore(os.path.join(directory, "jobs.db"))
+        self.addCleanup(self.store.close)
+
+
+class LastSearchTest(StoreTestCase):
+    def test_ids_ignore_tracking_and_spelling(self):
+        self.assertEqual(job_id(JOBS[0]), job_id(dict(JOBS[0], title="python  developer",
+                                                       url="https://jobs.example/1")))
+        self.assertNotEqual(job_id(JOBS[0]), job_id(JOBS[1]))
+
+    def test_result_order_and_lookups(self):
+        ids = self.store.upsert_jobs(JOBS)
+        self.store.set_last_search(ids[::-1])
+        self.assertEqual(self.store.last_search_count(), 3)
+        self.assertEqual([job["company"] for job in self.store.last_search_jobs()],
+                         ["acme", "Globex", "Acme"])
+        self.assertEqual([job["id"] for job in self.store.jobs_at_positions([3, 9, 1])],
+                         [ids[0], ids[2]])
+        self.assertEqual([job["title"] for job in self.store.jobs_by_ids([ids[1], "nope"])],
+                         ["Data Engineer"])
+
+    def test_upsert_refreshes_known_jobs(self):
+        first = self.store.upsert_jobs(JOBS)
+        again = self.store.upsert_jobs([dict(JOBS[1], location="Hamburg")])
+        self.assertEqual(again, first[1:2])
+        self.assertEqual(self.store.jobs_by_ids(again)[0]["location"], "Hamburg")
+        self.assertEqual(len(self.store.all_jobs()), 3)
+
+
+class SeenJobsTest(StoreTestCase):
+    def test_unseen_jobs_per_query(self):
+        self.store.mark_seen("python|remote", JOBS[:1])
+        fresh = self.store.unseen_jobs("python|remote", JOBS + [dict(JOBS[1])])
+        self.assertEqual([job["title"] for job in fresh], ["Data Engineer", "Backend Engineer"])
+        # Another query has seen nothing yet
+        self.assertEqual(len(self.store.unseen_jobs("go|remote", JOBS)), 3)
+
+    def test_mark_moves_only_with_run_start(self):
+        self.store.mark_seen("python|remote", JOBS)
+        self.assertIsNone(self.store.search_mark("python|remote"))
+        self.store.mark_seen("python|remote", JOBS, run_started=1000.0)
+        self.assertEqual(self.store.search_mark("python|remote"), 1000.0)
+        self.assertEqual(self.store.unseen_jobs("python|remote", JOBS), [])
+
+
+class PagingTest(StoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.store.set_last_search(self.store.upsert_jobs(JOBS))
+
+    def positions(self, offset, limit, sort=None, descending=False):
+        return [position for position, _ in
+                self.store.last_search_page(offset, limit, sort, descending)]
+
+    def test_pages_in_result_order(self):
+        self.assertEqual(self.positions(0, 2), [1, 2])
+        self.assertEqual(self.positions(2, 2), [3])
+        position, job = self.store.last_search_page(1, 1)[0]
+        self.assertEqual((position, job["title"], job["platform"]), (2, "Data Engineer", "Indeed"))
+
+    def test_sorted_pages_keep_result_order_for_ties(self):
+        self.assertEqual(self.positions(0, 2, "company"), [1, 3])
+        self.assertEqual(self.positions(2, 2, "company"), [2])
+        self.assertEqual(self.positions(0, 3, "company", descending=True), [2, 1, 3])
+        with self.assertRaises(ValueError):
+            self.positions(0, 3, "url")
+
+    def test_rank_matches_the_sorted_page(self):
+        for sort in (None, "title", "company", "location"):
+            for descending in (False, True):
+                order = self.positions(0, 3, sort, descending)
+                with self.subTest(sort=sort, descending=descending):
+                    self.assertEqual([self.store.last_search_rank(position, sort, descending)
+                                      for position in order], [0, 1, 2])
+        self.assertIsNone(self.store.last_search_rank(4))
@@ -0,0 +1,37 @@
+import csv
+import io
+import json
+import unittest
+
+from output import open_writer
+
+
+def write(fmt, records):
+    stream = io.StringIO()
+    writer = open_writer(fmt, stream)
+    writer.write_many(records)
+    writer.close()
+    return stream.getvalue()
+
+
+RECORDS = [
+    {"id": "a", "title": "Engineer", "tags": ["python", "remote"]},
+    {"id": "b", "title": "Analyst", "salary": "90k", "remote": True},
+    {"id": "c"},
+]
+
+
+class CsvWriterTest(unittest.TestCase):
+    def test_later_fields_go_to_extra(self):
+        rows = list(csv.DictReader(io.StringIO(write("csv", RECORDS))))
+        self.assertEqual(list(rows[0]), ["id", "title", "tags", "extra"])
+        self.assertEqual(json.loads(rows[0]["tags"]), ["python", "remote"])
+        self.assertEqual(rows[0]["extra"], "")
+        self.assertEqual(json.loads(rows[1]["extra"]), {"salary": "90k", "remote": True})
+        self.assertEqual((rows[2]["id"], rows[2]["title"]), ("c", ""))
+
+    def test_json_formats_keep_every_field(self):
+        self.assertEqual(json.loads(write("json", RECORDS)), RECORDS)
+        self.assertEqual([json.loads(line) for line in write("ndjson", RECORDS).splitlines()],
+                         RECORDS)
+        self.assertEqual(json.loads(write("json", [])), [])
@@ -0,0 +1,45 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from request_pool import RequestPool
+
+
+class RequestPoolTest(unittest.TestCase):
+    def test_bounds_calls_in_flight(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def work(value):
+            with lock:
+                running.append(value)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(value)
+            return value * 2
+
+        async def main():
+            async with RequestPool(3) as pool:
+                return await asyncio.gather(*(pool.call(work, i) for i in range(12)))
+
+        self.assertEqual(asyncio.run(main()), [i * 2 for i in range(12)])
+        self.assertEqual(max(peak), 3)
+
+    def test_error_shuts_down_workers(self):
+        pools = []
+
+        async def main():
+            async with RequestPool(2) as pool:
+                pools.append(pool)
+                await pool.call(time.sleep, 0)
+                raise KeyError("boom")
+
+        with self.assertRaises(KeyError):
+            asyncio.run(main())
+        # Nothing new can start once the block is left
+        with self.assertRaises(RuntimeError):
+            pools[0]._executor.submit(time.sleep, 0)
+
@@ -0,0 +1,48 @@
+import json
+import os
+import tempfile
+import unittest
+from multiprocessing import Pool
+
+from state_file import StateFile
+
+WRITERS = 8
+ROUNDS = 20
+
+
+def bump(args):
+    """Set this writer's key ROUNDS times through read-modify-write updates"""
+    path, writer = args
+    state = StateFile(path, version=1)
+    for round_ in range(ROUNDS):
+        state.update(lambda saved: dict(saved, **{f"writer{writer}": round_ + 1}))
+
+
+class StateFileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "config.json")
+
+    def test_concurrent_updates_keep_every_key(self):
+        StateFile(self.path).write({"keywords": "Python"})
+        with Pool(WRITERS) as pool:
+            pool.map(bump, [(self.path, writer) for writer in range(WRITERS)])
+        data = StateFile(self.path).read()
+        self.assertEqual(data["keywords"], "Python")
+        for writer in range(WRITERS):
+            self.assertEqual(data[f"writer{writer}"], ROUNDS)
+
+    def test_refuses_newer_format(self):
+        with open(self.path, "w") as f:
+            json.dump({"version": 2, "keywords": "Go"}, f)
+        with self.assertRaises(RuntimeError):
+            StateFile(self.path, version=1).update(lambda saved: dict(saved, location="Remote"))
+
+    def test_repairs_unreadable_file(self):
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        self.assertEqual(StateFile(self.path).update(lambda saved: dict(saved, a=1)), {"a": 1})
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"version": 1, "a": 1})
+
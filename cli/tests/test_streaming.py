@@ -0,0 +1,44 @@
+import json
+import unittest
+
+from streaming import iter_json_array
+
+DOCUMENT = {
+    "success": True,
+    "count": 12345,
+    "jobs": [
+        {"title": "Backend Engineer", "salary": 123456.789, "score": -0.25, "rank": 1.5e3},
+        {"title": "Ingénieur logiciel – Zürich", "tags": ["python", "go"], "remote": None},
+        {"title": "Data \"Platform\" Engineer\n", "salary": 98765, "score": -1e-3},
+        12345.678,
+        -0.5,
+        7,
+    ],
+    "meta": {"took": 0.042, "pages": [1, 2, 3]},
+}
+
+
+class ChunkBoundaryTest(unittest.TestCase):
+    def test_every_split_offset(self):
+        data = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+        for offset in range(1, len(data)):
+            with self.subTest(offset=offset, around=data[max(0, offset - 8):offset + 8]):
+                jobs = list(iter_json_array([data[:offset], data[offset:]]))
+                self.assertEqual(jobs, DOCUMENT["jobs"])
+
+    def test_byte_at_a_time(self):
+        data = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+        chunks = [data[i:i + 1] for i in range(len(data))]
+        self.assertEqual(list(iter_json_array(chunks)), DOCUMENT["jobs"])
+
+    def test_reported_splits(self):
+        self.assertEqual(list(iter_json_array([b'{"jobs":[1.5e', b'3]}'])), [1500.0])
+        self.assertEqual(list(iter_json_array([b'{"jobs":[12345.', b'678]}'])), [12345.678])
+        self.assertEqual(list(iter_json_array([b'{"jobs":[-0.', b'5]}'])), [-0.5])
+
+    def test_other_members_are_kept(self):
+        data = json.dumps(DOCUMENT).encode()
+        others = {}
+        jobs = list(iter_json_array([data[:40], data[40:]], others=others))
+        self.assertEqual(jobs, DOCUMENT["jobs"])
+        self.assertEqual(others, {key: value for key, value in DOCUMENT.items() if key != "jobs"})
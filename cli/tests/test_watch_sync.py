@@ -0,0 +1,80 @@
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+
+from fake_backend import FakeBackend
+from http_client import ApiClient
+from watch_sync import (diff_watches, dump_watches, load_watches, normalize_watch,
+                        sync_concurrently)
+
+
+class SyncConcurrentlyTest(unittest.TestCase):
+    def test_failed_requests_are_counted(self):
+        routes = {"POST /api/monitor/watch": (200, {"success": True}),
+                  "DELETE /api/monitor/watch/w1": (500, {"error": "boom"})}
+        done = []
+        with FakeBackend(routes) as backend:
+            client = ApiClient(backend.url, retries=0)
+            failed = asyncio.run(sync_concurrently(
+                client, [{"keywords": "a"}, {"keywords": "b"}], [{"id": "w1"}],
+                concurrency=2, on_done=lambda action, watch, error: done.append((action, error)),
+            ))
+            client.close()
+        self.assertEqual(failed, 1)
+        self.assertEqual(sorted(done), [("add", None), ("add", None), ("remove", "HTTP 500")])
+
+
+
+def backend_item(watch_id, keywords, location="Remote", **fields):
+    """A watch as the backend lists it, with minSalary/remote under `filters`"""
+    item = {"id": watch_id, "keywords": keywords, "location": location,
+            "platforms": ["linkedin", "indeed"], "autoApply": True,
+            "filters": {"remote": False, "minSalary": None}, "createdAt": "2024-05-01"}
+    item.update(fields)
+    return item
+
+
+class DiffWatchesTest(unittest.TestCase):
+    def test_unchanged_watches_are_left_alone(self):
+        desired = [normalize_watch({"keywords": " python developer", "location": "remote",
+                                    "platforms": "Indeed;LinkedIn", "email": "a@b.c"})]
+        current = [backend_item("w1", "Python  Developer")]
+        self.assertEqual(diff_watches(desired, current), ([], []))
+
+    def test_changed_fields_replace_the_watch(self):
+        desired = [normalize_watch({"keywords": "Python Developer", "location": "Remote",
+                                    "min_salary": "90000"}),
+                   normalize_watch({"keywords": "Go", "location": "Berlin"})]
+        current = [backend_item("w1", "Python Developer"), backend_item("w2", "Rust")]
+        to_add, to_remove = diff_watches(desired, current)
+        self.assertEqual([(w["keywords"], w["minSalary"]) for w in to_add],
+                         [("Python Developer", 90000), ("Go", None)])
+        self.assertEqual(sorted(item["id"] for item in to_remove), ["w1", "w2"])
+
+    def test_duplicates_match_one_for_one(self):
+        watch = normalize_watch({"keywords": "Python", "location": "Remote"})
+        current = [backend_item("w1", "Python"), backend_item("w2", "Python"),
+                   backend_item("w3", "Python")]
+        to_add, to_remove = diff_watches([watch, watch], current)
+        self.assertEqual(to_add, [])
+        self.assertEqual(len(to_remove), 1)
+        self.assertEqual(diff_watches([watch, watch], current[:1])[0], [watch])
+
+    def test_export_imports_back_without_changes(self):
+        current = [backend_item("w1", "Python", remote=True),
+                   backend_item("w2", "Go", "Berlin", platforms=["indeed"])]
+        for fmt in ("json", "csv"):
+            with self.subTest(fmt=fmt):
+                stream = io.StringIO()
+                dump_watches(current, stream, fmt)
+                path = self.write(stream.getvalue(), fmt)
+                self.assertEqual(diff_watches(load_watches(path), current), ([], []))
+
+    def write(self, text, fmt):
+        handle, path = tempfile.mkstemp(suffix=f".{fmt}")
+        with os.fdopen(handle, "w") as f:
+            f.write(text)
+        self.addCleanup(os.unlink, path)
+        return path
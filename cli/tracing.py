@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Tracing
+Timed spans around CLI hot paths, exported as Chrome trace events or OTLP JSON
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+TRACE_FORMATS = ("chrome", "otel")
+
+
+class _NoSpan:
+    """Returned while tracing is off so instrumented code pays almost nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set(self, key, value):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Span:
+    """One timed operation; nests under the span open on the same thread"""
+
+    __slots__ = ("tracer", "name", "category", "attrs", "span_id", "parent_id",
+                 "thread_id", "start_ns", "end_ns")
+
+    def __init__(self, tracer, name, category, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self.span_id = next(tracer._ids)
+        self.parent_id = None
+        self.thread_id = None
+        self.start_ns = self.end_ns = 0
+
+    def set(self, key, value):
+        self.attrs[key] = value
+
+    def __enter__(self):
+        stack = self.tracer._stack()
+        # Work handed to a thread pool hangs off the command's root span
+        self.parent_id = stack[-1].span_id if stack else self.tracer.root_id
+        if self.tracer.root_id is None:
+            self.tracer.root_id = self.span_id
+        stack.append(self)
+        self.thread_id = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.perf_counter_ns()
+        self.tracer._stack().pop()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer.spans.append(self)
+        return False
+
+    @property
+    def duration_ns(self):
+        return self.end_ns - self.start_ns
+
+
+class Tracer:
+    """Collects spans for one command while enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.spans = []
+        self.root_id = None
+        self.trace_id = None
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._start_ns = 0
+        self._epoch_offset_ns = 0
+
+    def start(self):
+        self.enabled = True
+        self.spans = []
+        self.root_id = None
+        self.trace_id = os.urandom(16).hex()
+        self._start_ns = time.perf_counter_ns()
+        # perf_counter has the resolution; this maps it onto wall-clock time
+        self._epoch_offset_ns = time.time_ns() - self._start_ns
+
+    def stop(self):
+        self.enabled = False
+
+    def span(self, name, category="cli", **attrs):
+        if not self.enabled:
+            return _NO_SPAN
+        return Span(self, name, category, attrs)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def summary(self):
+        """(name, count, total ms) per span name, slowest first"""
+        totals = {}
+        for span in self.spans:
+            count, total = totals.get(span.name, (0, 0))
+            totals[span.name] = (count + 1, total + span.duration_ns)
+        rows = [(name, count, total / 1e6) for name, (count, total) in totals.items()]
+        return sorted(rows, key=lambda row: -row[2])
+
+    def chrome_trace(self):
+        """Trace-event JSON for chrome://tracing and Perfetto"""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self._start_ns) / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.attrs,
+            }
+            for span in sorted(self.spans, key=lambda span: span.start_ns)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def otel_trace(self):
+        """OTLP/JSON export, as accepted by OpenTelemetry collectors"""
+        spans = []
+        for span in sorted(self.spans, key=lambda span: span.start_ns):
+            data = {
+                "traceId": self.trace_id,
+                "spanId": f"{span.span_id:016x}",
+                "name": span.name,
+                # SPAN_KIND_CLIENT for backend calls, SPAN_KIND_INTERNAL otherwise
+                "kind": 3 if span.category == "http" else 1,
+                "startTimeUnixNano": str(span.start_ns + self._epoch_offset_ns),
+                "endTimeUnixNano": str(span.end_ns + self._epoch_offset_ns),
+                "attributes": [_otel_attribute("category", span.category)] + [
+                    _otel_attribute(key, value) for key, value in span.attrs.items()
+                ],
+            }
+            if span.parent_id is not None and span.parent_id != span.span_id:
+                data["parentSpanId"] = f"{span.parent_id:016x}"
+            if "error" in span.attrs:
+                data["status"] = {"code": 2, "message": span.attrs["error"]}
+            spans.append(data)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otel_attribute("service.name", "job-bot-cli")]},
+                "scopeSpans": [{"scope": {"name": "job-bot-cli"}, "spans": spans}],
+            }]
+        }
+
+    def write(self, path, fmt="chrome"):
+        trace = self.otel_trace() if fmt == "otel" else self.chrome_trace()
+        with open(path, "w") as f:
+            json.dump(trace, f)
+
+
+def _otel_attribute(key, value):
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+# Process-wide tracer; spans are no-ops until a command turns it on
+tracer = Tracer()
+
+
+def span(name, category="cli", **attrs):
+    """Context manager timing a block: `with span("decode", "decode"): ...`"""
+    return tracer.span(name, category, **attrs)
+
+
+def traced(name=None, category="cli"):
+    """Decorator timing every call of a function as one span"""
+    def decorate(func):
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(tracer, label, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def decode(response, name="decode"):
+    """`response.json()` timed as a decode span"""
+    with span(name, "decode", bytes=len(response.content)):
+        return response.json()
+
+
+@contextmanager
+def trace_command(name, trace_path=None, trace_format="chrome", profile_path=None):
+    """Record spans and/or a cProfile dump for the duration of one command"""
+    profiler = None
+    if trace_path:
+        tracer.start()
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        with tracer.span(f"command {name}", "command"):
+            yield tracer
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        if trace_path:
+            tracer.stop()
+            tracer.write(trace_path, trace_format)
+
+
+def add_trace_arguments(parser, hidden=False):
+    """Register --trace/--trace-format/--profile; `hidden` copies accept them after a subcommand"""
+    import argparse
+
+    def add(flag, **kwargs):
+        if hidden:
+            kwargs.update(default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+        parser.add_argument(flag, **kwargs)
+
+    add('--trace', metavar='FILE',
+        help='Record timed spans (HTTP, decode, render, persist) and write them to FILE')
+    add('--trace-format', choices=TRACE_FORMATS, default='chrome',
+        help='Trace file format: Chrome trace events or OpenTelemetry OTLP/JSON (default: chrome)')
+    add('--profile', metavar='FILE',
+        help='Write a cProfile dump of the command to FILE (view with python -m pstats)')
+
+
+def run_traced(name, args, run, limit=10):
+    """Run a command under --trace/--profile and print where the time went to stderr"""
+    trace_path = getattr(args, "trace", None)
+    profile_path = getattr(args, "profile", None)
+    if not trace_path and not profile_path:
+        return run()
+    try:
+        with trace_command(name, trace_path, args.trace_format, profile_path):
+            return run()
+    finally:
+        from rich.console import Console
+
+        console = Console(stderr=True)
+        if trace_path:
+            console.print(
+                f"\n[dim]Trace: {len(tracer.spans)} spans written to {trace_path} "
+                f"({args.trace_format})[/dim]"
+            )
+            for span_name, count, total_ms in tracer.summary()[:limit]:
+                console.print(f"[dim]  {total_ms:10.1f} ms  {count:>4}×  {span_name}[/dim]")
+        if profile_path:
+            console.print(f"[dim]Profile written to {profile_path}[/dim]")
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Job Application Bot - Watch List Sync
+Reads and writes watch lists as YAML/JSON/CSV and syncs them with the backend
+"""
+
+import csv
+import json
+from collections import defaultdict
+from functools import partial
+from pathlib import Path
+
+from apply_pipeline import chunked
+from job_search import normalize_text
+
+FORMATS = ("json", "yaml", "csv")
+
+# Fields a watch file may set, in export order
+WATCH_FIELDS = ["keywords", "location", "platforms", "autoApply", "remote",
+                "minSalary", "userEmail", "resumePath"]
+
+# CLI-style spellings accepted in hand-written files
+FIELD_ALIASES = {
+    "auto_apply": "autoApply",
+    "min_salary": "minSalary",
+    "email": "userEmail",
+    "resume": "resumePath",
+}
+
+DEFAULT_PLATFORMS = ["linkedin", "indeed"]
+
+
+def detect_format(path, explicit=None):
+    """Format from an explicit choice or the file extension"""
+    if explicit:
+        return explicit
+    suffix = Path(path).suffix.lower().lstrip(".") if path else ""
+    if suffix == "yml":
+        return "yaml"
+    if suffix in FORMATS:
+        return suffix
+    raise ValueError(f"Cannot tell the format of '{path}'; use --format {'/'.join(FORMATS)}")
+
+
+def _yaml():
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("YAML watch files need PyYAML: pip install pyyaml")
+    return yaml
+
+
+def _as_bool(value, default):
+    if value is None or value == "":
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y", "on")
+    return bool(value)
+
+
+def _as_int(value):
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def normalize_watch(raw):
+    """Canonical watch dict from a file row or a backend watch item.
+
+    Backend items keep minSalary/remote under `filters`; files keep them flat.
+    Defaults match what the backend fills in for a new watch.
+    """
+    data = {FIELD_ALIASES.get(key, key): value for key, value in raw.items()}
+    filters = data.get("filters") or {}
+
+    platforms = data.get("platforms") or DEFAULT_PLATFORMS
+    if isinstance(platforms, str):
+        platforms = platforms.replace(",", ";").split(";")
+    platforms = [p.strip().lower() for p in platforms if p.strip()]
+
+    watch = {
+        "keywords": (data.get("keywords") or "").strip(),
+        "location": (data.get("location") or "").strip(),
+        "platforms": platforms,
+        "autoApply": _as_bool(data.get("autoApply"), True),
+        "remote": _as_bool(data.get("remote", filters.get("remote")), False),
+        "minSalary": _as_int(data.get("minSalary", filters.get("minSalary"))),
+    }
+    for field in ("userEmail", "resumePath"):
+        if data.get(field):
+            watch[field] = data[field]
+    if "id" in data:
+        watch["id"] = data["id"]
+    return watch
+
+
+def watch_key(watch):
+    """Identity of a watch for diffing; ignores IDs, timestamps and field order.
+
+    Email and resume path are left out because the backend does not store
+    them, so they would otherwise show up as a change on every sync.
+    """
+    return (
+        normalize_text(watch["keywords"]),
+        normalize_text(watch["location"]),
+        tuple(sorted(set(watch["platforms"]))),
+        watch["autoApply"],
+        watch["remote"],
+        watch["minSalary"],
+    )
+
+
+def load_watches(path, fmt=None):
+    """Read a watch file into a list of normalized watches"""
+    fmt = detect_format(path, fmt)
+    with open(path, newline="" if fmt == "csv" else None) as f:
+        if fmt == "csv":
+            rows = list(csv.DictReader(f))
+        elif fmt == "yaml":
+            rows = _yaml().safe_load(f) or []
+        else:
+            rows = json.load(f)
+
+    # Accept a bare list or an export-style {"watches": [...]} document
+    if isinstance(rows, dict):
+        rows = rows.get("watches", [])
+    watches = []
+    for number, row in enumerate(rows, 1):
+        watch = normalize_watch(row)
+        watch.pop("id", None)
+        if not watch["keywords"] or not watch["location"]:
+            raise ValueError(f"Watch #{number} is missing keywords or location")
+        watches.append(watch)
+    return watches
+
+
+def watch_rows(watches):
+    """Watches (backend items or normalized) as importable rows in export field order"""
+    return [
+        {field: watch[field] for field in WATCH_FIELDS if field in watch}
+        for watch in map(normalize_watch, watches)
+    ]
+
+
+def dump_watches(watches, stream, fmt="json"):
+    """Write watches (backend items or normalized) in an importable form"""
+    rows = watch_rows(watches)
+
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=WATCH_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(dict(
+                row,
+                platforms=";".join(row["platforms"]),
+                autoApply=str(row["autoApply"]).lower(),
+                remote=str(row["remote"]).lower(),
+            ))
+    elif fmt == "yaml":
+        _yaml().safe_dump({"watches": rows}, stream, sort_keys=False, allow_unicode=True)
+    else:
+        json.dump({"watches": rows}, stream, indent=2)
+        stream.write("\n")
+
+
+def diff_watches(desired, current):
+    """Work out the minimal changes that turn `current` into `desired`.
+
+    Returns (to_add, to_remove): watches to create and backend items to
+    delete. Duplicates are matched one-for-one, so a watch listed twice in
+    the file is kept twice.
+    """
+    existing = defaultdict(list)
+    for item in current:
+        existing[watch_key(normalize_watch(item))].append(item)
+
+    to_add = []
+    for watch in desired:
+        matches = existing.get(watch_key(watch))
+        if matches:
+            matches.pop()
+        else:
+            to_add.append(watch)
+    to_remove = [item for items in existing.values() for item in items]
+    return to_add, to_remove
+
+
+async def sync_concurrently(client, to_add, to_remove, concurrency=8, on_done=None):
+    """Create and delete watches one request each, `concurrency` at a time.
+
+    `on_done(action, watch, error)` fires as each request completes.
+    Returns the number of failed requests.
+    """
+    import asyncio
+    from request_pool import RequestPool
+
+    async def run(pool, action, watch):
+        if action == "add":
+            call = partial(client.post, "/api/monitor/watch", json=watch)
+        else:
+            call = partial(client.delete, f"/api/monitor/watch/{watch['id']}")
+        try:
+            response = await pool.call(call)
+            error = None if response.status_code == 200 else f"HTTP {response.status_code}"
+        except Exception as e:
+            error = str(e)
+        if on_done:
+            on_done(action, watch, error)
+        return error
+
+    requests = [("remove", w) for w in to_remove] + [("add", w) for w in to_add]
+    async with RequestPool(concurrency) as pool:
+        errors = await asyncio.gather(*(run(pool, action, watch) for action, watch in requests))
+    return sum(1 for error in errors if error)
+
+
+def sync_watches(client, to_add, to_remove, batch_size=100, concurrency=8, on_done=None):
+    """Push a diff to the backend; returns the number of failed watches.
+
+    Uses the batch endpoint so the backend rewrites its watch list once per
+    batch, and falls back to concurrent single requests on backends that
+    predate it.
+    """
+    import asyncio
+
+    removes = [("remove", watch) for watch in to_remove]
+    adds = [("add", watch) for watch in to_add]
+    failed = 0
+    for index, batch in enumerate(chunked(removes + adds, batch_size)):
+        body = {
+            "add": [watch for action, watch in batch if action == "add"],
+            "remove": [watch["id"] for action, watch in batch if action == "remove"],
+        }
+        try:
+            response = client.post("/api/monitor/watch/batch", json=body)
+        except Exception as e:
+            response, error = None, str(e)
+        if response is not None and response.status_code == 404 and index == 0:
+            return asyncio.run(
+                sync_concurrently(client, to_add, to_remove, concurrency, on_done)
+            )
+        if response is not None:
+            error = None if response.status_code == 200 else f"HTTP {response.status_code}"
+        if error:
+            failed += len(batch)
+        if on_done:
+            for action, watch in batch:
+                on_done(action, watch, error)
+    return failed